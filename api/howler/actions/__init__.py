@@ -1,14 +1,16 @@
 import importlib
 import os
 import re
+import threading
 from pathlib import Path
 from types import ModuleType
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from howler.common.loader import datastore
 from howler.common.logging import get_logger
 from howler.odm.models.user import User
 from howler.plugins import get_plugins
+from howler.services import comms_service
 
 logger = get_logger(__file__)
 
@@ -17,6 +19,14 @@ PLUGIN_PATH = Path(os.environ.get("HWL_PLUGIN_DIRECTORY", "/etc/howler/plugins")
 # Roles that grant advanced hit limits
 ADVANCED_ROLES = {"automation_advanced", "actionrunner_advanced", "admin"}
 
+# Operations not listed in the specifications, and so not available in the UI
+HIDDEN_OPERATIONS = {"example_plugin"}
+
+# The operation modules by id and their sanitized specifications, loaded once per worker on first use
+_registry_lock = threading.Lock()
+_operations: dict[str, ModuleType] | None = None
+_specifications: list[dict[str, Any]] | None = None
+
 
 def __sanitize_specification(spec: dict[str, Any]) -> dict[str, Any]:
     """Adapt the specification for use in the UI
@@ -76,31 +86,74 @@ def __sanitize_report(report: list[dict[str, Any]]) -> list[dict[str, Any]]:
     return sanitized
 
 
+def _load_operations() -> dict[str, ModuleType]:
+    """Import every builtin and plugin operation, keyed by operation ID. Builtin operations take precedence."""
+    operations: dict[str, ModuleType] = {}
+
+    for module in sorted(Path(__file__).parent.glob("*.py")):
+        if module.name == "__init__.py":
+            continue
+
+        try:
+            operations[module.stem] = importlib.import_module(f"howler.actions.{module.stem}")
+        except Exception:  # pragma: no cover
+            logger.exception("Error when initializing %s", module)
+
+    for plugin in get_plugins():
+        if not plugin.modules.operations:
+            continue
+
+        for operation in plugin.modules.operations:
+            operations.setdefault(operation.OPERATION_ID, operation)
+
+    return operations
+
+
+def _get_operations() -> dict[str, ModuleType]:
+    """Return the operation registry, building it on first use."""
+    global _operations
+
+    if _operations is None:
+        with _registry_lock:
+            if _operations is None:
+                _operations = _load_operations()
+
+    return _operations
+
+
 def _get_operation(operation_id: str) -> ModuleType | None:
     """Find and return an operation module by ID."""
-    operation = None
-    try:
-        operation = importlib.import_module(f"howler.actions.{operation_id}")
-    except ImportError:
-        pass
+    return _get_operations().get(operation_id)
 
-    if not operation:
-        for plugin in get_plugins():
-            if not plugin.modules.operations:
-                continue
 
-            operation = next(
-                (operation for operation in plugin.modules.operations if operation.OPERATION_ID == operation_id), None
-            )
+def progress_reporter(request_id: Optional[str]) -> Callable[[int, int, int], None] | None:
+    """Build a callback forwarding the progress of an action to the websocket clients tracking its request id.
+
+    Args:
+        request_id (str, None): The id provided by the user when executing the action
+
+    Returns:
+        Callable[[int, int, int], None] | None: A callback taking the processed, total and conflicting hit counts, or
+            None if no request id was provided
+    """
+    if request_id is None:
+        return None
 
-            if operation:
-                break
+    def report(processed: int, total: int, conflicts: int = 0):
+        comms_service.emit(
+            "action",
+            {"request_id": request_id, "processed": processed, "total": total, "conflicts": conflicts},
+        )
 
-    return operation
+    return report
 
 
 def check_hit_limit(
-    query: str, user: User, max_hits_basic: int | None, max_hits_advanced: int | None
+    query: str,
+    user: User,
+    max_hits_basic: int | None,
+    max_hits_advanced: int | None,
+    hit_count: int | None = None,
 ) -> dict[str, Any] | None:
     """Check if the user exceeds hit count limits. Returns error dict if exceeded, None otherwise.
 
@@ -109,6 +162,8 @@ def check_hit_limit(
         user: The user executing the action.
         max_hits_basic: Maximum hits allowed for basic users (None for no limit).
         max_hits_advanced: Maximum hits allowed for advanced users (None for no limit).
+        hit_count: The number of hits matching the query, if already known. Otherwise the hits are counted, stopping
+            once the limit is exceeded.
 
     Returns:
         Error dict if limit exceeded, None otherwise.
@@ -116,26 +171,36 @@ def check_hit_limit(
     is_advanced = bool(ADVANCED_ROLES & set(user["type"]))
     limit = max_hits_advanced if is_advanced else max_hits_basic
 
-    if limit is not None:
-        hit_count = datastore().hit.search(query, rows=0)["total"]
+    if limit is None:
+        return None
+
+    at_least = ""
+    if hit_count is None:
+        hit_count = datastore().hit.search(query, rows=0, track_total_hits=limit + 1)["total"]
         if hit_count > limit:
-            return {
-                "query": query,
-                "outcome": "error",
-                "title": "Hit limit exceeded",
-                "message": (
-                    f"This action affects {hit_count} hits, but you can only process {limit} at a time. "
-                    "Contact an administrator for bulk operations."
-                ),
-            }
+            at_least = "at least "
+
+    if hit_count > limit:
+        return {
+            "query": query,
+            "outcome": "error",
+            "title": "Hit limit exceeded",
+            "message": (
+                f"This action affects {at_least}{hit_count} hits, but you can only process {limit} at a time. "
+                "Contact an administrator for bulk operations."
+            ),
+        }
+
     return None
 
 
-def _check_hit_limit(operation: ModuleType, query: str, user: User) -> dict[str, Any] | None:
+def _check_hit_limit(
+    operation: ModuleType, query: str, user: User, hit_count: int | None = None
+) -> dict[str, Any] | None:
     """Central hit limit check using raw query. Skipped if operation sets SKIP_CENTRAL_LIMIT."""
     max_hits_basic = getattr(operation, "MAX_HITS_BASIC", None)
     max_hits_advanced = getattr(operation, "MAX_HITS_ADVANCED", None)
-    return check_hit_limit(query, user, max_hits_basic, max_hits_advanced)
+    return check_hit_limit(query, user, max_hits_basic, max_hits_advanced, hit_count=hit_count)
 
 
 def execute(
@@ -143,6 +208,7 @@ def execute(
     query: str,
     user: User | None,
     request_id: Optional[str] = None,
+    hit_count: Optional[int] = None,
     **kwargs,
 ) -> list[dict[str, Any]]:
     """Execute a specification
@@ -152,6 +218,8 @@ def execute(
         query (str): The query to run this action on
         user (dict[str, Any]): The user running this action
         request_id (str, None): A user-provided ID, can be used to track the progress of their excecution via websockets
+        hit_count (int, None): The number of hits matching the query, if the caller already counted them. Used for the
+            hit limit check instead of counting them again.
 
     Returns:
         list[dict[str, Any]]: A report on the execution
@@ -198,7 +266,7 @@ def execute(
 
     # Skip central limit check if operation handles it locally with transformed query
     if not getattr(operation, "SKIP_CENTRAL_LIMIT", False):
-        limit_error = _check_hit_limit(operation, query, user)
+        limit_error = _check_hit_limit(operation, query, user, hit_count=hit_count)
         if limit_error:
             return [limit_error]
 
@@ -213,26 +281,19 @@ def specifications() -> list[dict[str, Any]]:
     Returns:
         list[dict[str, Any]]: A list of specifications
     """
-    specifications = []
-
-    for module in (
-        _file
-        for _file in Path(__file__).parent.iterdir()
-        if _file.suffix == ".py" and _file.name not in ["__init__.py", "example_plugin.py"]
-    ):
-        try:
-            operation = importlib.import_module(f"howler.actions.{module.stem}")
-
-            specifications.append(__sanitize_specification(operation.specification()))
+    global _specifications
 
-        except Exception:  # pragma: no cover
-            logger.exception("Error when initializing %s", module)
+    if _specifications is None:
+        specifications = []
+        for operation_id, operation in _get_operations().items():
+            if operation_id in HIDDEN_OPERATIONS:
+                continue
 
-    for plugin in get_plugins():
-        if not plugin.modules.operations:
-            continue
+            try:
+                specifications.append(__sanitize_specification(operation.specification()))
+            except Exception:  # pragma: no cover
+                logger.exception("Error when initializing %s", operation_id)
 
-        for operation in plugin.modules.operations:
-            specifications.append(__sanitize_specification(operation.specification()))
+        _specifications = specifications
 
-    return specifications
+    return list(_specifications)
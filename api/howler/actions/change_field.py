@@ -1,3 +1,6 @@
+from typing import Optional
+
+from howler.actions import progress_reporter
 from howler.common.loader import datastore
 from howler.datastore.operations import OdmHelper
 from howler.odm.models.action import VALID_TRIGGERS
@@ -8,13 +11,14 @@ hit_helper = OdmHelper(Hit)
 OPERATION_ID = "change_field"
 
 
-def execute(query: str, field: str, value: str, **kwargs):
+def execute(query: str, field: str, value: str, request_id: Optional[str] = None, **kwargs):
     """Change one of the fields of a hit
 
     Args:
         query (str): The query to run this action on
         field (str): The field to update.
         value (str): The value to set it to. Must be a string.
+        request_id (str): The id of this automation run. Used to track the progress via websockets.
     """
     if field not in Hit.flat_fields():
         return [
@@ -32,6 +36,7 @@ def execute(query: str, field: str, value: str, **kwargs):
         datastore().hit.update_by_query(
             query,
             [hit_helper.update(field, value)],
+            progress_callback=progress_reporter(request_id),
         )
 
         report.append(
@@ -1,6 +1,7 @@
 from typing import Optional
 
 import howler.helper.hit as hit_helper
+from howler.actions import progress_reporter
 from howler.common.loader import datastore
 from howler.datastore.operations import OdmHelper
 from howler.odm.models.action import VALID_TRIGGERS
@@ -29,6 +30,7 @@ def execute(
     assessment: Optional[str] = None,
     rationale: Optional[str] = None,
     user: Optional[User] = None,
+    request_id: Optional[str] = None,
     **kwargs,
 ):
     """Demote a hit.
@@ -38,6 +40,7 @@ def execute(
         escalation (str, optional): The escalation to demote to. Defaults to "hit".
         assessment (str, optional): The assessment to apply if demoting to miss. Required if escalation is "miss".
         rationale (str, optional): The optional rationale to apply if demoting to miss.
+        request_id (str): The id of this automation run. Used to track the progress via websockets.
     """
     if escalation not in ESCALATIONS:
         return [
@@ -68,6 +71,8 @@ def execute(
             }
         )
 
+    progress_callback = progress_reporter(request_id)
+
     try:
         if escalation in [Escalation.HIT, Escalation.ALERT]:
             ds.hit.update_by_query(
@@ -78,6 +83,7 @@ def execute(
                     odm_helper.update("howler.rationale", None),
                     odm_helper.update("howler.triaged", None),
                 ],
+                progress_callback=progress_callback,
             )
         else:
             if not assessment:
@@ -101,6 +107,7 @@ def execute(
                     ),
                     odm_helper.update("howler.status", Status.RESOLVED),
                 ],
+                progress_callback=progress_callback,
             )
 
         report.append(
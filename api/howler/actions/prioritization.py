@@ -1,3 +1,6 @@
+from typing import Optional
+
+from howler.actions import progress_reporter
 from howler.common.loader import datastore
 from howler.datastore.operations import OdmHelper
 from howler.odm.models.action import VALID_TRIGGERS
@@ -12,13 +15,20 @@ MAX_HITS_ADVANCED = 1000
 VALID_FIELDS = ["reliability", "severity", "volume", "confidence", "score"]
 
 
-def execute(query: str, field: str = "score", value: str | float = "0.0", **kwargs):
+def execute(
+    query: str,
+    field: str = "score",
+    value: str | float = "0.0",
+    request_id: Optional[str] = None,
+    **kwargs,
+):
     """Change one of the priorization fields of a hit
 
     Args:
         query (str): The query to run this action on
         field (str, optional): The field to update. Defaults to "score".
         value (str, optional): The value to set it to. Must be a float in string format. Defaults to "0.0".
+        request_id (str): The id of this automation run. Used to track the progress via websockets.
     """
     if field not in VALID_FIELDS:
         return [
@@ -41,6 +51,7 @@ def execute(query: str, field: str = "score", value: str | float = "0.0", **kwar
         datastore().hit.update_by_query(
             query,
             [hit_helper.update(f"howler.{field}", value)],
+            progress_callback=progress_reporter(request_id),
         )
 
         report.append(
@@ -1,6 +1,7 @@
 from typing import Optional
 
 import howler.helper.hit as hit_helper
+from howler.actions import progress_reporter
 from howler.common.loader import datastore
 from howler.datastore.operations import OdmHelper
 from howler.odm.models.action import VALID_TRIGGERS
@@ -26,6 +27,7 @@ def execute(
     escalation: Escalation = Escalation.ALERT,
     assessment: Optional[str] = None,
     rationale: Optional[str] = None,
+    request_id: Optional[str] = None,
     **kwargs,
 ):
     """Promote a hit.
@@ -35,6 +37,7 @@ def execute(
         escalation (str, optional): The escalation to promote to. Defaults to "alert".
         assessment (str, optional): Required if escalation is evidence, assessment to apply.
         rationale (str, optional): The optional rationale to apply if promoting to evidence.
+        request_id (str): The id of this automation run. Used to track the progress via websockets.
     """
     if escalation not in ESCALATIONS:
         return [
@@ -65,6 +68,8 @@ def execute(
             }
         )
 
+    progress_callback = progress_reporter(request_id)
+
     try:
         if escalation in [Escalation.HIT, Escalation.ALERT]:
             ds.hit.update_by_query(
@@ -75,6 +80,7 @@ def execute(
                     odm_helper.update("howler.rationale", None),
                     odm_helper.update("howler.triaged", None),
                 ],
+                progress_callback=progress_callback,
             )
         else:
             if not assessment:
@@ -88,7 +94,9 @@ def execute(
                 )
                 return report
 
-            ds.hit.update_by_query(query, hit_helper.assess_hit(assessment, rationale))
+            ds.hit.update_by_query(
+                query, hit_helper.assess_hit(assessment, rationale), progress_callback=progress_callback
+            )
 
         report.append(
             {
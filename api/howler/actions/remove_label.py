@@ -1,5 +1,6 @@
 from typing import Optional
 
+from howler.actions import progress_reporter
 from howler.common.loader import datastore
 from howler.datastore.operations import OdmHelper
 from howler.odm.models.action import VALID_TRIGGERS
@@ -16,13 +17,20 @@ MAX_HITS_ADVANCED = 1000
 CATEGORIES = list(Label.fields().keys())
 
 
-def execute(query: str, category: str = "generic", label: Optional[str] = None, **kwargs):
+def execute(
+    query: str,
+    category: str = "generic",
+    label: Optional[str] = None,
+    request_id: Optional[str] = None,
+    **kwargs,
+):
     """Remove a label from a hit.
 
     Args:
         query (str): The query on which to apply this automation.
         category (str, optional): The category of label from which to remove the label. Defaults to "generic".
         label (str, optional): The label to remove. Defaults to None.
+        request_id (str): The id of this automation run. Used to track the progress via websockets.
     """
     if category not in CATEGORIES:
         return [
@@ -67,6 +75,7 @@ def execute(query: str, category: str = "generic", label: Optional[str] = None,
         ds.hit.update_by_query(
             query,
             [hit_helper.list_remove(f"howler.labels.{category}", label)],
+            progress_callback=progress_reporter(request_id),
         )
 
         report.append(
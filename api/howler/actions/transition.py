@@ -1,7 +1,7 @@
 import inspect
 from typing import Optional, cast
 
-from howler.actions import check_hit_limit
+from howler.actions import check_hit_limit, progress_reporter
 from howler.common.exceptions import InvalidDataException, NotFoundException
 from howler.common.loader import datastore
 from howler.common.logging import get_logger
@@ -15,7 +15,7 @@ from howler.odm.models.howler_data import (
     Vote,
 )
 from howler.odm.models.user import User
-from howler.services import comms_service, hit_service
+from howler.services import hit_service
 from howler.utils.list_utils import flatten_list
 
 OPERATION_ID = "transition"
@@ -151,6 +151,7 @@ def execute(
             }
         )
 
+    progress_callback = progress_reporter(request_id)
     success_ids = set()
     total_processed = 0
     for hit_id in ids:
@@ -168,15 +169,8 @@ def execute(
         total_processed += 1
         if total_processed % 10 == 0:
             log.debug("Transition executed on %s hits", total_processed)
-            if request_id is not None:
-                comms_service.emit(
-                    "automation",
-                    {
-                        "request_id": request_id,
-                        "processed": total_processed,
-                        "total": len(ids),
-                    },
-                )
+            if progress_callback:
+                progress_callback(total_processed, len(ids), 0)
 
     log.info(
         "Transition %s processed on %s hits (%s successful)",
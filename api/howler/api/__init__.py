@@ -1,3 +1,7 @@
+import gzip
+import io
+import json
+import zlib
 from sys import exc_info
 from traceback import format_tb
 from typing import Any, Union
@@ -5,6 +9,7 @@ from typing import Any, Union
 from flask import Blueprint, Response, jsonify, make_response, request
 from flask import session as flsk_session
 from prometheus_client import Counter
+from werkzeug.exceptions import BadRequest, RequestEntityTooLarge
 
 from howler import odm
 from howler.common.loader import APP_NAME
@@ -14,6 +19,8 @@ from howler.utils.constants import TESTING
 from howler.utils.str_utils import safe_str
 
 API_PREFIX = "/api"
+# Upper bound on the size of a compressed request body once inflated, to guard against decompression bombs
+MAX_INFLATED_BODY_SIZE = 256 * 1024 * 1024
 RAW_API_COUNTER = Counter(
     f"{APP_NAME.replace('-', '_')}_http_requests_total",
     "HTTP Requests broken down by method, path, and status",
@@ -29,6 +36,26 @@ def make_subapi_blueprint(name, api_version=1):
     return Blueprint(full_name, full_name, url_prefix="/".join([API_PREFIX, f"v{api_version}", name]))
 
 
+def get_json_body() -> Any:
+    """Parse the JSON body of the current request, inflating it first when it was sent gzip compressed."""
+    if request.content_encoding != "gzip":
+        return request.json
+
+    try:
+        with gzip.GzipFile(fileobj=io.BytesIO(request.get_data())) as body:
+            raw = body.read(MAX_INFLATED_BODY_SIZE + 1)
+    except (OSError, EOFError, zlib.error) as e:
+        raise BadRequest("Request body is not valid gzip data.") from e
+
+    if len(raw) > MAX_INFLATED_BODY_SIZE:
+        raise RequestEntityTooLarge("Inflated request body is too large.")
+
+    try:
+        return json.loads(raw)
+    except ValueError as e:
+        raise BadRequest("No data block provided or data block not in JSON format.") from e
+
+
 def _format_api_error_message(err: Exception) -> str:
     """Format an exception for API responses using the innermost traceback frame only."""
     trace = exc_info()[2]
@@ -61,9 +88,9 @@ def _make_api_response(
         warnings = []
 
     quota_user = flsk_session.pop("quota_user", None)
-    quota_set = flsk_session.pop("quota_set", False)
-    if quota_user and quota_set and not request.path.startswith("/api/v1/clue"):
-        QUOTA_TRACKER.end(quota_user)
+    quota_token = flsk_session.pop("quota_token", None)
+    if quota_user and quota_token and not request.path.startswith("/api/v1/clue"):
+        QUOTA_TRACKER.end(quota_user, quota_token)
 
     if isinstance(err, Exception):  # pragma: no cover
         trace = exc_info()[2]
@@ -205,9 +232,9 @@ def service_unavailable(
 def make_file_response(data, name, size, status_code=200, content_type="application/octet-stream"):
     """Returns file response with arbitrary status code"""
     quota_user = flsk_session.pop("quota_user", None)
-    quota_set = flsk_session.pop("quota_set", False)
-    if quota_user and quota_set:
-        QUOTA_TRACKER.end(quota_user)
+    quota_token = flsk_session.pop("quota_token", None)
+    if quota_user and quota_token:
+        QUOTA_TRACKER.end(quota_user, quota_token)
 
     response = make_response(data, status_code)
     response.headers["Content-Type"] = content_type
@@ -219,9 +246,9 @@ def make_file_response(data, name, size, status_code=200, content_type="applicat
 def stream_file_response(reader, name, size, status_code=200):
     """Returns stream response with arbitrary status code"""
     quota_user = flsk_session.pop("quota_user", None)
-    quota_set = flsk_session.pop("quota_set", False)
-    if quota_user and quota_set:
-        QUOTA_TRACKER.end(quota_user)
+    quota_token = flsk_session.pop("quota_token", None)
+    if quota_user and quota_token:
+        QUOTA_TRACKER.end(quota_user, quota_token)
 
     chunk_size = 65535
 
@@ -245,9 +272,9 @@ def stream_file_response(reader, name, size, status_code=200):
 def make_binary_response(data, size, status_code=200):
     """Returns binary response with arbitrary status code"""
     quota_user = flsk_session.pop("quota_user", None)
-    quota_set = flsk_session.pop("quota_set", False)
-    if quota_user and quota_set:
-        QUOTA_TRACKER.end(quota_user)
+    quota_token = flsk_session.pop("quota_token", None)
+    if quota_user and quota_token:
+        QUOTA_TRACKER.end(quota_user, quota_token)
 
     response = make_response(data, status_code)
     response.headers["Content-Type"] = "application/octet-stream"
@@ -258,9 +285,9 @@ def make_binary_response(data, size, status_code=200):
 def stream_binary_response(reader, status_code=200):
     """Returns streamed binary response with arbitrary status code"""
     quota_user = flsk_session.pop("quota_user", None)
-    quota_set = flsk_session.pop("quota_set", False)
-    if quota_user and quota_set:
-        QUOTA_TRACKER.end(quota_user)
+    quota_token = flsk_session.pop("quota_token", None)
+    if quota_user and quota_token:
+        QUOTA_TRACKER.end(quota_user, quota_token)
 
     chunk_size = 4096
 
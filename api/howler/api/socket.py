@@ -1,6 +1,7 @@
 import base64
 import json
 import os
+import time
 from typing import Any
 
 from flask import Blueprint, request
@@ -13,7 +14,7 @@ from howler.common.logging import get_logger
 from howler.helper.ws import ConnectionClosed, Server
 from howler.security import api_login
 from howler.security.socket import websocket_auth, ws_response
-from howler.utils.socket_utils import check_action
+from howler.utils.socket_utils import check_action, send_heartbeats
 
 HWL_INTERPOD_COMMS_SECRET = os.getenv("HWL_INTERPOD_COMMS_SECRET", "secret")
 
@@ -115,8 +116,15 @@ def connect(ws: Server, *args: Any, ws_id: str, **kwargs):  # noqa: C901
         comms_service.on("action", send_action)
         comms_service.on("cases", send_case)
         comms_service.on("viewers_update", send_viewers_update)
+        next_heartbeat = time.monotonic() + viewer_service.VIEWER_HEARTBEAT_INTERVAL
         while ws.connected:
             data = ws.receive(10)
+
+            if time.monotonic() >= next_heartbeat:
+                # Viewers are dropped once their heartbeats stop, e.g. when the connection dies without a goodbye
+                send_heartbeats(outstanding_actions, **kwargs)
+                next_heartbeat = time.monotonic() + viewer_service.VIEWER_HEARTBEAT_INTERVAL
+
             if data:
                 obj = json.loads(data)
                 logger.debug("%s: Received message: keys=%s", ws_id, list(obj.keys()))
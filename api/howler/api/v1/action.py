@@ -97,6 +97,8 @@ def add_action(user: User, **kwargs) -> Response:
     except HowlerException as e:
         return bad_request(err=str(e))
 
+    action_service.invalidate_action_cache(action_obj.action_id)
+
     return created(action_obj)
 
 
@@ -170,6 +172,8 @@ def update_action(id: str, user: User, **kwargs) -> Response:
     except HowlerException as e:
         return bad_request(err=str(e))
 
+    action_service.invalidate_action_cache(action_obj.action_id)
+
     return ok(action_obj)
 
 
@@ -206,6 +210,7 @@ def delete_action(id: str, user: User, **kwargs) -> Response:
 
     try:
         ds.action.delete(id, refresh=refresh)
+        action_service.invalidate_action_cache(id)
 
         return no_content()
     except HowlerException as e:
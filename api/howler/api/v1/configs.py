@@ -3,7 +3,7 @@ from typing import cast
 from flask import request
 
 import howler.services.config_service as config_service
-from howler.api import make_subapi_blueprint, ok
+from howler.api import make_subapi_blueprint, not_modified, ok
 from howler.common.swagger import generate_swagger_docs
 from howler.odm.models.user import User
 from howler.security.utils import get_disco_url
@@ -18,6 +18,8 @@ config_api._doc = "Read configuration data about the system"  # type: ignore
 def configs(**kwargs):
     """Return all of the configuration information about the deployment.
 
+    The response carries an ETag. Sending it back in an If-None-Match header returns 304 while it is still current.
+
     Variables:
     None
 
@@ -50,9 +52,17 @@ def configs(**kwargs):
     }
 
     """
-    return ok(
-        config_service.get_configuration(
-            user=cast(User | None, kwargs.get("user", None)),
-            discovery_url=get_disco_url(request.environ.get("HTTP_REFERER")),
-        )
+    user = cast(User | None, kwargs.get("user", None))
+    configuration = config_service.get_configuration(
+        user=user,
+        discovery_url=get_disco_url(request.environ.get("HTTP_REFERER")),
     )
+
+    etag = config_service.get_configuration_etag(user, configuration)
+    response = not_modified() if request.if_none_match.contains_weak(etag) else ok(configuration)
+
+    response.set_etag(etag)
+    # The configuration depends on the user, and clients should always revalidate it
+    response.headers["Cache-Control"] = "private, no-cache"
+
+    return response
@@ -10,6 +10,7 @@ from howler.api import (
     conflict,
     created,
     forbidden,
+    get_json_body,
     internal_error,
     make_subapi_blueprint,
     no_content,
@@ -30,7 +31,14 @@ from howler.odm.models.hit import Hit
 from howler.odm.models.howler_data import Comment, HitOperationType, HitStatusTransition
 from howler.odm.models.user import User
 from howler.security import api_login
-from howler.services import action_service, analytic_service, comms_service, correlation_service, hit_service
+from howler.services import (
+    action_service,
+    analytic_service,
+    comms_service,
+    correlation_service,
+    hit_service,
+    validation_service,
+)
 from howler.utils.constants import DEBUG_FORCE_REFRESH
 from howler.utils.str_utils import sanitize_lucene_query
 
@@ -40,8 +48,6 @@ SUB_API = "hit"
 hit_api = make_subapi_blueprint(SUB_API, api_version=1)
 hit_api._doc = "Manage the different hits in the system"  # type: ignore
 
-FIELDS = Hit.flat_fields()
-
 logger = get_logger(__file__)
 
 hit_helper = OdmHelper(Hit)
@@ -63,8 +69,11 @@ def create_hits(user: User, **kwargs):
     Optional Arguments:
     refresh =>  ('true' | 'false' | 'wait_for') Whether to refresh the datastore before returning.
         'wait_for' will wait for the change to be visible in search.
+    ignore_extra_values =>  Ignore fields that are not part of the hit schema instead of rejecting the hit
+    skip_existing =>  Skip hits whose howler.hash already exists, or is repeated within the request, instead of
+        creating them. Their hashes are listed in "skipped".
 
-    Data Block:
+    Data Block (may be sent gzip compressed, with Content-Encoding: gzip):
     {
         [
             {
@@ -86,6 +95,7 @@ def create_hits(user: User, **kwargs):
                 ...hit
             }
         ],
+        "skipped": ["<hash>"],
         "invalid": [
             {
                 "input": { ...hit },
@@ -98,7 +108,7 @@ def create_hits(user: User, **kwargs):
         ]
     }
     """
-    hits = request.json
+    hits = get_json_body()
 
     refresh = kwargs.get("refresh")
 
@@ -106,20 +116,27 @@ def create_hits(user: User, **kwargs):
         return bad_request(err="No hits were sent.")
 
     response_body: dict[str, list[Any]] = {"valid": [], "invalid": []}
-    odms = []
+    odms: list[Hit] = []
     ignore_extra_values: bool = bool(request.args.get("ignore_extra_values", False, type=lambda v: v.lower() == "true"))
-    logger.debug("ignore_extra_values = %s", ignore_extra_values)
+    skip_existing: bool = bool(request.args.get("skip_existing", False, type=lambda v: v.lower() == "true"))
+    logger.debug("ignore_extra_values = %s, skip_existing = %s", ignore_extra_values, skip_existing)
     warnings = []
-    for hit in hits:
-        try:
-            odm, _warnings = hit_service.convert_hit(hit, unique=True, ignore_extra_values=ignore_extra_values)
-            response_body["valid"].append(odm.as_primitives())
-            odms.append(odm)
+    results = validation_service.convert_records(
+        hits, hit_service.convert_hit, unique=True, ignore_extra_values=ignore_extra_values
+    )
+    for hit, (odm, _warnings, error) in zip(hits, results):
+        if error is not None:
+            logger.warning("%s when saving new hit!", type(error).__name__)
+            logger.warning(error)
+            response_body["invalid"].append({"input": hit, "error": str(error)})
+        else:
+            odms.append(cast(Hit, odm))
             warnings.extend(_warnings)
-        except HowlerException as e:
-            logger.warning("%s when saving new hit!", type(e).__name__)
-            logger.warning(e)
-            response_body["invalid"].append({"input": hit, "error": str(e)})
+
+    if skip_existing:
+        odms, response_body["skipped"] = hit_service.remove_existing_hits(odms)
+
+    response_body["valid"] = [odm.as_primitives() for odm in odms]
 
     if len(response_body["invalid"]) == 0:
         if len(odms) > 0:
@@ -180,12 +197,17 @@ def delete_hits(user: User, **kwargs):
         return forbidden(err="Cannot delete hit, only admin is allowed to delete")
 
     hit_ids = set(hit_ids)
-    non_existing_hit_ids = [hit_id for hit_id in hit_ids if not hit_service.exists(hit_id)]
+    existing_hit_ids = datastore().hit.get_document_indexes(list(hit_ids))
+    non_existing_hit_ids = [hit_id for hit_id in hit_ids if hit_id not in existing_hit_ids]
 
     if non_existing_hit_ids:
         return not_found(err=f"Hit id(s) {', '.join(non_existing_hit_ids)} do not exist.")
 
-    hit_service.delete_hits(hit_ids, refresh=refresh)
+    results = hit_service.delete_hits(hit_ids, refresh=refresh)
+    failed = {hit_id: result for hit_id, result in results.items() if result != "deleted"}
+
+    if failed:
+        return internal_error(failed, err=f"Hit id(s) {', '.join(failed)} could not be deleted.")
 
     return no_content()
 
@@ -5,8 +5,6 @@ from typing import Any
 from elasticsearch import BadRequestError
 from elasticsearch._sync.client.indices import IndicesClient
 from flask import request
-from sigma.backends.elasticsearch import LuceneBackend
-from sigma.rule import SigmaRule
 from yaml.scanner import ScannerError
 
 from howler.api import bad_request, forbidden, make_subapi_blueprint, ok
@@ -324,6 +322,10 @@ def sigma_search(index, **kwargs):
     if not sigma:
         return bad_request(err="There was no sigma rule.")
 
+    # pySigma is slow to import and only needed here, so it is imported on the first sigma search
+    from sigma.backends.elasticsearch import LuceneBackend
+    from sigma.rule import SigmaRule
+
     try:
         rule = SigmaRule.from_yaml(sigma)
     except ScannerError as e:
@@ -19,7 +19,7 @@ from howler.odm.models.event import Event
 from howler.odm.models.hit import Hit
 from howler.odm.models.user import User
 from howler.security import api_login
-from howler.services import correlation_service, event_service, hit_service
+from howler.services import correlation_service, event_service, hit_service, validation_service
 from howler.utils.dict_utils import flatten
 
 MAX_COMMENT_LEN = 5000
@@ -28,8 +28,6 @@ SUB_API = "ingest"
 ingest_api = make_subapi_blueprint(SUB_API, api_version=2)
 ingest_api._doc = "Manage the different records across indexes"  # type: ignore
 
-FIELDS = Hit.flat_fields()
-
 logger = get_logger(__file__)
 
 hit_helper = OdmHelper(Hit)
@@ -76,28 +74,26 @@ def create(index: str, user: User, *, refresh: Literal["true", "false", "wait_fo
         return bad_request(err="JSON Payload must be a list of records.")
     ignore_extra_values = request.args.get("ignore_extra_values", False, type=lambda v: v.lower() == "true")
 
-    odms: list = []
+    odms: list[Hit | Event] = []
     warnings = []
-    for i, record in enumerate(records):
-        try:
-            odm: Hit | Event
-            if index == "event":
-                odm, _warnings = event_service.convert_event(
-                    record, unique=True, ignore_extra_values=ignore_extra_values
-                )
-            else:
-                odm, _warnings = hit_service.convert_hit(record, unique=True, ignore_extra_values=ignore_extra_values)
-
-            odms.append(odm)
-            warnings.extend(_warnings)
-        except HowlerException as e:
-            logger.exception("Ingestion failed.")
-            return bad_request(err=f"Ingestion failure on record at index {i}: {e}")
+    results = validation_service.convert_records(
+        records,
+        event_service.convert_event if index == "event" else hit_service.convert_hit,
+        unique=True,
+        ignore_extra_values=ignore_extra_values,
+    )
+    for i, (odm, _warnings, error) in enumerate(results):
+        if error is not None:
+            logger.error("Ingestion failed: %s", error)
+            return bad_request(err=f"Ingestion failure on record at index {i}: {error}")
+
+        odms.append(cast(Hit | Event, odm))
+        warnings.extend(_warnings)
 
     if index == "event":
-        event_service.create_events(odms, user.uname, overwrite=False, refresh=refresh)
+        event_service.create_events(cast(list[Event], odms), user.uname, overwrite=False, refresh=refresh)
     else:
-        hit_service.create_hits(odms, user.uname, overwrite=False, refresh=refresh)
+        hit_service.create_hits(cast(list[Hit], odms), user.uname, overwrite=False, refresh=refresh)
 
     # Enqueue newly created hit IDs for the correlation worker.
     ids = [odm.howler.id for odm in odms]
@@ -8,6 +8,7 @@ from elasticsearch._sync.client.indices import IndicesClient
 from flask import request
 
 from howler.api import bad_request, forbidden, internal_error, make_subapi_blueprint, ok
+from howler.common.exceptions import ForbiddenException, InvalidDataException
 from howler.common.loader import datastore
 from howler.common.logging import get_logger
 from howler.common.logging.audit import audit
@@ -17,7 +18,7 @@ from howler.helper.search import get_collection, has_access_control
 from howler.odm.models.user import User
 from howler.security import api_login
 from howler.services import hit_service, lucene_service, search_service
-from howler.services.search_service import SensitiveUserFieldsException
+from howler.services.search_service import SENSITIVE_USER_FIELDS, SensitiveUserFieldsException
 from howler.utils.net_utils import generate_params
 
 SUB_API = "search"
@@ -327,3 +328,114 @@ def facet(indexes: str, **kwargs):
         query = params.get("query", "id:*")
         logger.exception(f"SearchException on query {query}")
         return bad_request(err=f"SearchException on query {query}: {str(e)}")
+
+
+def _histogram_defaults(field_type: str) -> dict[str, Any]:
+    """Default start, end and gap of a histogram, based on the type of the field."""
+    if field_type in ("integer", "long"):
+        return {"start": 0, "end": 2000, "gap": 100}
+
+    storage = datastore()
+    return {
+        "start": f"{storage.ds.now}-1{storage.ds.day}",
+        "end": f"{storage.ds.now}",
+        "gap": f"+1{storage.ds.hour}",
+    }
+
+
+def _prepare_aggregations(index: str, fields: dict[str, Any], aggs: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """Validate the fields of each aggregation spec, and fill in the default range of histograms."""
+    prepared: dict[str, dict[str, Any]] = {}
+    for name, spec in aggs.items():
+        if not isinstance(spec, dict):
+            raise InvalidDataException(f"Aggregation '{name}' must be an object.")
+
+        field = spec.get("field")
+        if not isinstance(field, str) or not field:
+            raise InvalidDataException(f"Aggregation '{name}' must have the name of a field.")
+
+        field_info = fields.get(field, None)
+        if field_info is None:
+            raise InvalidDataException(f"Field '{field}' is not a valid field in index: {index}")
+
+        if index == "user" and any(sensitive_field in field for sensitive_field in SENSITIVE_USER_FIELDS):
+            raise ForbiddenException("Invalid fields to aggregate on.")
+
+        if spec.get("type") == "stats" and field_info["type"] not in ["integer", "float", "long"]:
+            raise InvalidDataException(f"Field '{field}' is not a numeric field.")
+
+        if spec.get("type") == "histogram":
+            if field_info["type"] not in ("integer", "long", "date"):
+                raise InvalidDataException(
+                    f"Field '{field}' is of type '{field_info['type']}'. Only 'integer' or 'date' are acceptable."
+                )
+
+            spec = {**_histogram_defaults(field_info["type"]), **spec}
+
+        prepared[name] = spec
+
+    return prepared
+
+
+@generate_swagger_docs()
+@search_api.route("/aggregate/<index>", methods=["POST"])
+@api_login(required_priv=["R"])
+def aggregate(index: str, user: User, **kwargs):
+    """Run several facet, terms, histogram and stats aggregations over the same query in a single request.
+
+    Variables:
+    index       =>   Index to search in (hit, user,...)
+
+    Data Block:
+    {
+        "query": "id:*",        # Query to search for
+        "filters": ['fq'],      # Additional query to limit to output
+        "timeout": 1000,        # Maximum execution time (ms)
+        "aggs": {               # The aggregations to run, keyed by the name used in the result
+            "status": {"type": "facet", "field": "howler.status", "rows": 10, "mincount": 1},
+            "analytics": {"type": "terms", "field": "howler.analytic", "sort": "_key asc"},
+            "created": {"type": "histogram", "field": "event.created", "start": "now-1d", "end": "now", "gap": "1h"},
+            "score": {"type": "stats", "field": "howler.score"}
+        }
+    }
+
+    Result Example:
+    {
+        "status": {"open": 2, "resolved": 19},
+        "analytics": [{"value": "Example", "count": 4}],
+        "created": {"2024-01-01T00:00:00.000Z": 3, ...},
+        "score": {"count": 1, "min": 1, "max": 1, "avg": 1, "sum": 1}
+    }
+    """
+    collection = get_collection(index, user)
+    if collection is None:
+        return bad_request(err=f"Not a valid index to search in: {index}")
+
+    req_data = request.json or {}
+    aggs = req_data.get("aggs")
+    if not aggs or not isinstance(aggs, dict):
+        return bad_request(err="There were no aggregations to run.")
+
+    try:
+        aggs = _prepare_aggregations(index, collection().fields(), aggs)
+    except ForbiddenException as e:
+        return forbidden(err=e.message)
+    except InvalidDataException as e:
+        return bad_request(err=e.message)
+
+    query = req_data.get("query") or "id:*"
+    _audit_request(user, aggregate, index=index, query=query)
+
+    try:
+        return ok(
+            collection().aggregate(
+                query,
+                filters=req_data.get("filters"),
+                aggs=aggs,
+                access_control=user["access_control"] if has_access_control(index) else None,
+                timeout=req_data.get("timeout"),
+            )
+        )
+    except (SearchException, BadRequestError) as e:
+        logger.exception(f"SearchException on query {query}")
+        return bad_request(err=f"SearchException on query {query}: {str(e)}")
@@ -1,7 +1,11 @@
 import os
 import sys
+import time
 from pathlib import Path
 
+# Taken before anything else is imported, so that the logged startup time includes loading the API and its plugins
+STARTUP_BEGIN = time.perf_counter()
+
 from dotenv import load_dotenv
 
 from howler.plugins import get_plugins
@@ -53,6 +57,7 @@ from howler.api.v2.fuzzy import fuzzy_api
 from howler.api.v2.ingest import ingest_api
 from howler.api.v2.search import search_api as v2_search_api
 from howler.common.logging import get_logger
+from howler.common.metrics import get_registry, setup_metrics
 from howler.config import (
     DEBUG,
     HWL_UNSECURED_UI,
@@ -99,7 +104,10 @@ if config.core.telemetry.enabled:
 app.url_map.strict_slashes = False
 app.config["JSON_SORT_KEYS"] = False
 
-app.wsgi_app = DispatcherMiddleware(app.wsgi_app, {"/metrics": make_wsgi_app()})  # type: ignore[method-assign]
+setup_metrics(app)
+app.wsgi_app = DispatcherMiddleware(  # type: ignore[method-assign]
+    app.wsgi_app, {"/metrics": make_wsgi_app(get_registry())}
+)
 
 swagger_template = {
     "info": {
@@ -192,17 +200,28 @@ else:
 if HWL_USE_WEBSOCKET_API or DEBUG:
     logger.debug("Enabled Websocket API")
     app.register_blueprint(socket_api)
+else:
+    logger.info("Disabled Websocket API")
+
+
+def start_background_services():
+    """Start the threads this process needs alongside the API: the redis event watcher and the job system.
 
-    if _should_start_background_services():
+    Threads do not survive a fork, so when gunicorn loads the app before forking its workers
+    (``HWL_DEFER_BACKGROUND_SERVICES``), each worker calls this once it has started instead.
+    """
+    if HWL_USE_WEBSOCKET_API or DEBUG:
         # Start the Redis pubsub watcher so this pod receives events from all pods
         import howler.services.comms_service as comms_service
 
         comms_service.start_watcher()
-else:
-    logger.info("Disabled Websocket API")
 
-if HWL_USE_JOB_SYSTEM and _should_start_background_services():
-    setup_jobs()
+    if HWL_USE_JOB_SYSTEM:
+        setup_jobs()
+
+
+if _should_start_background_services() and os.environ.get("HWL_DEFER_BACKGROUND_SERVICES", "").lower() != "true":
+    start_background_services()
 
 
 # Setup OAuth providers
@@ -248,6 +267,8 @@ if logger.parent:  # pragma: no cover
     for h in logger.parent.handlers:
         wlog.addHandler(h)
 
+logger.info("Howler API loaded in %.2fs", time.perf_counter() - STARTUP_BEGIN)
+
 
 def main():
     """Main application function"""
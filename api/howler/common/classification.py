@@ -1,6 +1,7 @@
 import itertools
 import logging
 from copy import copy
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Dict, KeysView, List, Optional, Set, Tuple, Union, cast
 
 from howler.common.exceptions import (
@@ -23,6 +24,7 @@ class Classification(object):
     INVALID_LVL = 10001
     NULL_CLASSIFICATION = "NULL"
     INVALID_CLASSIFICATION = "INVALID"
+    MEMO_SIZE = 4096
 
     def __init__(self, classification_definition: Dict):
         """Returns the classification class instantiated with the classification_definition
@@ -65,6 +67,13 @@ class Classification(object):
         self._classification_cache = set()
         self._classification_cache_short = set()
 
+        # LRU memo tables for the checks run on every document and search result. Their keys include the engine itself
+        # (copies of an engine share the tables) and its mode flags (see _memo_key), so changing e.g. dynamic_groups on
+        # a live engine never returns a stale answer.
+        self._normalize_memo = lru_cache(maxsize=self.MEMO_SIZE)(Classification._normalize_classification)
+        self._is_accessible_memo = lru_cache(maxsize=self.MEMO_SIZE)(Classification._is_accessible)
+        self._max_classification_memo = lru_cache(maxsize=self.MEMO_SIZE)(Classification._max_classification)
+
         self.enforce = False
         self.dynamic_groups = False
         # dynamic group type is one of: email | group | all
@@ -223,6 +232,10 @@ class Classification(object):
     ############################
     # Private functions
     ############################
+    def _memo_key(self) -> tuple:
+        "The engine settings the memoized checks depend on, beyond their arguments"
+        return (self.enforce, self.invalid_mode, self.dynamic_groups, self.dynamic_groups_type)
+
     @staticmethod
     def _build_combinations(items: Set, separator: str = "/", solitary_display: Optional[Dict] = None) -> Set:
         if solitary_display is None:
@@ -649,7 +662,7 @@ class Classification(object):
         """
         from copy import deepcopy
 
-        out = deepcopy(self.__dict__)
+        out = deepcopy({k: v for k, v in self.__dict__.items() if not k.endswith("_memo")})
         out["levels_map"].pop("INV", None)
         out["levels_map"].pop(str(self.INVALID_LVL), None)
         out["levels_map_stl"].pop("INV", None)
@@ -786,6 +799,9 @@ class Classification(object):
         if not isinstance(c12n, str):
             c12n = c12n.value
 
+        return self._is_accessible_memo(self, user_c12n, c12n, ignore_invalid, self._memo_key())
+
+    def _is_accessible(self, user_c12n: str, c12n: str, ignore_invalid: bool, _memo_key: tuple) -> bool:
         try:
             user_lvl, user_req, user_groups, user_subgroups = self._get_classification_parts(user_c12n)
             lvl, req, groups, subgroups = self._get_classification_parts(c12n)
@@ -909,6 +925,9 @@ class Classification(object):
         if not self.enforce or self.invalid_mode:
             return self.UNRESTRICTED
 
+        return self._max_classification_memo(self, c12n_1, c12n_2, long_format, self._memo_key())
+
+    def _max_classification(self, c12n_1: str | None, c12n_2: str | None, long_format: bool, _memo_key: tuple) -> str:
         # Normalize classifications before comparing them
         if c12n_1 is not None:
             c12n_1 = self.normalize_classification(c12n_1)
@@ -1007,6 +1026,19 @@ class Classification(object):
         if not self.enforce or self.invalid_mode:
             return self.UNRESTRICTED
 
+        return self._normalize_memo(
+            self, c12n, long_format, skip_auto_select, get_dynamic_groups, ignore_unused, self._memo_key()
+        )
+
+    def _normalize_classification(
+        self,
+        c12n: str,
+        long_format: bool,
+        skip_auto_select: bool,
+        get_dynamic_groups: bool,
+        ignore_unused: bool,
+        _memo_key: tuple,
+    ) -> str:
         # Has the classification has already been normalized before?
         if long_format and c12n in self._classification_cache and get_dynamic_groups:
             return c12n
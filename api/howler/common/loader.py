@@ -1,5 +1,7 @@
 import logging
 import os
+import threading
+import time
 from pathlib import Path
 from string import Template
 from typing import TYPE_CHECKING, Optional, Union
@@ -33,40 +35,52 @@ def env_substitute(buffer):
 
 _CLASSIFICATIONS: dict[Union[str, Path], "Classification"] = {}
 
+# How often (in seconds) the default classification.yml is checked for changes. Between checks, the cached engine is
+# returned as is.
+CLASSIFICATION_RELOAD_INTERVAL = 5.0
+_DEFAULT_CLASSIFICATION: Optional[tuple[tuple[str, Optional[int]], "Classification"]] = None
+_DEFAULT_CLASSIFICATION_CHECKED = 0.0
+_CLASSIFICATION_LOCK = threading.Lock()
+
+
+def _default_classification_path(log: logging.Logger) -> Path:
+    "Find the classification.yml file to use when none is specified"
+    root_path = Path("/etc") / APP_NAME.replace("-dev", "").replace("-stg", "") / "conf"
+    yml_config_path = Path(os.environ.get("HWL_CONF_FOLDER", root_path)) / "classification.yml"
+
+    if yml_config_path.is_symlink():
+        log.debug("%s is a symbolic link!", yml_config_path)
+        if str(yml_config_path.readlink()).startswith("..data"):
+            yml_config_path = yml_config_path.parent / yml_config_path.readlink()
+            log.debug(
+                "This symbolic link links to a configmap, handling accordingly. Reading from %s",
+                yml_config_path,
+            )
+        else:
+            yml_config_path = Path(os.path.realpath(yml_config_path.readlink()))
+            log.debug(
+                "Reading from %s",
+                yml_config_path,
+            )
 
-def get_classification(yml_config: Optional[str] = None) -> "Classification":  # noqa: C901
-    "Get the classification from a given classification.yml file, caching results"
-    if yml_config in _CLASSIFICATIONS:
-        return _CLASSIFICATIONS[yml_config]
+    if not yml_config_path.exists():
+        log.warning("%s does not exist!", yml_config_path)
+        yml_config_path = Path("/etc") / APP_NAME.replace("-dev", "") / "classification.yml"
+        log.warning("Checking at %s instead.", yml_config_path)
 
-    log = logging.getLogger(f"{APP_NAME}.common.loader")
+    return yml_config_path
 
-    if not yml_config:
-        root_path = Path("/etc") / APP_NAME.replace("-dev", "").replace("-stg", "") / "conf"
-        yml_config_path = Path(os.environ.get("HWL_CONF_FOLDER", root_path)) / "classification.yml"
-
-        if yml_config_path.is_symlink():
-            log.info("%s is a symbolic link!", yml_config_path)
-            if str(yml_config_path.readlink()).startswith("..data"):
-                yml_config_path = yml_config_path.parent / yml_config_path.readlink()
-                log.info(
-                    "This symbolic link links to a configmap, handling accordingly. Reading from %s",
-                    yml_config_path,
-                )
-            else:
-                yml_config_path = Path(os.path.realpath(yml_config_path.readlink()))
-                log.info(
-                    "Reading from %s",
-                    yml_config_path,
-                )
-
-        if not yml_config_path.exists():
-            log.warning("%s does not exist!", yml_config_path)
-            yml_config_path = Path("/etc") / APP_NAME.replace("-dev", "") / "classification.yml"
-            log.warning("Checking at %s instead.", yml_config_path)
-    else:
-        yml_config_path = Path(yml_config)
 
+def _file_signature(path: Path) -> tuple[str, Optional[int]]:
+    "Identify the current version of a file, following symbolic links (i.e. configmap updates)"
+    try:
+        return os.path.realpath(path), path.stat().st_mtime_ns
+    except OSError:
+        return str(path), None
+
+
+def _load_classification(yml_config_path: Path, log: logging.Logger) -> "Classification":
+    "Build a classification engine from the given classification.yml file, or the default one if it is empty"
     log.debug("Loading classification definition from %s", yml_config_path)
 
     classification_definition = None
@@ -96,10 +110,48 @@ def get_classification(yml_config: Optional[str] = None) -> "Classification":  #
     if not classification_definition:
         raise InvalidDefinition("Could not find any classification definition to load.")
 
-    _classification = Classification(classification_definition)
+    return Classification(classification_definition)
+
+
+def _get_default_classification(log: logging.Logger) -> "Classification":
+    "Get the process-wide classification engine, rebuilding it when the underlying classification.yml changes"
+    global _DEFAULT_CLASSIFICATION, _DEFAULT_CLASSIFICATION_CHECKED
+
+    cached = _DEFAULT_CLASSIFICATION
+    if cached is not None and time.monotonic() - _DEFAULT_CLASSIFICATION_CHECKED < CLASSIFICATION_RELOAD_INTERVAL:
+        return cached[1]
+
+    with _CLASSIFICATION_LOCK:
+        yml_config_path = _default_classification_path(log)
+        signature = _file_signature(yml_config_path)
+
+        if _DEFAULT_CLASSIFICATION is None or _DEFAULT_CLASSIFICATION[0] != signature:
+            if _DEFAULT_CLASSIFICATION is not None:
+                log.info("%s has changed, reloading the classification definition", yml_config_path)
+
+            _DEFAULT_CLASSIFICATION = (signature, _load_classification(yml_config_path, log))
+
+        _DEFAULT_CLASSIFICATION_CHECKED = time.monotonic()
+
+        return _DEFAULT_CLASSIFICATION[1]
+
+
+def get_classification(yml_config: Optional[str] = None) -> "Classification":
+    """Get the classification from a given classification.yml file, caching results.
+
+    Without a yml_config, the default classification.yml is used. Its engine is shared by the whole process, and is
+    only rebuilt when the file changes.
+    """
+    if yml_config in _CLASSIFICATIONS:
+        return _CLASSIFICATIONS[yml_config]
+
+    log = logging.getLogger(f"{APP_NAME}.common.loader")
+
+    if not yml_config:
+        return _get_default_classification(log)
 
-    if yml_config:
-        _CLASSIFICATIONS[yml_config] = _classification
+    _classification = _load_classification(Path(yml_config), log)
+    _CLASSIFICATIONS[yml_config] = _classification
 
     return _classification
 
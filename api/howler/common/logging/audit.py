@@ -1,9 +1,15 @@
+import atexit
 import logging
 import os
+import queue
 import sys
+import threading
+from typing import Any, Optional, Union
 
 from flask import request
+from prometheus_client import Counter, Gauge
 
+from howler.common.loader import APP_NAME
 from howler.common.logging.format import HWL_AUDIT_FORMAT, HWL_DATE_FORMAT, HWL_ISO_DATE_FORMAT, HWL_LOG_FORMAT
 from howler.config import DEBUG, config
 
@@ -79,6 +85,130 @@ AUDIT_LOG.addHandler(ch)
 # End of prepare logger #
 #########################
 
+AUDIT_QUEUE_DEPTH = Gauge(
+    f"{APP_NAME.replace('-', '_')}_audit_queue_depth",
+    "Number of audit records waiting to be written",
+    multiprocess_mode="livesum",
+)
+AUDIT_DROPPED = Counter(
+    f"{APP_NAME.replace('-', '_')}_audit_dropped_total",
+    "Audit records dropped because the audit queue was full",
+)
+
+
+class AuditWriter(object):
+    """Write audit records to the audit logger's handlers from a background thread.
+
+    Records are queued by the request thread and drained in batches, so a slow handler (syslog, network file systems)
+    does not add to API latency. The queue is bounded: once it is full, new records are dropped and counted in
+    AUDIT_DROPPED rather than blocking the request.
+    """
+
+    def __init__(self, logger: logging.Logger, max_size: int = 10000, batch_size: int = 100):
+        self.logger = logger
+        self.max_size = max_size
+        self.batch_size = batch_size
+
+        self._lock = threading.Lock()
+        self._pid: Optional[int] = None
+        self._queue: "queue.Queue[Union[logging.LogRecord, threading.Event, None]]" = queue.Queue(max_size)
+        self._thread: Optional[threading.Thread] = None
+
+    def _ensure_started(self):
+        # The writer thread does not survive a fork, so each worker process starts its own on first use
+        if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+            return
+
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+                return
+
+            if self._pid != os.getpid():
+                self._queue = queue.Queue(self.max_size)
+
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        running = True
+        while running:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for item in batch:
+                if item is None:
+                    running = False
+                elif isinstance(item, threading.Event):
+                    item.set()
+                else:
+                    try:
+                        self.logger.handle(item)
+                    except Exception:  # pragma: no cover
+                        logging.getLogger("howler.api").exception("Failed to write audit record")
+
+            AUDIT_QUEUE_DEPTH.set(self._queue.qsize())
+
+    def submit(self, record: logging.LogRecord):
+        """Queue a record to be written, dropping it if the queue is full."""
+        if self.max_size <= 0:
+            self.logger.handle(record)
+            return
+
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            AUDIT_DROPPED.inc()
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Wait until every record queued before this call has been written.
+
+        Args:
+            timeout (float, optional): How long to wait, in seconds. Defaults to 5.0.
+
+        Returns:
+            bool: Whether the queue was flushed before the timeout expired
+        """
+        if self._thread is None or self._pid != os.getpid() or not self._thread.is_alive():
+            return True
+
+        marker = threading.Event()
+        try:
+            self._queue.put(marker, timeout=timeout)
+        except queue.Full:
+            return False
+
+        return marker.wait(timeout)
+
+    def stop(self, timeout: Optional[float] = 5.0):
+        """Flush outstanding records and stop the writer thread."""
+        if self._thread is None or self._pid != os.getpid() or not self._thread.is_alive():
+            return
+
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+
+        self._thread.join(timeout)
+
+
+AUDIT_WRITER = AuditWriter(AUDIT_LOG, max_size=config.ui.audit_queue_size)
+atexit.register(AUDIT_WRITER.stop)
+
+
+def _emit(level: int, msg: str, args: tuple[Any, ...], extra: Optional[dict[str, Any]] = None):
+    if not AUDIT_LOG.isEnabledFor(level):
+        return
+
+    # The record is built here so its timestamp and thread reflect the request, not the writer
+    AUDIT_WRITER.submit(AUDIT_LOG.makeRecord(AUDIT_LOG.name, level, __file__, 0, msg, args, None, extra=extra))
+
 
 def audit(args, kwargs, logged_in_uname, user, func, impersonator=None):
     """Log audit information for a given function executed by a given user."""
@@ -114,11 +244,10 @@ def audit(args, kwargs, logged_in_uname, user, func, impersonator=None):
     if DEBUG:
         # In debug mode, you'll get an output like:
         # 23/03/20 14:26:56 DEBUG howler.api.audit | goose - search(index='...', query='...')
-        AUDIT_LOG.debug(
+        _emit(
+            logging.DEBUG,
             "%s - %s(%s)",
-            audit_user,
-            func.__name__,
-            ", ".join(params_list),
+            (audit_user, func.__name__, ", ".join(params_list)),
         )
     else:
         # In prod, you'll get an output like:
@@ -133,8 +262,10 @@ def audit(args, kwargs, logged_in_uname, user, func, impersonator=None):
         #     "method": "POST",
         #     "path": "/api/v1/search/hit/"
         # }
-        AUDIT_LOG.info(
+        _emit(
+            logging.INFO,
             "",
+            (),
             extra={
                 "user": audit_user,
                 "function": f"{func.__name__}({', '.join(params_list)})",
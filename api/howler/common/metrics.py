@@ -0,0 +1,117 @@
+"""Prometheus metrics shared across howler, and their exposition.
+
+Every label of these metrics takes its values from a small fixed set (blueprints, endpoints, status codes, datastore
+and redis commands, collections and queues), so their cardinality stays bounded whatever the traffic.
+
+Gunicorn runs the API in several processes, each with its own metric values. When the ``PROMETHEUS_MULTIPROC_DIR``
+environment variable is set, every process writes its values to that directory, and the registry returned by
+get_registry() aggregates them, so a scrape sees the whole pod rather than whichever process answered it. The
+directory must exist and be emptied before the processes start.
+"""
+
+import os
+import time
+from typing import Any, Callable, Optional
+
+from flask import Flask, Response, g, request
+from prometheus_client import CollectorRegistry, Gauge, Histogram, multiprocess
+from prometheus_client.registry import REGISTRY
+
+APP_NAME = os.environ.get("APP_NAME", "howler")
+METRIC_PREFIX = APP_NAME.replace("-", "_")
+
+# Methods outside this set are reported as "other", as clients can send any method name
+HTTP_METHODS = {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"}
+
+# Redis calls are expected to be an order of magnitude faster than API requests and datastore calls
+REDIS_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+BATCH_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+REQUEST_DURATION = Histogram(
+    f"{METRIC_PREFIX}_http_request_duration_seconds",
+    "Time taken to answer HTTP requests, broken down by blueprint, endpoint, method and status",
+    ["blueprint", "endpoint", "method", "status"],
+)
+DATASTORE_DURATION = Histogram(
+    f"{METRIC_PREFIX}_datastore_call_duration_seconds",
+    "Time taken by elasticsearch requests, each retry included separately, broken down by collection and method",
+    ["collection", "method"],
+)
+REDIS_DURATION = Histogram(
+    f"{METRIC_PREFIX}_redis_call_duration_seconds",
+    "Time taken by redis commands, each retry included separately, broken down by command",
+    ["command"],
+    buckets=REDIS_BUCKETS,
+)
+QUEUE_DEPTH = Gauge(
+    f"{METRIC_PREFIX}_queue_depth",
+    "Number of items waiting in a work queue, as last seen by its consumers",
+    ["queue"],
+    multiprocess_mode="livemostrecent",
+)
+BATCH_DURATION = Histogram(
+    f"{METRIC_PREFIX}_queue_batch_duration_seconds",
+    "Time taken by queue consumers to process a batch of items",
+    ["queue"],
+    buckets=BATCH_BUCKETS,
+)
+
+
+def is_multiprocess() -> bool:
+    "Whether metric values are shared between processes through PROMETHEUS_MULTIPROC_DIR"
+    return bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+
+def get_registry() -> CollectorRegistry:
+    """Return the registry to expose, aggregating the values of every process in multiprocess mode"""
+    if not is_multiprocess():
+        return REGISTRY
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def mark_process_dead(pid: int):
+    """Drop the gauge values of a process that exited, in multiprocess mode"""
+    if is_multiprocess():
+        multiprocess.mark_process_dead(pid)
+
+
+def datastore_method(func: Callable[..., Any]) -> str:
+    """Name an elasticsearch client method, such as search or indices.exists"""
+    owner, _, name = getattr(func, "__qualname__", type(func).__name__).rpartition(".")
+    owner = owner.rpartition(".")[2]
+
+    if owner.endswith("Client"):
+        return f"{owner.removesuffix('Client').lower()}.{name}"
+
+    return name
+
+
+def redis_command(func: Callable[..., Any]) -> str:
+    """Name a redis client method, such as hget, or script for the registered lua scripts"""
+    return getattr(func, "__name__", type(func).__name__.lower())
+
+
+def _start_timer():
+    g.request_start = time.perf_counter()
+
+
+def _observe_request(response: Response) -> Response:
+    start: Optional[float] = g.pop("request_start", None)
+    if start is not None:
+        REQUEST_DURATION.labels(
+            request.blueprint or "none",
+            request.endpoint or "none",
+            request.method if request.method in HTTP_METHODS else "other",
+            str(response.status_code),
+        ).observe(time.perf_counter() - start)
+
+    return response
+
+
+def setup_metrics(app: Flask):
+    """Measure the time taken to answer the requests made to the app"""
+    app.before_request(_start_timer)
+    app.after_request(_observe_request)
@@ -61,4 +61,10 @@ redis = get_client(config.core.redis.nonpersistent.host, config.core.redis.nonpe
 cache = Cache(config={"CACHE_TYPE": "SimpleCache"})
 
 # TRACKERS
-QUOTA_TRACKER = UserQuotaTracker("quota", timeout=60 * 2, redis=redis)  # 2 Minutes timeout
+QUOTA_TRACKER = UserQuotaTracker(
+    "quota",
+    timeout=60 * 2,  # 2 Minutes timeout
+    redis=redis,
+    local_ratio=config.ui.quota_local_ratio,
+    local_ttl=config.ui.quota_local_ttl,
+)
@@ -1,8 +1,11 @@
 import importlib
 import os
+import threading
 from pathlib import Path
+from typing import Any
 
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.base import STATE_PAUSED, STATE_RUNNING, STATE_STOPPED, BaseScheduler
 from pytz import timezone
 
 from howler.common.logging import get_logger
@@ -11,19 +14,117 @@ logger = get_logger(__file__)
 
 scheduler = BackgroundScheduler(timezone=timezone(os.getenv("SCHEDULER_TZ", "America/Toronto")))
 
+# Scheduled jobs only run in the process holding this lease, so they run once per cluster no matter how many API or
+# worker replicas are started. The holder renews it every third of its duration.
+LEADER_LEASE_NAME = "howler-scheduler-leader"
+LEADER_LEASE_SECONDS = int(os.getenv("HWL_SCHEDULER_LEASE_SECONDS", "30"))
 
-def setup_jobs():
-    "Dynamically import and initialize all cronjobs in this folder"
+_leader_thread: threading.Thread | None = None
+_leader_stop = threading.Event()
+
+
+def _import_jobs() -> list[Any]:
+    "Import every cronjob module in this folder"
     module_path = Path(__file__).parent
     modules_to_import = [_file for _file in os.listdir(module_path) if _file.endswith(".py") and _file != "__init__.py"]
 
-    for module in modules_to_import:
+    jobs = []
+    for module in sorted(modules_to_import):
         try:
-            job = importlib.import_module(f"howler.cronjobs.{module.replace('.py', '')}")
+            jobs.append(importlib.import_module(f"howler.cronjobs.{module.replace('.py', '')}"))
+        except Exception as e:
+            logger.critical("Error when importing %s - %s", module, e)
+
+    return jobs
+
+
+def run_leader_election(lease: Any, sched: BaseScheduler, stop: threading.Event, interval: float) -> None:
+    """Resume the scheduler while this process holds the leader lease, and pause it otherwise.
+
+    Args:
+        lease (Lease): The lease candidates compete for
+        sched (BaseScheduler): A started scheduler, which is resumed and paused as leadership changes
+        stop (threading.Event): Set to stop the election and give up the lease
+        interval (float): Seconds between attempts to acquire or renew the lease
+    """
+    leading = False
+    try:
+        while True:
+            try:
+                leading = lease.renew() if leading else lease.acquire()
+            except Exception:
+                # Without a confirmed lease another process may take over, so stop running jobs here
+                logger.exception("Error during scheduler leader election")
+                leading = False
+
+            if leading and sched.state == STATE_PAUSED:
+                logger.info("Acquired the scheduler lease, running scheduled jobs in this process")
+                sched.resume()
+            elif not leading and sched.state == STATE_RUNNING:
+                logger.info("Lost the scheduler lease, pausing scheduled jobs in this process")
+                sched.pause()
+
+            if stop.wait(interval):
+                break
+    finally:
+        if leading:
+            try:
+                lease.release()
+            except Exception:
+                logger.exception("Error when releasing the scheduler lease")
+
+
+def setup_jobs(scheduled: bool = True, consumers: bool = True):
+    """Dynamically import and initialize all cronjobs in this folder
 
+    Args:
+        scheduled (bool, optional): Register the scheduled jobs, which run only on the elected leader. Defaults to True.
+        consumers (bool, optional): Start the queue consumer threads, which run in every process. Defaults to True.
+    """
+    global _leader_thread
+
+    for job in _import_jobs():
+        is_consumer = getattr(job, "CONSUMER", False)
+        if (is_consumer and not consumers) or (not is_consumer and not scheduled):
+            continue
+
+        try:
             job.setup_job(scheduler)
         except Exception as e:
-            logger.critical("Error when initializing %s - %s", module, e)
+            logger.critical("Error when initializing %s - %s", job.__name__, e)
+
+    if not scheduled:
+        return
+
+    if scheduler.state == STATE_STOPPED:
+        scheduler.start(paused=True)
+
+    if _leader_thread is None or not _leader_thread.is_alive():
+        from howler.config import config
+        from howler.remote.datatypes.lock import Lease
+
+        lease = Lease(
+            LEADER_LEASE_NAME,
+            LEADER_LEASE_SECONDS,
+            host=config.core.redis.nonpersistent.host,
+            port=config.core.redis.nonpersistent.port,
+        )
+
+        _leader_stop.clear()
+        _leader_thread = threading.Thread(
+            target=run_leader_election,
+            args=(lease, scheduler, _leader_stop, LEADER_LEASE_SECONDS / 3),
+            name="scheduler-leader",
+            daemon=True,
+        )
+        _leader_thread.start()
+
+
+def stop_jobs():
+    "Stop the scheduler and give up the leader lease"
+    _leader_stop.set()
+    if _leader_thread is not None:
+        _leader_thread.join(timeout=LEADER_LEASE_SECONDS)
 
-    if scheduler.state != 1:
-        scheduler.start()
+    if scheduler.state != STATE_STOPPED:
+        scheduler.shutdown(wait=False)
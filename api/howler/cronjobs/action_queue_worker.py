@@ -11,12 +11,16 @@ import threading
 from apscheduler.schedulers.base import BaseScheduler
 
 from howler.common.logging import get_logger
+from howler.common.metrics import BATCH_DURATION, QUEUE_DEPTH
 from howler.config import config
 from howler.odm.models.action import VALID_TRIGGERS
 from howler.services.action_service import TriggeredAction, get_action_queue, process_action_batch
 
 logger = get_logger(__file__)
 
+# Queue consumers run in every worker process, rather than only on the elected scheduler leader
+CONSUMER = True
+
 _threads: dict[str, threading.Thread] = {}
 
 BATCH_SIZE: int = config.system.action_queue.batch_size
@@ -58,10 +62,14 @@ def run_worker(trigger: str) -> None:  # pragma: no cover – long-running loop,
                 batch = []
                 logger.debug("Processing action batch of %d item(s) for trigger=%s", len(batch), trigger)
                 try:
-                    process_action_batch(trigger, finalized_batch)
+                    with BATCH_DURATION.labels(f"action.{trigger}").time():
+                        process_action_batch(trigger, finalized_batch)
                     logger.info("Action batch complete: %d item(s) processed for trigger=%s", len(batch), trigger)
                 except Exception:
                     logger.exception("Error processing action batch for trigger=%s", trigger)
+
+                # Measured once per batch rather than per item, to spare a redis call on every pop
+                QUEUE_DEPTH.labels(f"action.{trigger}").set(queue.length())
         except Exception:
             logger.exception("Unexpected error in action queue worker loop for trigger=%s", trigger)
 
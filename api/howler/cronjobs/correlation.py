@@ -14,6 +14,9 @@ from howler.odm.models.config import config
 
 logger = get_logger(__file__)
 
+# Queue consumers run in every worker process, rather than only on the elected scheduler leader
+CONSUMER = True
+
 _thread: threading.Thread | None = None
 
 
@@ -120,6 +120,10 @@ def _remove_analytics_without_hits(ds: HowlerDatastore):
             }
         )
         ds.analytic.commit()
+
+        from howler.services import analytic_service
+
+        analytic_service.invalidate_known_analytics()
     else:
         logger.warning(
             "Aggregation search for matched analytics did not run or returned no results. "
@@ -1,6 +1,6 @@
 import os
 from datetime import datetime
-from typing import Any, List
+from typing import Any
 
 from apscheduler.schedulers.base import BaseScheduler
 from apscheduler.triggers.cron import CronTrigger
@@ -11,53 +11,68 @@ from howler.config import DEBUG, config
 
 logger = get_logger(__file__)
 
+# Number of users and views read per request, and number of users updated per bulk request
+PAGE_SIZE = 1000
+UPDATE_BATCH_SIZE = 500
+
+
+def _remove_deleted_views(user: dict[str, Any], view_ids: set[str]) -> dict[str, Any]:
+    """Compute the changes removing references to deleted views from a user's dashboard and favourites
+
+    Args:
+        user (dict[str, Any]): The source of the user document
+        view_ids (set[str]): The ids of every existing view
+
+    Returns:
+        dict[str, Any]: The fields to update on the user, empty if no deleted view is referenced
+    """
+    changes: dict[str, Any] = {}
+
+    dashboard = user.get("dashboard") or []
+    valid_entries = [entry for entry in dashboard if entry["type"] != "view" or entry["entry_id"] in view_ids]
+    # If the length of valid entries is less than the current dashboard, one or more pins are invalid
+    if len(valid_entries) < len(dashboard):
+        changes["dashboard"] = valid_entries
+
+    favourite_views = user.get("favourite_views") or []
+    valid_favourites = [view_id for view_id in favourite_views if view_id in view_ids]
+    if len(valid_favourites) < len(favourite_views):
+        changes["favourite_views"] = valid_favourites
+
+    return changes
+
 
 def execute():
-    """Delete any pinned views that no longer exist"""
+    """Delete any pinned or favourite views that no longer exist"""
     from howler.common.loader import datastore
 
     # Initialize datastore
     ds = datastore()
 
-    # fetch the first result from user ds (needed to initialize total)
-    user_result = ds.user.search("*:*", rows=250, fl="*")
-    total_user_count = user_result["total"]
-    user_list: List[Any] = user_result["items"]
-
-    # Do the same thing for the views
-    view_result = ds.view.search("*:*", rows=250)
-    total_view_count = view_result["total"]
-    view_list: List[Any] = view_result["items"]
-    view_ids: List[str] = []
-
-    # Collect all views
-    while len(view_list) < total_view_count:
-        view_list.extend(ds.view.search("*:*", rows=250, offset=len(view_list)))
-
-    # Collect all users
-    while len(user_list) < total_user_count:
-        user_list.extend(ds.user.search("*:*", rows=250, offset=len(user_list)))
-
-    for view in view_list:
-        view_ids.append(view["view_id"])
-
-    # Iterate over each user to see if the dashboard contains invalid entries (deleted views)
-    for user in user_list:
-        valid_entries = []
-        # No views/analytics saved to the dashboard? Skip it
-        if user["dashboard"] == []:
+    # Only the ids of the views are needed, which are streamed page by page rather than loading every view
+    view_ids: set[str] = {hit["_id"] for hit in ds.view.scan_with_pit(source=False, size=PAGE_SIZE)}
+
+    plan = ds.user.get_bulk_plan()
+    updated = 0
+
+    # Iterate over each user to see if the dashboard or favourites contain invalid entries (deleted views), and only
+    # write the users that changed, in bulk
+    for hit in ds.user.scan_with_pit(source=["dashboard", "favourite_views"], size=PAGE_SIZE):
+        changes = _remove_deleted_views(hit.get("_source", {}), view_ids)
+        if not changes:
             continue
-        for dashboard_entry in user["dashboard"]:
-            if dashboard_entry["type"] != "view" or (
-                dashboard_entry["type"] == "view" and dashboard_entry["entry_id"] in view_ids
-            ):
-                valid_entries.append(dashboard_entry)
-        # If the length of valid entries is less than the current dashboard, one or more pins are invalid
-        if len(valid_entries) < len(user["dashboard"]):
-            # set the user dashboard to valid entries
-            user["dashboard"] = valid_entries
-            # update the user
-            ds.user.save(user["uname"], user)
+
+        plan.add_update_operation(hit["_id"], changes, index=hit["_index"])
+        updated += 1
+
+        if len(plan.operations) >= UPDATE_BATCH_SIZE:
+            ds.user.bulk(plan)
+            plan = ds.user.get_bulk_plan()
+
+    if not plan.empty:
+        ds.user.bulk(plan)
+
+    logger.info("Removed deleted views from %s user(s)", updated)
 
 
 def setup_job(sched: BaseScheduler):
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import re
@@ -23,6 +24,7 @@ from howler import odm
 from howler.common.exceptions import HowlerRuntimeError, HowlerValueError, NonRecoverableError
 from howler.common.loader import DATASTORE_INDEX_PREFIX
 from howler.common.logging.format import HWL_DATE_FORMAT, HWL_LOG_FORMAT
+from howler.common.metrics import DATASTORE_DURATION, datastore_method
 from howler.datastore.bulk import ElasticBulkPlan
 from howler.datastore.constants import BACK_MAPPING, TYPE_MAPPING
 from howler.datastore.exceptions import (
@@ -33,6 +35,12 @@ from howler.datastore.exceptions import (
     SearchRetryException,
     VersionConflictException,
 )
+from howler.datastore.scripts import (
+    REMOVE_VALUES_SCRIPT,
+    REMOVE_VALUES_SCRIPT_ID,
+    UPDATE_OPERATIONS_SCRIPT,
+    UPDATE_OPERATIONS_SCRIPT_ID,
+)
 from howler.datastore.support.build import build_mapping
 from howler.datastore.support.schemas import (
     default_dynamic_strings,
@@ -73,6 +81,7 @@ logger.addHandler(console)
 tracer = trace.get_tracer(__name__)
 
 ModelType = TypeVar("ModelType", bound=Model)
+ProgressCallback = Callable[[dict[str, Any]], None]
 _R = TypeVar("_R")
 
 
@@ -162,6 +171,7 @@ class ESCollection(Generic[ModelType]):
     FIELD_SANITIZER = re.compile("^[a-z][a-z0-9_\\-.]+$")
     MAX_GROUP_LIMIT = 10
     MAX_FACET_LIMIT = 100
+    AGGREGATION_TYPES = ("facet", "terms", "histogram", "stats")
     MAX_RETRY_BACKOFF = 10
     MAX_SEARCH_ROWS = 500
     RETRY_NORMAL = 1
@@ -217,9 +227,13 @@ class ESCollection(Generic[ModelType]):
         "script_fields": [],
         "aggregations": None,
     }
+    TASK_PROGRESS_INTERVAL = "2s"
     IGNORE_ENSURE_COLLECTION: bool = False
     ENSURE_COLLECTION_WARNED: bool = False
     CUSTOM_AGG_PREFIX: str = "_custom_agg__"
+    # Called with the collection name whenever the collection's mappings change, so that anything derived from them
+    # (such as the field listings served to the UI) can be recomputed
+    MAPPING_CHANGE_LISTENERS: list[Callable[[str], None]] = []
 
     def __init__(self, datastore: ESStore, name, model_class=None, validate=True, max_attempts=10, ilm_config=None):
         self.replicas = int(
@@ -241,6 +255,7 @@ class ESCollection(Generic[ModelType]):
 
         if not ESCollection.IGNORE_ENSURE_COLLECTION:
             self._ensure_collection()
+            self.datastore.ensure_stored_scripts()
         elif "pytest" not in sys.modules and not ESCollection.ENSURE_COLLECTION_WARNED:
             logger.warning("Skipping ensure collection! This is dangerous. Waiting five seconds before continuing.")
             time.sleep(5)
@@ -362,6 +377,70 @@ class ESCollection(Generic[ModelType]):
                 except elasticsearch.exceptions.NotFoundError:
                     pass
 
+    def scan_with_pit(
+        self,
+        query=None,
+        sort=None,
+        source=None,
+        index=None,
+        size=1000,
+        keep_alive="5m",
+        slice_id: Optional[int] = None,
+        slice_max: Optional[int] = None,
+    ) -> typing.Generator[dict[str, Any], None, None]:
+        """Stream the raw hits matching a query using a point in time and search_after.
+
+        Unlike a scroll, a point in time does not hold a search context per page, and unlike offset paging its cost does
+        not grow with the number of documents already read. Only one page of hits is held in memory at a time.
+
+        :param query: Query object following elasticsearch request structure, all documents if omitted
+        :param sort: Sort to stream the hits in, defaults to the cheapest index order
+        :param source: Fields to return in the _source of each hit, or False for none
+        :param index: Index to open the point in time on, the collection alias if omitted
+        :param size: Number of hits fetched per request
+        :param keep_alive: How long the point in time is kept between requests
+        :param slice_id: The slice of the hits to stream, when reading them with several parallel consumers
+        :param slice_max: The number of slices the hits are split into
+        :return: a generator of raw elasticsearch hits
+        """
+        if index is None:
+            index = self.name
+
+        search_args: dict[str, Any] = {
+            "query": query or {"match_all": {}},
+            # _shard_doc breaks ties between documents so search_after never skips or repeats a hit
+            "sort": [*(sort or []), {"_shard_doc": "asc"}],
+            "size": size,
+            "track_total_hits": False,
+        }
+        if source is not None:
+            search_args["_source"] = source
+
+        if slice_max is not None and slice_max > 1:
+            search_args["slice"] = {"id": slice_id or 0, "max": slice_max}
+
+        pit_id = self.with_retries(self.datastore.client.open_point_in_time, index=index, keep_alive=keep_alive)["id"]
+
+        try:
+            while True:
+                response = self.with_retries(
+                    self.datastore.client.search, pit={"id": pit_id, "keep_alive": keep_alive}, **search_args
+                )
+                pit_id = response.get("pit_id", pit_id)
+
+                hits = response["hits"]["hits"]
+                if not hits:
+                    return
+
+                yield from hits
+
+                search_args["search_after"] = hits[-1]["sort"]
+        finally:
+            try:
+                self.with_retries(self.datastore.client.close_point_in_time, id=pit_id)
+            except elasticsearch.exceptions.NotFoundError:
+                pass
+
     def with_retries(self, func: Callable[..., _R], *args: Any, raise_conflicts: bool = False, **kwargs: Any) -> _R:
         """This function performs the passed function with the given args and kwargs and reconnect if it fails
 
@@ -374,7 +453,11 @@ class ESCollection(Generic[ModelType]):
                 raise HowlerRuntimeError(f"Maximum of {self.max_attempts} retries reached. Aborting ES connection")
 
             try:
-                ret_val = func(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    ret_val = func(*args, **kwargs)
+                finally:
+                    DATASTORE_DURATION.labels(self.name, datastore_method(func)).observe(time.perf_counter() - start)
 
                 if retries:
                     logger.info("Reconnected to elasticsearch!")
@@ -452,12 +535,14 @@ class ESCollection(Generic[ModelType]):
                 else:
                     raise
 
-    def _get_task_results(self, task):
+    def _get_task_results(self, task, progress_callback: Optional[ProgressCallback] = None):
         # This function is only used to wait for a asynchronous task to finish in a graceful manner without
         #  timing out the elastic client. You can create an async task for long running operation like:
         #   - update_by_query
         #   - delete_by_query
         #   - reindex ...
+        #
+        # When a progress callback is provided, the task status is reported to it every time the wait times out.
         attempt = 0
         res = None
         while res is None:
@@ -467,23 +552,37 @@ class ESCollection(Generic[ModelType]):
                     self.datastore.client.tasks.get,
                     task_id=task["task"],
                     wait_for_completion=True,
-                    timeout="10s",
+                    timeout=self.TASK_PROGRESS_INTERVAL if progress_callback else "10s",
                 )
             except (elasticsearch.exceptions.TransportError, elasticsearch.exceptions.ApiError) as e:
-                err_code, msg, _ = e.args
-                if (err_code == 500 or err_code == "500") and msg in [
-                    "timeout_exception",
-                    "receive_timeout_transport_exception",
-                ]:
-                    pass
-                else:
+                if not self._is_task_timeout(e):
                     logger.exception("Unexpected error on task check")
                     raise
 
+            if res is None and progress_callback:
+                status = self.with_retries(self.datastore.client.tasks.get, task_id=task["task"])
+                if status.get("completed"):
+                    res = status
+                else:
+                    progress_callback(status["task"]["status"])
+
         result = res.get("response", res["task"]["status"])
 
         return result
 
+    @staticmethod
+    def _is_task_timeout(e: Union[elasticsearch.exceptions.TransportError, elasticsearch.exceptions.ApiError]) -> bool:
+        timeout_errors = ["timeout_exception", "receive_timeout_transport_exception"]
+
+        if isinstance(e, elasticsearch.exceptions.ApiError):
+            return e.meta.status in [408, 500] and e.message in timeout_errors
+
+        if len(e.args) == 3:
+            err_code, msg, _ = e.args
+            return (err_code == 500 or err_code == "500") and msg in timeout_errors
+
+        return False
+
     def _get_current_alias(self, index: str) -> typing.Optional[str]:
         if self.with_retries(self.datastore.client.indices.exists_alias, name=index):
             return next(
@@ -536,9 +635,24 @@ class ESCollection(Generic[ModelType]):
             else:
                 deleted += res["deleted"]
 
-    def _update_async(self, index, script, query, max_docs=None, refresh=None):
+    def _update_async(
+        self,
+        index,
+        script,
+        query,
+        max_docs=None,
+        refresh=None,
+        slices: Union[int, Literal["auto"], None] = "auto",
+        requests_per_second: Optional[float] = None,
+        progress_callback: Optional[Callable[[int, int, int], None]] = None,
+    ):
         updated = 0
+        conflicts = 0
         while True:
+            task_callback: Optional[ProgressCallback] = None
+            if progress_callback:
+                task_callback = functools.partial(self._report_update_progress, progress_callback, updated, conflicts)
+
             task = self.with_retries(
                 self.datastore.client.update_by_query,
                 index=index,
@@ -548,14 +662,31 @@ class ESCollection(Generic[ModelType]):
                 conflicts="proceed",
                 max_docs=max_docs,
                 refresh=refresh,
+                slices=slices,
+                requests_per_second=requests_per_second,
             )
-            res = self._get_task_results(task)
+            res = self._get_task_results(task, progress_callback=task_callback)
 
             if res["version_conflicts"] == 0:
+                if task_callback:
+                    task_callback(res)
+
                 res["updated"] += updated
                 return res
             else:
                 updated += res["updated"]
+                conflicts += res["version_conflicts"]
+
+    @staticmethod
+    def _report_update_progress(
+        progress_callback: Callable[[int, int, int], None], updated: int, conflicts: int, status: dict[str, Any]
+    ):
+        # Sliced tasks report the sum of all their slices in the parent task status, so no aggregation is needed here
+        progress_callback(
+            updated + status.get("updated", 0),
+            updated + status.get("total", 0),
+            conflicts + status.get("version_conflicts", 0),
+        )
 
     def bulk(self, operations: ElasticBulkPlan, refresh: str | None = None):
         """
@@ -917,8 +1048,17 @@ class ESCollection(Generic[ModelType]):
                     )
                 raise
 
+        self._mapping_changed()
         return True
 
+    def _mapping_changed(self):
+        """Notify the registered listeners that the mappings of this collection changed."""
+        for listener in ESCollection.MAPPING_CHANGE_LISTENERS:
+            try:
+                listener(self.name)
+            except Exception:
+                logger.exception("Error while notifying a mapping change of %s", self.name)
+
     def _get_reindex_settings(self, index_data: dict) -> dict:
         """Build settings for a reindex target without dropping ILM lifecycle metadata."""
         settings = self._get_index_settings()
@@ -1464,67 +1604,141 @@ class ESCollection(Generic[ModelType]):
         )
         return info.get("deleted", 0) != 0
 
-    def _create_scripts_from_operations(self, operations):
-        op_sources = []
-        op_params = {}
-        val_id = 0
-        for op, doc_key, value in operations:
-            if op == self.UPDATE_SET:
-                op_sources.append(f"ctx._source.{doc_key} = params.value{val_id}")
-                op_params[f"value{val_id}"] = value
-            elif op == self.UPDATE_DELETE:
-                op_sources.append(f"ctx._source.{doc_key}.remove(params.value{val_id})")
-                op_params[f"value{val_id}"] = value
-            elif op == self.UPDATE_APPEND:
-                op_sources.append(f"ctx._source.{doc_key}.add(params.value{val_id})")
-                op_params[f"value{val_id}"] = value
-            elif op == self.UPDATE_APPEND_IF_MISSING:
-                script = (
-                    f"if (ctx._source.{doc_key}.indexOf(params.value{val_id}) == -1) "
-                    f"{{ctx._source.{doc_key}.add(params.value{val_id})}}"
-                )
-                op_sources.append(script)
-                op_params[f"value{val_id}"] = value
-            elif op == self.UPDATE_REMOVE:
-                script = (
-                    f"if (ctx._source.{doc_key}.indexOf(params.value{val_id}) != -1) "
-                    f"{{ctx._source.{doc_key}.remove(ctx._source.{doc_key}.indexOf(params.value{val_id}))}}"
-                )
-                op_sources.append(script)
-                op_params[f"value{val_id}"] = value
-            elif op == self.UPDATE_INC:
-                op_sources.append(f"ctx._source.{doc_key} += params.value{val_id}")
-                op_params[f"value{val_id}"] = value
-            elif op == self.UPDATE_DEC:
-                op_sources.append(f"ctx._source.{doc_key} -= params.value{val_id}")
-                op_params[f"value{val_id}"] = value
-            elif op == self.UPDATE_MAX:
-                script = (
-                    f"if (ctx._source.{doc_key} == null || "
-                    f"ctx._source.{doc_key}.compareTo(params.value{val_id}) < 0) "
-                    f"{{ctx._source.{doc_key} = params.value{val_id}}}"
-                )
-                op_sources.append(script)
-                op_params[f"value{val_id}"] = value
-            elif op == self.UPDATE_MIN:
-                script = (
-                    f"if (ctx._source.{doc_key} == null || "
-                    f"ctx._source.{doc_key}.compareTo(params.value{val_id}) > 0) "
-                    f"{{ctx._source.{doc_key} = params.value{val_id}}}"
-                )
-                op_sources.append(script)
-                op_params[f"value{val_id}"] = value
+    def get_document_indexes(self, keys: list[str]) -> dict[str, str]:
+        """Find the concrete index holding each of the given documents.
 
-            val_id += 1
+        The lookup is an ids query against the collection alias, so it is safe for ILM collections where a document
+        may live in any of the rolled over indexes.
 
-        joined_sources = """;\n""".join(op_sources)
+        :param keys: ids of the documents to locate
+        :return: Mapping of the id of every existing document to the index it is stored in
+        """
+        indexes: dict[str, str] = {}
+        keys = list(dict.fromkeys(keys))
+        for ptr in range(0, len(keys), self.MAX_SEARCH_ROWS):
+            chunk = keys[ptr : ptr + self.MAX_SEARCH_ROWS]
+            result = self.with_retries(
+                self.datastore.client.search,
+                index=self.name,
+                query={"ids": {"values": chunk}},
+                size=len(chunk),
+                _source=False,
+            )
+            for hit in result["hits"]["hits"]:
+                indexes[hit["_id"]] = hit["_index"]
 
-        return {
-            "lang": "painless",
-            "source": joined_sources.replace("};\n", "}\n"),
-            "params": op_params,
+        return indexes
+
+    def get_existing_values(self, field: str, values: list[str]) -> set[str]:
+        """Find which of the given values are held by at least one document, in a given keyword field.
+
+        The lookup is a terms query aggregated on the field, so the cost of each request does not depend on how many
+        documents share a value, and no document source is read.
+
+        :param field: Keyword field to look the values up in
+        :param values: Values to look up
+        :return: The subset of the values found in the collection
+        """
+        existing: set[str] = set()
+        values = list(dict.fromkeys(values))
+        for ptr in range(0, len(values), self.MAX_SEARCH_ROWS):
+            chunk = values[ptr : ptr + self.MAX_SEARCH_ROWS]
+            result = self.with_retries(
+                self.datastore.client.search,
+                index=self.name,
+                query={"terms": {field: chunk}},
+                size=0,
+                track_total_hits=False,
+                aggs={"existing": {"terms": {"field": field, "size": len(chunk)}}},
+            )
+            existing.update(bucket["key"] for bucket in result["aggregations"]["existing"]["buckets"])
+
+        return existing
+
+    def delete_many(self, keys: list[str], refresh=None) -> dict[str, str]:
+        """Delete several documents using a single lookup and bulk requests instead of one request per document.
+
+        :param keys: ids of the documents to delete
+        :param refresh: Refresh policy applied to the bulk requests
+        :return: The outcome for each id, either "deleted", "not_found" or the reason the deletion failed
+        """
+        indexes = self.get_document_indexes(keys)
+        results = {key: "not_found" for key in keys if key not in indexes}
+
+        plan = self.get_bulk_plan()
+        for key, index in indexes.items():
+            plan.add_delete_operation(key, index=index)
+
+        for operation_batch in plan.get_plan_batches():
+            response = self.with_retries(self.datastore.client.bulk, operations=operation_batch, refresh=refresh)
+            for item in response["items"]:
+                info = item["delete"]
+                if "error" in info:
+                    results[info["_id"]] = info["error"].get("reason", info["error"].get("type", "error"))
+                else:
+                    results[info["_id"]] = info["result"]
+
+        return results
+
+    def remove_list_values(
+        self,
+        field: str,
+        values: list[Any],
+        refresh=None,
+        slices: Union[int, Literal["auto"], None] = "auto",
+        requests_per_second: Optional[float] = None,
+        progress_callback: Optional[Callable[[int, int, int], None]] = None,
+    ) -> int:
+        """Remove all of the given values from a list field, in every document referencing at least one of them.
+
+        This is a single update by query no matter how many values are removed, where using update_by_query would
+        require one REMOVE operation per value, each of them run against every matching document.
+
+        :param field: List field to remove the values from
+        :param values: Values to remove
+        :param refresh: Refresh policy applied once the update completes
+        :param slices: Number of slices to split the update into so it runs in parallel, "auto" for one per shard
+        :param requests_per_second: Throttle the update to this many documents per second, None for no throttling
+        :param progress_callback: Called with (updated, total, version conflicts) while the update is running
+        :return: The number of documents updated
+        """
+        if not values:
+            return 0
+
+        params = {"path": field.split("."), "values": list(values)}
+        if self.datastore.ensure_stored_scripts():
+            script: dict[str, Any] = {"id": REMOVE_VALUES_SCRIPT_ID, "params": params}
+        else:
+            script = {"lang": "painless", "source": REMOVE_VALUES_SCRIPT, "params": params}
+
+        res = self._update_async(
+            self.name,
+            script=script,
+            query={"terms": {field: list(values)}},
+            refresh=refresh,
+            slices=slices,
+            requests_per_second=requests_per_second,
+            progress_callback=progress_callback,
+        )
+
+        return res["updated"]
+
+    def _create_scripts_from_operations(self, operations):
+        """Build the script applying the given update operations.
+
+        Every update shape is handled by the same stored script, with the operations passed as params, so that
+        Elasticsearch compiles it once instead of once per distinct combination of operations. If the script could not
+        be stored in the cluster, the identical source is sent inline, which the script cache still only compiles once.
+        """
+        params = {
+            "ops": [{"op": op, "path": doc_key.split("."), "value": value} for op, doc_key, value in operations],
         }
 
+        if self.datastore.ensure_stored_scripts():
+            return {"id": UPDATE_OPERATIONS_SCRIPT_ID, "params": params}
+
+        return {"lang": "painless", "source": UPDATE_OPERATIONS_SCRIPT, "params": params}
+
     def _validate_operations(self, operations):
         """Validate the different operations received for a partial update
 
@@ -1653,7 +1867,18 @@ class ESCollection(Generic[ModelType]):
 
         return False
 
-    def update_by_query(self, query, operations, filters=None, access_control=None, max_docs=None, refresh=None):
+    def update_by_query(
+        self,
+        query,
+        operations,
+        filters=None,
+        access_control=None,
+        max_docs=None,
+        refresh=None,
+        slices: Union[int, Literal["auto"], None] = "auto",
+        requests_per_second: Optional[float] = None,
+        progress_callback: Optional[Callable[[int, int, int], None]] = None,
+    ):
         """This function performs an atomic update on some fields from the
         underlying documents matching the query and the filters using a list of operations.
 
@@ -1666,6 +1891,9 @@ class ESCollection(Generic[ModelType]):
         :param filters: Filter queries to reduce the data
         :param query: Query to find the matching documents
         :param operations: List of tuple of operations e.q. [(SET, document_key, operation_value), ...]
+        :param slices: Number of slices to split the update into so it runs in parallel, "auto" for one per shard
+        :param requests_per_second: Throttle the update to this many documents per second, None for no throttling
+        :param progress_callback: Called with (updated, total, version conflicts) while the update is running
         :return: True is update successful
         """
         operations = self._validate_operations(operations)
@@ -1689,6 +1917,9 @@ class ESCollection(Generic[ModelType]):
                 },
                 max_docs=max_docs,
                 refresh=refresh,
+                slices=slices,
+                requests_per_second=requests_per_second,
+                progress_callback=progress_callback,
             )
         except Exception:
             return False
@@ -1938,7 +2169,7 @@ class ESCollection(Generic[ModelType]):
         filters: list[str] | str | None = None,
         access_control: typing.Any = None,
         deep_paging_id: str | None = None,
-        track_total_hits: bool = False,
+        track_total_hits: bool | int = False,
         script_fields: list[str] = [],
         *,
         aggregations: None = None,
@@ -1957,7 +2188,7 @@ class ESCollection(Generic[ModelType]):
         filters: list[str] | str | None = None,
         access_control: typing.Any = None,
         deep_paging_id: str | None = None,
-        track_total_hits: bool = False,
+        track_total_hits: bool | int = False,
         script_fields: list[str] = [],
         *,
         aggregations: None = None,
@@ -1976,7 +2207,7 @@ class ESCollection(Generic[ModelType]):
         filters: list[str] | str | None = None,
         access_control: typing.Any = None,
         deep_paging_id: str | None = None,
-        track_total_hits: bool = False,
+        track_total_hits: bool | int = False,
         script_fields: list[str] = [],
         *,
         aggregations: list[tuple[str, dict]],
@@ -1995,7 +2226,7 @@ class ESCollection(Generic[ModelType]):
         filters: list[str] | str | None = None,
         access_control: typing.Any = None,
         deep_paging_id: str | None = None,
-        track_total_hits: bool = False,
+        track_total_hits: bool | int = False,
         script_fields: list[str] = [],
         *,
         aggregations: list[tuple[str, dict]],
@@ -2042,7 +2273,7 @@ class ESCollection(Generic[ModelType]):
             }
 
         :param script_fields: List of name/script tuple of fields to be evaluated at runtime
-        :param track_total_hits: Return to total matching document count
+        :param track_total_hits: Return to total matching document count, or count up to the given number of documents
         :param deep_paging_id: ID of the next page during deep paging searches
         :param as_obj: Return objects instead of dictionaries
         :param query: lucene query to search for
@@ -2413,6 +2644,55 @@ class ESCollection(Generic[ModelType]):
 
         return ret_data
 
+    def count_many(self, queries: list[str], filters=None, access_control=None) -> list[Optional[int]]:
+        """Count the documents matching each of the given queries using multi search requests, instead of sending one
+        count request per query.
+
+        :param queries: lucene queries to count the matching documents of
+        :param filters: additional filter queries applied to every query
+        :param access_control: access control parameters to limit the scope of the queries
+        :return: the number of documents matching each query, in order, or None where that query failed
+        """
+        if filters is None:
+            filters = []
+        elif isinstance(filters, str):
+            filters = [filters]
+        else:
+            filters = list(filters)
+
+        if access_control:
+            filters.append(access_control)
+
+        counts: list[Optional[int]] = []
+        for ptr in range(0, len(queries), self.MAX_SEARCH_ROWS):
+            searches: list[dict[str, Any]] = []
+            for query in queries[ptr : ptr + self.MAX_SEARCH_ROWS]:
+                searches.append({})
+                searches.append(
+                    {
+                        "query": {
+                            "bool": {
+                                "must": {"query_string": {"query": query, "default_field": self.DEFAULT_SEARCH_FIELD}},
+                                "filter": [{"query_string": {"query": ff}} for ff in filters],
+                            }
+                        },
+                        "size": 0,
+                        "track_total_hits": True,
+                    }
+                )
+
+            result = self.with_retries(self.datastore.client.msearch, index=self.name, searches=searches)
+            for response in result["responses"]:
+                if "error" in response:
+                    logger.warning("Count query failed on %s: %s", self.name, response["error"])
+                    counts.append(None)
+                    continue
+
+                total = response["hits"]["total"]
+                counts.append(total["value"] if isinstance(total, dict) else total)
+
+        return counts
+
     def histogram(
         self,
         field,
@@ -2552,6 +2832,165 @@ class ESCollection(Generic[ModelType]):
         result = self._search(args)
         return result["aggregations"][f"{field}_stats"]
 
+    @staticmethod
+    def _aggregation_count(name: str, spec: dict[str, Any], key: str, default: int) -> int:
+        """Read a count of an aggregation spec, such as its rows, raising a SearchException if it is invalid."""
+        try:
+            return int(spec.get(key) or default)
+        except (TypeError, ValueError):
+            raise SearchException(f"Aggregation '{name}' has an invalid {key} '{spec[key]}'.")
+
+    def _build_aggregation(self, name: str, spec: dict[str, Any]) -> tuple[dict[str, Any], Callable[[dict], Any]]:
+        """Convert one named aggregation spec of ``aggregate`` into an ES aggregation and a result formatter."""
+        agg_type = spec.get("type")
+        field = spec.get("field")
+        if agg_type not in self.AGGREGATION_TYPES:
+            raise SearchException(
+                f"Aggregation '{name}' has an invalid type '{agg_type}'. "
+                f"Valid types are: {', '.join(self.AGGREGATION_TYPES)}"
+            )
+
+        if not field:
+            raise SearchException(f"Aggregation '{name}' is missing a field.")
+
+        if agg_type in ("facet", "terms"):
+            rows = self._aggregation_count(name, spec, "rows", 10)
+            if rows > self.MAX_FACET_LIMIT:
+                raise SearchException(f"Aggregation '{name}' is limited to a maximum of {self.MAX_FACET_LIMIT} rows.")
+
+            terms_body: dict[str, Any] = {
+                "field": field,
+                "min_doc_count": self._aggregation_count(name, spec, "mincount", 1),
+                "size": rows,
+            }
+
+            if agg_type == "facet":
+                return {"terms": terms_body}, lambda agg: {
+                    row.get("key_as_string", row["key"]): row["doc_count"] for row in agg["buckets"]
+                }
+
+            # Unlike facets, terms keep the bucket order, so they can be sorted by key as well as by count
+            if spec.get("sort"):
+                if not isinstance(spec["sort"], str):
+                    raise SearchException(f"Aggregation '{name}' has an invalid sort '{spec['sort']}'.")
+
+                key, _, direction = spec["sort"].partition(" ")
+                direction = direction or "asc"
+                if key not in ("_key", "_count") or direction not in ("asc", "desc"):
+                    raise SearchException(f"Aggregation '{name}' has an invalid sort '{spec['sort']}'.")
+
+                terms_body["order"] = {key: direction}
+
+            return {"terms": terms_body}, lambda agg: [
+                {"value": row.get("key_as_string", row["key"]), "count": row["doc_count"]} for row in agg["buckets"]
+            ]
+
+        if agg_type == "stats":
+            return {"stats": {"field": field}}, lambda agg: agg
+
+        type_modifier = self._validate_steps_count(spec.get("start"), spec.get("end"), spec.get("gap"))
+        start = type_modifier(spec["start"])
+        end = type_modifier(spec["end"])
+        gap = type_modifier(spec["gap"])
+
+        histogram_body: dict[str, dict[str, Any]]
+        if isinstance(gap, str):
+            histogram_body = {"date_histogram": {"fixed_interval": gap.strip("+").strip("-")}}
+        else:
+            histogram_body = {"histogram": {"interval": gap}}
+
+        histogram_body[next(iter(histogram_body))].update(
+            {
+                "field": field,
+                "min_doc_count": self._aggregation_count(name, spec, "mincount", 1),
+                "extended_bounds": {"min": start, "max": end},
+            }
+        )
+
+        # Sibling aggregations share the top level query, so the histogram range is applied as a filter aggregation
+        # instead of being appended to the query's filters the way histogram() does.
+        return {
+            "filter": {"query_string": {"query": f"{field}:[{start} TO {end}]"}},
+            "aggregations": {"histogram": histogram_body},
+        }, lambda agg: {
+            type_modifier(row.get("key_as_string", row["key"])): row["doc_count"] for row in agg["histogram"]["buckets"]
+        }
+
+    def aggregate(
+        self,
+        query: str = "id:*",
+        filters: Optional[Union[str, list[str]]] = None,
+        aggs: Optional[dict[str, dict[str, Any]]] = None,
+        access_control: Optional[str] = None,
+        timeout: Optional[int] = None,
+    ) -> dict[str, Any]:
+        """Run several facet, terms, histogram and stats aggregations over the same query in a single request.
+
+        The query and filters are evaluated once, and every aggregation is computed as a sibling over the matching
+        documents. No documents are returned.
+
+        Args:
+            query (str): The lucene query matching the documents to aggregate over
+            filters (str | list[str], optional): Additional lucene filters to limit the matching documents
+            aggs (dict[str, dict[str, Any]]): The aggregations to run, keyed by the name used in the result. Each spec
+                has a ``type`` and a ``field``, plus the options of the matching single aggregation method:
+                - facet: rows, mincount. Returns the same mapping as ``facet``.
+                - terms: rows, mincount, sort (i.e. "_key asc"). Returns an ordered list of {value, count}.
+                - histogram: start, end, gap, mincount. Returns the same mapping as ``histogram``.
+                - stats: Returns the same statistics as ``stats``.
+            access_control (str, optional): Access control query to limit the matching documents
+            timeout (int, optional): Maximum execution time (ms)
+
+        Returns:
+            dict[str, Any]: The formatted result of each aggregation, keyed by its name
+        """
+        if not aggs:
+            return {}
+
+        if filters is None:
+            filters = []
+        elif isinstance(filters, str):
+            filters = [filters]
+        else:
+            filters = list(filters)
+
+        if access_control:
+            filters.append(access_control)
+
+        aggregations: dict[str, Any] = {}
+        formatters: dict[str, Callable[[dict], Any]] = {}
+        for name, spec in aggs.items():
+            aggregations[name], formatters[name] = self._build_aggregation(name, spec)
+
+        query_body: dict[str, Any] = {
+            "query": {
+                "bool": {
+                    "must": {"query_string": {"query": query or "id:*"}},
+                    "filter": [{"query_string": {"query": ff}} for ff in filters],
+                }
+            },
+            "size": 0,
+            "track_total_hits": False,
+            "aggregations": aggregations,
+        }
+
+        if timeout:
+            query_body["timeout"] = f"{timeout}ms"
+
+        try:
+            result = self.with_retries(self.datastore.client.search, index=self.name, **query_body)
+        except (elasticsearch.ConnectionError, elasticsearch.ConnectionTimeout) as error:
+            raise SearchRetryException("collection: %s, query: %s, error: %s" % (self.name, query_body, str(error)))
+        except (elasticsearch.TransportError, elasticsearch.RequestError) as e:
+            try:
+                err_msg = e.info["error"]["root_cause"][0]["reason"]  # type: ignore
+            except (ValueError, KeyError, IndexError):
+                err_msg = str(e)
+
+            raise SearchException(err_msg)
+
+        return {name: formatter(result["aggregations"][name]) for name, formatter in formatters.items()}
+
     def grouped_search(
         self,
         group_field,
@@ -3213,6 +3652,8 @@ class ESCollection(Generic[ModelType]):
 
             self._create_index_template(_config.datastore.ilm)
 
+        self._mapping_changed()
+
     def wipe(self):
         """This function should completely delete the collection
 
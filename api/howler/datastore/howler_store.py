@@ -38,24 +38,29 @@ INDEXES = {
 ILM_ENABLED_INDEXES = {"hit", "event", "case"}
 
 
+def modify_odms():
+    """Apply the changes plugins and the configuration make to the ODMs"""
+    for plugin in get_plugins():
+        for _index, _odm in INDEXES.items():
+            if _odm is None:
+                continue
+
+            if modify_odm := plugin.modules.odm.modify_odm.get(_index):
+                logger.info("Modifying %s odm with function from plugin %s", _index, plugin.name)
+                modify_odm(_odm)
+
+    if config.core.clue.enabled:
+        Hit.add_namespace(
+            "clue",
+            Compound(Clue, description="Clue-specific overrides for this alert", default=None, optional=True),
+        )
+
+
 class HowlerDatastore(object):
     def __init__(self, datastore_object: "ESStore"):
         self.ds: "ESStore" = datastore_object
 
-        for plugin in get_plugins():
-            for _index, _odm in INDEXES.items():
-                if _odm is None:
-                    continue
-
-                if modify_odm := plugin.modules.odm.modify_odm.get(_index):
-                    logger.info("Modifying %s odm with function from plugin %s", _index, plugin.name)
-                    modify_odm(_odm)
-
-        if config.core.clue.enabled:
-            Hit.add_namespace(
-                "clue",
-                Compound(Clue, description="Clue-specific overrides for this alert", default=None, optional=True),
-            )
+        modify_odms()
 
         for _index, _odm in INDEXES.items():
             ilm_index_config = config.datastore.ilm.indices.get(_index)
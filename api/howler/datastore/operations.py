@@ -2,14 +2,26 @@ from typing import Any, Iterator, Optional, Type
 
 from howler.common.exceptions import HowlerTypeError, HowlerValueError
 from howler.datastore.collection import ESCollection
-from howler.odm.base import Model
+from howler.odm.base import Model, _Field
+from howler.odm.paths import get_path_table
 
 
 class OdmHelper:
     def __init__(self, obj: Optional[Type[Model]] = None) -> None:
+        # The fields of the model are only looked up once an operation is validated, as helpers are created when
+        # modules are imported, before plugins add their fields to the models
+        self.model = obj
         self.model_name = obj.__name__ if obj else None
-        self.valid_fields = list(obj.flat_fields().keys()) if obj else None
-        self.fields = obj.flat_fields() if obj else {}
+
+    @property
+    def valid_fields(self) -> Optional[tuple[str, ...]]:
+        "The flattened fields of the model, if any"
+        return get_path_table(self.model).paths if self.model else None
+
+    @property
+    def fields(self) -> dict[str, _Field]:
+        "The flattened fields of the model, by name"
+        return get_path_table(self.model).fields if self.model else {}
 
     def list_add(
         self,
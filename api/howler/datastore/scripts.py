@@ -0,0 +1,86 @@
+"""Painless scripts stored in the cluster and referenced by id.
+
+Elasticsearch compiles every distinct inline script source it receives, and throttles compilations with
+``script.max_compilations_rate``. The scripts below take everything that varies between calls through ``params`` so
+they are compiled once per node, no matter how many update shapes the API produces.
+
+The script ids carry a version suffix. Whenever a source changes, bump the suffix so that API instances running the
+old and new code side by side during a rollout do not overwrite each other's scripts.
+"""
+
+# Applies a list of ODM update operations to ctx._source, in order. Each entry of params.ops is a map of the shape
+# {"op": <ESCollection.UPDATE_* value>, "path": [<key>, ...], "value": <value>}.
+UPDATE_OPERATIONS_SCRIPT_ID = "howler-update-operations-v1"
+UPDATE_OPERATIONS_SCRIPT = """
+for (def op : params.ops) {
+    def parent = ctx._source;
+    List path = op.path;
+    int last = path.size() - 1;
+    for (int i = 0; i < last; i++) {
+        parent = parent.get(path[i]);
+    }
+
+    String key = path[last];
+    String type = op.op;
+    def value = op.value;
+
+    if (type == 'SET') {
+        parent.put(key, value);
+    } else if (type == 'DELETE') {
+        parent.get(key).remove(value);
+    } else if (type == 'APPEND') {
+        parent.get(key).add(value);
+    } else if (type == 'APPEND_IF_MISSING') {
+        if (parent.get(key).indexOf(value) == -1) {
+            parent.get(key).add(value);
+        }
+    } else if (type == 'REMOVE') {
+        int index = parent.get(key).indexOf(value);
+        if (index != -1) {
+            parent.get(key).remove(index);
+        }
+    } else if (type == 'INC') {
+        parent.put(key, parent.get(key) + value);
+    } else if (type == 'DEC') {
+        parent.put(key, parent.get(key) - value);
+    } else if (type == 'MAX') {
+        def current = parent.get(key);
+        if (current == null || current.compareTo(value) < 0) {
+            parent.put(key, value);
+        }
+    } else if (type == 'MIN') {
+        def current = parent.get(key);
+        if (current == null || current.compareTo(value) > 0) {
+            parent.put(key, value);
+        }
+    }
+}
+"""
+
+# Removes every value of params.values from the list at params.path (a list of keys), i.e. to strip references to
+# deleted documents. All values are passed in a single request instead of one REMOVE operation each.
+REMOVE_VALUES_SCRIPT_ID = "howler-remove-values-v1"
+REMOVE_VALUES_SCRIPT = """
+def parent = ctx._source;
+List path = params.path;
+int last = path.size() - 1;
+for (int i = 0; i < last && parent != null; i++) {
+    parent = parent.get(path[i]);
+}
+
+if (parent == null || !(parent.get(path[last]) instanceof List)) {
+    ctx.op = 'noop';
+    return;
+}
+
+List list = (List) parent.get(path[last]);
+Set values = new HashSet(params.values);
+if (!list.removeIf(value -> values.contains(value))) {
+    ctx.op = 'noop';
+}
+"""
+
+STORED_SCRIPTS: dict[str, str] = {
+    UPDATE_OPERATIONS_SCRIPT_ID: UPDATE_OPERATIONS_SCRIPT,
+    REMOVE_VALUES_SCRIPT_ID: REMOVE_VALUES_SCRIPT,
+}
@@ -13,6 +13,7 @@ import elasticsearch
 from howler.common.logging.format import HWL_DATE_FORMAT, HWL_LOG_FORMAT
 from howler.datastore.collection import ESCollection
 from howler.datastore.exceptions import DataStoreException
+from howler.datastore.scripts import STORED_SCRIPTS
 from howler.odm.models.config import Config
 from howler.odm.models.config import config as _config
 
@@ -129,6 +130,7 @@ class ESStore(object):
         self._closed = False
         self._collections: dict[str, ESCollection] = {}
         self._models: dict[str, Any] = {}
+        self._stored_scripts: Optional[bool] = None
         self.validate = True
 
         tracer = logging.getLogger("elasticsearch")
@@ -276,6 +278,33 @@ class ESStore(object):
         # But 'cast' it so that mypy and other linters don't think that its normal for client to be None
         self.client = cast(elasticsearch.Elasticsearch, None)
 
+    def ensure_stored_scripts(self) -> bool:
+        """Register the painless scripts from ``howler.datastore.scripts`` with the cluster.
+
+        Registration only happens once per store. If the cluster refuses it (typically because the API key lacks the
+        ``manage`` cluster privilege), callers should fall back to sending the same script sources inline.
+
+        Returns:
+            ``True`` if the stored scripts can be referenced by id.
+        """
+        if self._stored_scripts is not None:
+            return self._stored_scripts
+
+        try:
+            for script_id, source in STORED_SCRIPTS.items():
+                self.client.put_script(id=script_id, script={"lang": "painless", "source": source})
+
+            self._stored_scripts = True
+        except elasticsearch.AuthorizationException:
+            logger.warning("Not allowed to store scripts in the cluster, update scripts will be sent inline.")
+            self._stored_scripts = False
+        except (elasticsearch.ApiError, elasticsearch.TransportError):
+            # Don't remember transient failures, the next caller will try to register the scripts again
+            logger.exception("Failed to register stored scripts, update scripts will be sent inline.")
+            return False
+
+        return self._stored_scripts
+
     def get_hosts(self, safe=False):
         """Return the list of configured ES host addresses.
 
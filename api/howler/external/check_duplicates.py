@@ -2,82 +2,202 @@
 
 import argparse
 import heapq
+import queue
 import sys
+import threading
+import time
+from collections import Counter
 from collections.abc import Iterator
-from typing import Any
-
-
-def iter_index_ids(collection: Any, index: str, batch_size: int) -> Iterator[str]:
-    """Yield document IDs from *index* in sorted order without retaining prior pages."""
-    search_after = None
-
-    while True:
-        search_args = {
-            "index": index,
-            "query": {"match_all": {}},
-            "sort": [{"id": "asc"}],
-            "size": batch_size,
-            "_source": False,
-            "track_total_hits": False,
-        }
-        if search_after is not None:
-            search_args["search_after"] = search_after
-
-        response = collection.with_retries(collection.datastore.client.search, **search_args)
-        hits = response["hits"]["hits"]
-        if not hits:
-            return
+from typing import Any, Optional
+
+# Sentinel pushed by a prefetching worker once its stream is exhausted
+_DONE = object()
+
+
+def iter_index_ids(
+    collection: Any, index: str, batch_size: int, slice_id: Optional[int] = None, slice_max: Optional[int] = None
+) -> Iterator[str]:
+    """Yield document IDs from one slice of *index* in sorted order without retaining prior pages."""
+    for hit in collection.scan_with_pit(
+        sort=[{"id": "asc"}],
+        source=False,
+        index=index,
+        size=batch_size,
+        slice_id=slice_id,
+        slice_max=slice_max,
+    ):
+        yield hit["_id"]
+
+
+class PrefetchedIds:
+    """Read an ID stream in a background thread, keeping at most *prefetch* pages of IDs ahead of the consumer."""
+
+    def __init__(self, document_ids: Iterator[str], batch_size: int, prefetch: int = 2):
+        self._pages: queue.Queue = queue.Queue(maxsize=prefetch)
+        self._stopped = threading.Event()
+        self._current: Iterator[str] = iter(())
+        self._thread = threading.Thread(target=self._run, args=(document_ids, batch_size), daemon=True)
+        self._thread.start()
+
+    def _put(self, item: Any) -> bool:
+        while not self._stopped.is_set():
+            try:
+                self._pages.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run(self, document_ids: Iterator[str], batch_size: int) -> None:
+        try:
+            page: list[str] = []
+            for document_id in document_ids:
+                page.append(document_id)
+                if len(page) >= batch_size:
+                    if not self._put(page):
+                        return
+                    page = []
+            if page and not self._put(page):
+                return
+            self._put(_DONE)
+        except Exception as error:
+            self._put(error)
+        finally:
+            close = getattr(document_ids, "close", None)
+            if close is not None:
+                # Releases the point in time when the stream is abandoned before it is exhausted
+                close()
+
+    def __iter__(self) -> "PrefetchedIds":
+        return self
+
+    def __next__(self) -> str:
+        while True:
+            try:
+                return next(self._current)
+            except StopIteration:
+                pass
 
-        for hit in hits:
-            yield hit["_id"]
+            page = self._pages.get()
+            if page is _DONE:
+                raise StopIteration
+            if isinstance(page, Exception):
+                raise page
+            self._current = iter(page)
 
-        search_after = hits[-1]["sort"]
+    def close(self) -> None:
+        """Stop the background reader and wait for it to release its cursor."""
+        self._stopped.set()
+        self._thread.join()
 
 
-def _push_next_id(heap: list[tuple[str, str, Iterator[str]]], index: str, document_ids: Iterator[str]) -> None:
+def _push_next_id(
+    heap: list[tuple[str, str, int, Iterator[str]]], index: str, stream: int, document_ids: Iterator[str]
+) -> None:
     try:
-        heapq.heappush(heap, (next(document_ids), index, document_ids))
+        heapq.heappush(heap, (next(document_ids), index, stream, document_ids))
     except StopIteration:
         pass
 
 
-def iter_duplicates(collection: Any, indexes: list[str], batch_size: int) -> Iterator[tuple[str, list[str]]]:
+def iter_duplicates(
+    collection: Any, indexes: list[str], batch_size: int, slices: int = 1, prefetch: int = 2
+) -> Iterator[tuple[str, list[str]]]:
     """Yield each duplicated ID and the physical indexes that contain it.
 
-    This is a k-way merge over paginated, sorted searches. Its memory use is bounded by
-    the number of physical indexes and one Elasticsearch result page per active iterator.
+    Every physical index is read as *slices* sorted point in time streams, each fetched by its own worker thread, and
+    the streams are combined with a k-way merge. Slicing splits documents by ID, so every copy of an ID is found in
+    exactly one slice per index. Memory use is bounded by the number of streams times *prefetch* pages of IDs.
     """
-    heap: list[tuple[str, str, Iterator[str]]] = []
-    for index in indexes:
-        document_ids = iter_index_ids(collection, index, batch_size)
-        _push_next_id(heap, index, document_ids)
+    streams: list[PrefetchedIds] = []
+    heap: list[tuple[str, str, int, Iterator[str]]] = []
+
+    try:
+        for index in indexes:
+            for slice_id in range(slices):
+                document_ids = PrefetchedIds(
+                    iter_index_ids(
+                        collection,
+                        index,
+                        batch_size,
+                        slice_id=slice_id if slices > 1 else None,
+                        slice_max=slices if slices > 1 else None,
+                    ),
+                    batch_size,
+                    prefetch,
+                )
+                streams.append(document_ids)
+                _push_next_id(heap, index, len(streams), document_ids)
+
+        while heap:
+            document_id, index, stream, ids = heapq.heappop(heap)
+            duplicate_indexes = [index]
+            _push_next_id(heap, index, stream, ids)
+
+            while heap and heap[0][0] == document_id:
+                _, index, stream, ids = heapq.heappop(heap)
+                duplicate_indexes.append(index)
+                _push_next_id(heap, index, stream, ids)
 
-    while heap:
-        document_id, index, document_ids = heapq.heappop(heap)
-        duplicate_indexes = [index]
-        _push_next_id(heap, index, document_ids)
+            if len(duplicate_indexes) > 1:
+                yield document_id, duplicate_indexes
+    finally:
+        for document_ids in streams:
+            document_ids.close()
 
-        while heap and heap[0][0] == document_id:
-            _, index, document_ids = heapq.heappop(heap)
-            duplicate_indexes.append(index)
-            _push_next_id(heap, index, document_ids)
 
-        if len(duplicate_indexes) > 1:
-            yield document_id, duplicate_indexes
+def delete_duplicates(collection: Any, duplicates: list[tuple[str, str]]) -> int:
+    """Delete the supplied (physical index, document ID) copies with bulk requests.
 
+    :return: The number of copies that were deleted
+    """
+    plan = collection.get_bulk_plan()
+    for index, document_id in duplicates:
+        plan.add_delete_operation(document_id, index=index)
 
-def delete_duplicates(collection: Any, document_id: str, indexes: list[str]) -> int:
-    """Delete all supplied physical-index copies of a document ID."""
     deleted = 0
-    for index in indexes:
-        response = collection.with_retries(collection.datastore.client.delete, index=index, id=document_id)
-        if response["result"] == "deleted":
-            deleted += 1
+    for operation_batch in plan.get_plan_batches():
+        response = collection.with_retries(collection.datastore.client.bulk, operations=operation_batch)
+        for item in response["items"]:
+            if item["delete"].get("result") == "deleted":
+                deleted += 1
     return deleted
 
 
-def main() -> int:
-    """Run the interactive duplicate scan for an ILM collection."""
+class ThrottledDeleter:
+    """Queue stale copies and delete them in bulk batches, at no more than *max_per_second* copies per second."""
+
+    def __init__(self, collection: Any, batch_size: int, max_per_second: Optional[float] = None):
+        self.collection = collection
+        self.batch_size = batch_size
+        self.max_per_second = max_per_second
+        self.pending: list[tuple[str, str]] = []
+        self.deleted = 0
+        self._next_batch_at = time.monotonic()
+
+    def add(self, index: str, document_id: str) -> None:
+        """Queue one copy for deletion, flushing when a full batch is pending."""
+        self.pending.append((index, document_id))
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Delete every pending copy."""
+        if not self.pending:
+            return
+
+        if self.max_per_second:
+            delay = self._next_batch_at - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            self._next_batch_at = time.monotonic() + len(self.pending) / self.max_per_second
+
+        self.deleted += delete_duplicates(self.collection, self.pending)
+        self.pending = []
+
+
+def main() -> int:  # noqa: C901
+    """Run the duplicate scan for an ILM collection."""
     parser = argparse.ArgumentParser(
         description="Find duplicate document IDs across an ILM collection's physical indexes."
     )
@@ -86,12 +206,42 @@ def main() -> int:
         "--batch-size",
         type=int,
         default=1_000,
-        help="IDs fetched from each physical index per Elasticsearch request (default: 1000).",
+        help="IDs fetched from each physical index slice per Elasticsearch request (default: 1000).",
     )
+    parser.add_argument(
+        "--slices",
+        type=int,
+        default=1,
+        help="Parallel sliced cursors used to read each physical index (default: 1).",
+    )
+    parser.add_argument(
+        "--delete-batch-size",
+        type=int,
+        default=500,
+        help="Stale copies deleted per bulk request (default: 500).",
+    )
+    parser.add_argument(
+        "--max-deletes-per-second",
+        type=float,
+        default=None,
+        help="Throttle deletions to at most this many copies per second (default: unthrottled).",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only report the duplicates found, without deleting anything.",
+    )
+    parser.add_argument("--force", action="store_true", help="Skip the confirmation prompt before deleting.")
     args = parser.parse_args()
 
     if args.batch_size <= 0:
         parser.error("--batch-size must be a positive integer.")
+    if args.slices <= 0:
+        parser.error("--slices must be a positive integer.")
+    if args.delete_batch_size <= 0:
+        parser.error("--delete-batch-size must be a positive integer.")
+    if args.max_deletes_per_second is not None and args.max_deletes_per_second <= 0:
+        parser.error("--max-deletes-per-second must be a positive number.")
 
     from howler.datastore.collection import ESCollection
 
@@ -119,32 +269,47 @@ def main() -> int:
         print(f"Collection '{args.collection}' has fewer than two physical ILM indexes; nothing to check.")
         return 0
 
-    print(f"Scanning for duplicate IDs in: {', '.join(indexes)}")
+    if not args.dry_run and not args.force:
+        answer = input(f"Delete every stale duplicate copy from {', '.join(indexes[1:])}? [yes/NO] ")
+        if answer.lower() not in {"y", "yes"}:
+            args.dry_run = True
+
+    print(f"Scanning for duplicate IDs in: {', '.join(indexes)}{' (dry run)' if args.dry_run else ''}")
     duplicates_found = 0
-    copies_deleted = 0
+    stale_copies: Counter[str] = Counter()
     index_order = {index: position for position, index in enumerate(indexes)}
+    deleter = ThrottledDeleter(collection, args.delete_batch_size, args.max_deletes_per_second)
 
     try:
-        for document_id, duplicate_indexes in iter_duplicates(collection, indexes, args.batch_size):
+        for document_id, duplicate_indexes in iter_duplicates(collection, indexes, args.batch_size, args.slices):
             duplicates_found += 1
+            # Keep the newest copy, found in the first index of the list
             keep_index = min(duplicate_indexes, key=index_order.__getitem__)
-            stale_indexes = [index for index in duplicate_indexes if index != keep_index]
-            print(
-                f"Duplicate ID '{document_id}' found in {', '.join(duplicate_indexes)}. "
-                f"Keeping the newest copy in '{keep_index}'."
-            )
-            answer = input(f"Delete copies from {', '.join(stale_indexes)}? [yes/NO] ")
-            if answer.lower() in {"y", "yes"}:
-                deleted_count = delete_duplicates(collection, document_id, stale_indexes)
-                copies_deleted += deleted_count
-                print(f"Deleted {deleted_count} copy/copies of '{document_id}'.")
+            for index in duplicate_indexes:
+                if index != keep_index:
+                    stale_copies[index] += 1
+                    if not args.dry_run:
+                        deleter.add(index, document_id)
+
+            if duplicates_found % 10_000 == 0:
+                print(f"{duplicates_found} duplicate ID(s) found, {deleter.deleted} stale copy/copies deleted so far.")
+
+        deleter.flush()
     except KeyboardInterrupt:
         print("\nInterrupted; all completed deletions have been retained.", file=sys.stderr)
         return 130
     finally:
         datastore.ds.close()
 
-    print(f"Scan complete. Found {duplicates_found} duplicate ID(s); deleted {copies_deleted} stale copy/copies.")
+    print(f"Scan complete. Found {duplicates_found} duplicate ID(s).")
+    for index in indexes:
+        if stale_copies[index]:
+            print(f"  {index}: {stale_copies[index]} stale copy/copies")
+
+    if args.dry_run:
+        print("Dry run; nothing was deleted.")
+    else:
+        print(f"Deleted {deleter.deleted} stale copy/copies.")
     return 0
 
 
@@ -0,0 +1,450 @@
+"""Generate large, reproducible datasets of hits, events and cases for load testing.
+
+Unlike howler.odm.random_data, documents are not built through the ODM and saved one at a time: a single document of
+each type is built through the ODM to get its defaults and access control fields, and every generated document only
+overlays the fields that vary on it. Documents are then either written to NDJSON files or sent to the datastore in bulk
+requests.
+
+The same seed always gives the same documents, down to their IDs. IDs are derived from the seed and the position of a
+document, so hits can reference events and cases can reference hits without keeping the generated IDs in memory, even
+when each type is generated by a separate run.
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import sys
+import time
+from bisect import bisect
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from itertools import accumulate
+from pathlib import Path
+from typing import Any, Callable, Optional, TextIO
+
+import baseconv
+
+DOCUMENT_TYPES = ("event", "hit", "case")
+
+LABEL_CATEGORIES = ("generic", "insight", "mitigation", "victim", "campaign", "threat", "tuning", "operation")
+PROVIDERS = ("HBS", "NBS", "CBS", "AssemblyLine")
+CATEGORIES = ("authentication", "file", "malware", "network", "process")
+DEPARTMENTS = ("Finance", "Human Resources", "Legal", "Operations", "Research", "Sales")
+
+# Statuses of the hits assigned to someone, an unassigned hit is always open
+ASSIGNED_STATUSES = (("in-progress", 0.5), ("on-hold", 0.1), ("resolved", 0.4))
+ASSESSMENTS = ("ambiguous", "security", "development", "false-positive", "legitimate", "trivial", "recon", "attempt")
+ESCALATIONS = (("miss", 0.15), ("hit", 0.6), ("alert", 0.2), ("evidence", 0.05))
+EVENT_ESCALATIONS = (("hit", 0.75), ("alert", 0.2), ("evidence", 0.05))
+CASE_ESCALATIONS = (("normal", 0.8), ("focus", 0.15), ("crisis", 0.05))
+CASE_ITEM_TYPES = (("hit", 0.7), ("event", 0.2), ("reference", 0.1))
+
+
+class LoadProfile:
+    """The number of documents to generate, and the cardinalities of the values they share.
+
+    Analytics are picked following a Zipf distribution, so that a few analytics produce most hits as they do in
+    practice, while detections, users and labels are picked uniformly.
+    """
+
+    def __init__(
+        self,
+        hits: int = 100000,
+        events: int = 0,
+        cases: int = 0,
+        analytics: int = 50,
+        detections: int = 10,
+        users: int = 100,
+        labels: int = 200,
+        max_labels: int = 3,
+        max_related: int = 3,
+        max_case_items: int = 20,
+        assigned_ratio: float = 0.3,
+        days: int = 30,
+    ):
+        self.hits = hits
+        self.events = events
+        self.cases = cases
+        self.analytics = analytics
+        self.detections = detections
+        self.users = users
+        self.labels = labels
+        self.max_labels = max_labels
+        self.max_related = max_related
+        self.max_case_items = max_case_items
+        self.assigned_ratio = assigned_ratio
+        self.days = days
+
+    def count(self, document_type: str) -> int:
+        "The number of documents of the given type to generate"
+        return getattr(self, f"{document_type}s")
+
+
+def document_id(seed: str, document_type: str, position: int) -> str:
+    "The base62 ID of the document at the given position, the same for every run using this seed"
+    digest = hashlib.blake2b(f"{seed}:{document_type}:{position}".encode(), digest_size=16).digest()
+    return baseconv.base62.encode(int.from_bytes(digest, "big"))
+
+
+def _overlay(base: dict[str, Any], changes: dict[str, Any]) -> dict[str, Any]:
+    "Return base with changes applied on top, copying only the dicts that change so that base is shared"
+    result = dict(base)
+    for key, value in changes.items():
+        if isinstance(value, dict) and isinstance(base.get(key), dict):
+            result[key] = _overlay(base[key], value)
+        else:
+            result[key] = value
+
+    return result
+
+
+def _weighted(choices: tuple[tuple[str, float], ...]) -> tuple[tuple[str, ...], list[float]]:
+    return tuple(value for value, _ in choices), list(accumulate(weight for _, weight in choices))
+
+
+class DocumentGenerator:
+    """Generate the documents of a load test dataset from a seed and a profile."""
+
+    def __init__(self, profile: LoadProfile, seed: str = "howler", until: Optional[datetime] = None):
+        self.profile = profile
+        self.seed = seed
+
+        if until is None:
+            until = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        self.until = until.timestamp()
+        self.span = timedelta(days=profile.days).total_seconds()
+
+        self.analytics = [f"Load Test Analytic {index:04d}" for index in range(profile.analytics)]
+        self.analytic_weights = list(accumulate(1 / (rank + 1) for rank in range(profile.analytics)))
+        self.users = [f"loadtest-user-{index:04d}" for index in range(profile.users)]
+        self.labels = [f"label-{index:04d}" for index in range(profile.labels)]
+
+        self.assigned_statuses = _weighted(ASSIGNED_STATUSES)
+        self.escalations = _weighted(ESCALATIONS)
+        self.event_escalations = _weighted(EVENT_ESCALATIONS)
+        self.case_escalations = _weighted(CASE_ESCALATIONS)
+        self.case_item_types = _weighted(CASE_ITEM_TYPES)
+
+        self._templates: dict[str, dict[str, Any]] = {}
+
+    def template(self, document_type: str) -> dict[str, Any]:
+        "A document of the given type built through the ODM, holding its defaults and access control fields"
+        if document_type not in self._templates:
+            from howler.odm.models.case import Case
+            from howler.odm.models.event import Event
+            from howler.odm.models.hit import Hit
+
+            if document_type == "hit":
+                odm: Any = Hit({"howler": {"id": "template", "analytic": "template", "hash": "0"}})
+            elif document_type == "event":
+                odm = Event({"howler": {"id": "template", "hash": "0"}})
+            else:
+                odm = Case({"case_id": "template", "title": "template", "summary": "template"})
+
+            self._templates[document_type] = odm.as_primitives(hidden_fields=True)
+
+        return self._templates[document_type]
+
+    def _rng(self, document_type: str) -> random.Random:
+        return random.Random(f"{self.seed}:{document_type}")  # noqa: S311
+
+    def _pick(self, rng: random.Random, weighted: tuple[tuple[str, ...], list[float]]) -> str:
+        values, cumulative_weights = weighted
+        return values[bisect(cumulative_weights, rng.random() * cumulative_weights[-1])]
+
+    def _timestamp(self, rng: random.Random) -> str:
+        timestamp = datetime.fromtimestamp(self.until - rng.random() * self.span, timezone.utc)
+        return timestamp.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+    def _address(self, rng: random.Random) -> str:
+        return f"10.{rng.randrange(256)}.{rng.randrange(256)}.{rng.randrange(1, 255)}"
+
+    def _related(self, rng: random.Random, position: int) -> list[str]:
+        # Hits reference the events of the dataset if there are any, and the hits generated before them otherwise
+        if self.profile.events > 0:
+            document_type, total = "event", self.profile.events
+        else:
+            document_type, total = "hit", position
+
+        if total < 1:
+            return []
+
+        count = rng.randint(0, self.profile.max_related)
+        return sorted({document_id(self.seed, document_type, rng.randrange(total)) for _ in range(count)})
+
+    def hit(self, rng: random.Random, position: int) -> dict[str, Any]:
+        "Generate the hit at the given position"
+        analytic_index = bisect(self.analytic_weights, rng.random() * self.analytic_weights[-1])
+        analytic = self.analytics[min(analytic_index, len(self.analytics) - 1)]
+        detection = f"Detection {rng.randrange(self.profile.detections):03d}"
+        timestamp = self._timestamp(rng)
+
+        labels: dict[str, list[str]] = {}
+        for _ in range(rng.randint(0, self.profile.max_labels)):
+            labels.setdefault(rng.choice(LABEL_CATEGORIES), []).append(rng.choice(self.labels))
+
+        howler: dict[str, Any] = {
+            "id": document_id(self.seed, "hit", position),
+            "analytic": analytic,
+            "detection": detection,
+            "hash": f"{rng.getrandbits(256):064x}",
+            "escalation": self._pick(rng, self.escalations),
+            "score": round(rng.random() * 100, 2),
+            "related": self._related(rng, position),
+            "labels": labels,
+            "outline": {
+                "threat": self._address(rng),
+                "target": f"host-{rng.randrange(10000):04d}.example.com",
+                "indicators": [self._address(rng) for _ in range(rng.randint(0, 3))],
+                "summary": f"{detection} triggered on {analytic}",
+            },
+        }
+
+        if rng.random() < self.profile.assigned_ratio:
+            howler["assignment"] = rng.choice(self.users)
+            howler["status"] = self._pick(rng, self.assigned_statuses)
+            if howler["status"] == "resolved":
+                howler["assessment"] = rng.choice(ASSESSMENTS)
+
+        return _overlay(
+            self.template("hit"),
+            {
+                "id": howler["id"],
+                "timestamp": timestamp,
+                "event": {"created": timestamp, "provider": rng.choice(PROVIDERS)},
+                "organization": {"name": rng.choice(DEPARTMENTS)},
+                "source": {"ip": howler["outline"]["threat"]},
+                "destination": {"ip": self._address(rng)},
+                "user": {"name": rng.choice(self.users)},
+                "howler": howler,
+            },
+        )
+
+    def event(self, rng: random.Random, position: int) -> dict[str, Any]:
+        "Generate the event at the given position"
+        event_id = document_id(self.seed, "event", position)
+        timestamp = self._timestamp(rng)
+
+        return _overlay(
+            self.template("event"),
+            {
+                "id": event_id,
+                "timestamp": timestamp,
+                "event": {
+                    "created": timestamp,
+                    "provider": rng.choice(PROVIDERS),
+                    "category": [rng.choice(CATEGORIES)],
+                },
+                "organization": {"name": rng.choice(DEPARTMENTS)},
+                "source": {"ip": self._address(rng)},
+                "destination": {"ip": self._address(rng)},
+                "user": {"name": rng.choice(self.users)},
+                "howler": {
+                    "id": event_id,
+                    "hash": f"{rng.getrandbits(256):064x}",
+                    "escalation": self._pick(rng, self.event_escalations),
+                    "score": round(rng.random() * 100, 2),
+                },
+            },
+        )
+
+    def case(self, rng: random.Random, position: int) -> dict[str, Any]:
+        "Generate the case at the given position, referencing the hits and events of the dataset"
+        case_id = document_id(self.seed, "case", position)
+        created = self._timestamp(rng)
+
+        items: list[dict[str, str]] = []
+        for _ in range(rng.randint(1, self.profile.max_case_items)):
+            item_type = self._pick(rng, self.case_item_types)
+            total = self.profile.count(item_type) if item_type != "reference" else 0
+
+            if item_type == "reference" or total < 1:
+                item_type = "reference"
+                value = f"https://wiki.example.com/cases/{case_id}/{rng.randrange(1000)}"
+            else:
+                value = document_id(self.seed, item_type, rng.randrange(total))
+
+            items.append({"id": f"{case_id}-{len(items)}", "type": item_type, "value": value})
+
+        return _overlay(
+            self.template("case"),
+            {
+                "id": case_id,
+                "case_id": case_id,
+                "title": f"Load test case {position}",
+                "summary": f"Investigation of {len(items)} items",
+                "created": created,
+                "start": created,
+                "escalation": self._pick(rng, self.case_escalations),
+                "status": rng.choice(("open", "in-progress", "resolved")),
+                "participants": sorted(set(rng.sample(self.users, min(3, len(self.users))))),
+                "targets": [f"host-{rng.randrange(10000):04d}.example.com"],
+                "indicators": [self._address(rng) for _ in range(rng.randint(0, 3))],
+                "items": items,
+            },
+        )
+
+    def generate(self, document_type: str) -> Iterator[dict[str, Any]]:
+        "Generate every document of the given type, in order"
+        build: Callable[[random.Random, int], dict[str, Any]] = getattr(self, document_type)
+        rng = self._rng(document_type)
+
+        for position in range(self.profile.count(document_type)):
+            yield build(rng, position)
+
+
+def batches(documents: Iterator[dict[str, Any]], batch_size: int) -> Iterator[list[dict[str, Any]]]:
+    "Group the documents in lists of at most batch_size documents"
+    batch: list[dict[str, Any]] = []
+    for document in documents:
+        batch.append(document)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+
+def write_ndjson(documents: Iterator[dict[str, Any]], output: TextIO) -> int:
+    """Write the documents to output, one JSON document per line.
+
+    :return: The number of documents written
+    """
+    written = 0
+    for document in documents:
+        output.write(json.dumps(document))
+        output.write("\n")
+        written += 1
+
+    return written
+
+
+def bulk_payload(index: str, batch: list[dict[str, Any]]) -> str:
+    "Render a batch of documents as the body of a bulk request indexing them"
+    lines = []
+    for document in batch:
+        lines.append(json.dumps({"index": {"_index": index, "_id": document["id"]}}))
+        lines.append(json.dumps(document))
+
+    return "\n".join(lines) + "\n"
+
+
+def send_batches(collection: Any, documents: Iterator[dict[str, Any]], batch_size: int) -> tuple[int, int]:
+    """Index the documents in the collection's write index with bulk requests, bypassing model validation.
+
+    :return: The number of documents indexed and the number of documents that failed
+    """
+    indexed = failed = 0
+    for batch in batches(documents, batch_size):
+        response = collection.with_retries(
+            collection.datastore.client.bulk, operations=bulk_payload(collection.index_name, batch)
+        )
+
+        errors = sum(1 for item in response["items"] if "error" in item["index"])
+        indexed += len(batch) - errors
+        failed += errors
+
+    return indexed, failed
+
+
+def main() -> int:  # noqa: C901
+    "Generate a load test dataset and write it to NDJSON files or to the datastore"
+    parser = argparse.ArgumentParser(
+        description="Generate a large, reproducible dataset of hits, events and cases for load testing."
+    )
+    parser.add_argument("--hits", type=int, default=100000, help="Number of hits to generate (default: 100000).")
+    parser.add_argument("--events", type=int, default=0, help="Number of events to generate (default: 0).")
+    parser.add_argument("--cases", type=int, default=0, help="Number of cases to generate (default: 0).")
+    parser.add_argument("--seed", default="howler", help="Seed of the dataset, the same seed gives the same data.")
+    parser.add_argument(
+        "--until",
+        type=datetime.fromisoformat,
+        default=None,
+        help="Date of the most recent documents, in ISO format (default: today at midnight UTC).",
+    )
+    parser.add_argument("--days", type=int, default=30, help="Number of days the documents are spread over.")
+    parser.add_argument("--analytics", type=int, default=50, help="Number of distinct analytics (default: 50).")
+    parser.add_argument("--detections", type=int, default=10, help="Number of detections per analytic (default: 10).")
+    parser.add_argument("--users", type=int, default=100, help="Number of distinct users (default: 100).")
+    parser.add_argument("--labels", type=int, default=200, help="Number of distinct labels (default: 200).")
+    parser.add_argument("--max-labels", type=int, default=3, help="Maximum number of labels per hit (default: 3).")
+    parser.add_argument(
+        "--max-related", type=int, default=3, help="Maximum number of related records per hit (default: 3)."
+    )
+    parser.add_argument(
+        "--max-case-items", type=int, default=20, help="Maximum number of items per case (default: 20)."
+    )
+    parser.add_argument(
+        "--assigned-ratio", type=float, default=0.3, help="Share of the hits assigned to a user (default: 0.3)."
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="Directory to write hit.ndjson, event.ndjson and case.ndjson to, instead of the datastore.",
+    )
+    parser.add_argument("--batch-size", type=int, default=1000, help="Documents per bulk request (default: 1000).")
+    args = parser.parse_args()
+
+    if args.analytics < 1 or args.detections < 1 or args.users < 1 or args.labels < 1:
+        parser.error("--analytics, --detections, --users and --labels must be at least 1.")
+
+    if args.until is not None and args.until.tzinfo is None:
+        args.until = args.until.replace(tzinfo=timezone.utc)
+
+    profile = LoadProfile(
+        hits=args.hits,
+        events=args.events,
+        cases=args.cases,
+        analytics=args.analytics,
+        detections=args.detections,
+        users=args.users,
+        labels=args.labels,
+        max_labels=args.max_labels,
+        max_related=args.max_related,
+        max_case_items=args.max_case_items,
+        assigned_ratio=args.assigned_ratio,
+        days=args.days,
+    )
+    generator = DocumentGenerator(profile, seed=args.seed, until=args.until)
+
+    datastore = None
+    if args.output is None:
+        from howler.common import loader
+
+        datastore = loader.datastore(archive_access=False)
+    else:
+        args.output.mkdir(parents=True, exist_ok=True)
+
+    try:
+        for document_type in DOCUMENT_TYPES:
+            if profile.count(document_type) < 1:
+                continue
+
+            start = time.perf_counter()
+            if datastore is None:
+                with (args.output / f"{document_type}.ndjson").open("w") as output:
+                    written = write_ndjson(generator.generate(document_type), output)
+                print(f"Wrote {written} {document_type}s", end="")
+            else:
+                collection = getattr(datastore, document_type)
+                written, failed = send_batches(collection, generator.generate(document_type), args.batch_size)
+                collection.commit()
+                print(f"Indexed {written} {document_type}s ({failed} failed)", end="")
+
+            elapsed = time.perf_counter() - start
+            print(f" in {elapsed:.1f}s, {written / max(elapsed, 1e-9):.0f} per second")
+    except KeyboardInterrupt:
+        print("\nInterrupted; the documents sent so far were kept.", file=sys.stderr)
+        return 130
+    finally:
+        if datastore is not None:
+            datastore.ds.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
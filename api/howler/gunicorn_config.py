@@ -1,3 +1,4 @@
+import gc
 import multiprocessing
 from os import environ as env
 
@@ -19,7 +20,63 @@ worker_connections = int(env.get("WORKER_CONNECTIONS", "1000"))
 max_requests = int(env.get("MAX_REQUESTS", "1000"))
 max_requests_jitter = int(env.get("MAX_REQUESTS_JITTER", "100"))
 
+# Load the app in the master process, so that the workers forked from it share its memory rather than each building
+# the models, classification engine and field tables again
+preload_app = env.get("PRELOAD_APP", "false").lower() == "true"
+if preload_app:
+    # Threads do not survive a fork, so the app leaves starting them to the workers (see post_worker_init)
+    env["HWL_DEFER_BACKGROUND_SERVICES"] = "true"
+
+    # Collections in the master would free objects in the middle of the pages shared with the workers, so the garbage
+    # collector is held off until the app is loaded and its objects are frozen (see when_ready)
+    gc.disable()
+
 # Connection timeouts
 graceful_timeout = int(env.get("GRACEFUL_TIMEOUT", "30"))
 # Official microsoft documentation suggest 600
 timeout = int(env.get("TIMEOUT", "360"))
+
+
+def on_starting(server):
+    """Clear the metrics left by a previous run, when they are shared between workers"""
+    from pathlib import Path
+
+    if metrics_dir := env.get("PROMETHEUS_MULTIPROC_DIR"):
+        for path in Path(metrics_dir).glob("*.db"):
+            path.unlink()
+
+
+def when_ready(server):
+    """Freeze the objects of the preloaded app before the workers are forked.
+
+    Frozen objects are left alone by the garbage collector, which would otherwise write to every page holding them the
+    first time it runs in a worker, and copy them.
+    """
+    if preload_app:
+        gc.freeze()
+        gc.enable()
+
+
+def post_worker_init(worker):
+    """Start the background services of a worker forked from the preloaded app"""
+    if preload_app:
+        from howler.app import start_background_services
+
+        start_background_services()
+
+
+def child_exit(server, worker):
+    """Drop the gauges of a worker that exited, when metrics are shared between workers"""
+    if env.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
+
+
+def worker_exit(server, worker):
+    """Write out any buffered audit records before the worker goes away"""
+    import sys
+
+    audit = sys.modules.get("howler.common.logging.audit")
+    if audit is not None:
+        audit.AUDIT_WRITER.stop()
@@ -1,5 +1,10 @@
+import hashlib
+import json
+import threading
+import time
 from typing import Any, Callable, Optional, Union
 
+import howler.services.comms_service as comms_service
 from howler.common.loader import datastore
 from howler.datastore.collection import ESCollection
 from howler.odm.models.user import User
@@ -37,6 +42,17 @@ INDEX_ORDER_MAP: dict[str, str] = {
     "view": "title asc",
 }
 
+# Event emitted when the mappings of a collection change, so every pod drops its cached field listings
+FIELDS_CHANGED_EVENT = "fields_changed"
+
+# Field listings per admin status, as (expiry, fields, etag). Listings are reloaded once they expire, which bounds how
+# stale they get when an invalidation event is missed.
+_FIELDS_CACHE_TTL = 300
+
+_fields_lock = threading.Lock()
+_fields_cache: dict[bool, tuple[float, dict[str, dict], str]] = {}
+_fields_generation = 0
+
 
 def get_collection(index: str, user: Union[User, dict[str, Any]]) -> Optional[Callable[[], ESCollection]]:
     """Get the ESCollection for a given index
@@ -85,18 +101,71 @@ def has_access_control(index: str | list[str]) -> bool:
     return any(_index in ACCESS_CONTROLLED_INDICES for _index in index)
 
 
-def list_all_fields(is_admin: bool = False) -> dict[str, dict]:
-    """Generate a list of all fields in each index
+def forget_cached_fields(_payload: Any = None) -> None:
+    """Drop the cached field listings on this pod."""
+    global _fields_generation
+
+    with _fields_lock:
+        _fields_cache.clear()
+        _fields_generation += 1
+
+
+def invalidate_fields_cache(collection: Optional[str] = None) -> None:
+    """Drop the cached field listings on every pod after the mappings of a collection changed.
+
+    Args:
+        collection (Optional[str], optional): The name of the collection whose mappings changed. Defaults to None.
+    """
+    forget_cached_fields()
+    comms_service.emit(FIELDS_CHANGED_EVENT, {"collection": collection})
+
+
+comms_service.on(FIELDS_CHANGED_EVENT, forget_cached_fields)
+ESCollection.MAPPING_CHANGE_LISTENERS.append(invalidate_fields_cache)
+
+
+def get_fields_catalogue(is_admin: bool = False) -> tuple[dict[str, dict], str]:
+    """Retrieve the fields in each index, along with a hash of the listing suitable for use as an ETag.
+
+    The listing is computed once per pod for admins and non-admins, and reused until it expires or the mappings of a
+    collection change.
 
     Args:
         is_admin (bool, optional): Should administrator only indexes be included? Defaults to False.
 
     Returns:
-        dict[str, dict]: A list of all fields in each index
+        tuple[dict[str, dict], str]: The fields in each index, and the hash of those fields
     """
+    now = time.monotonic()
+    with _fields_lock:
+        cached = _fields_cache.get(is_admin)
+        generation = _fields_generation
+
+    if cached is not None and cached[0] > now:
+        return cached[1], cached[2]
+
     fields_map = {k: INDEX_MAP[k]().fields(skip_mapping_children=True) for k in INDEX_MAP.keys()}
 
     if is_admin:
         fields_map.update({k: ADMIN_INDEX_MAP[k]().fields(skip_mapping_children=True) for k in ADMIN_INDEX_MAP.keys()})
 
-    return fields_map
+    etag = hashlib.sha256(json.dumps(fields_map, sort_keys=True, default=str).encode()).hexdigest()
+
+    with _fields_lock:
+        # Listings computed while the mappings were changing are served, but not kept
+        if generation == _fields_generation:
+            _fields_cache[is_admin] = (now + _FIELDS_CACHE_TTL, fields_map, etag)
+
+    return fields_map, etag
+
+
+def list_all_fields(is_admin: bool = False) -> dict[str, dict]:
+    """Generate a list of all fields in each index
+
+    Args:
+        is_admin (bool, optional): Should administrator only indexes be included? Defaults to False.
+
+    Returns:
+        dict[str, dict]: A list of all fields in each index
+    """
+    return get_fields_catalogue(is_admin)[0]
@@ -110,6 +110,13 @@ def flat_to_nested(data: dict[str, _Any]) -> dict[str, _Any]:
     return sub_data
 
 
+def _forget_path_tables():
+    # The path tables are built from the fields of the models, and imported here to avoid a circular import
+    from howler.odm.paths import forget_path_tables
+
+    forget_path_tables()
+
+
 class KeyMaskException(HowlerKeyError):
     pass
 
@@ -214,6 +221,13 @@ class _Field:
             "This function is not defined in the default field. Each fields has to have their own definition"
         )
 
+    def restore(self, value, **kwargs):
+        """Rebuild the value of this field from its primitive, as returned by as_primitives, without checking it again.
+
+        The primitive of most fields is the value they store, so it is kept as is.
+        """
+        return value
+
     def __repr__(self) -> str:
         keys = [
             key
@@ -245,6 +259,16 @@ class Date(_Field):
         except Exception as e:
             raise HowlerValueError(f"[{'.'.join(context) or self.name}]: {str(e)}")
 
+    def restore(self, value, **kwargs):
+        # Primitives are formatted with DATEFORMAT, which fromisoformat parses much faster than strptime
+        if isinstance(value, str) and value.endswith("Z"):
+            try:
+                return datetime.fromisoformat(value[:-1]).replace(tzinfo=UTC_TZ)
+            except ValueError:
+                pass
+
+        return self.check(value, **kwargs)
+
 
 class Boolean(_Field):
     """A field storing a boolean value."""
@@ -797,6 +821,10 @@ class Classification(Keyword):
 
         return ClassificationObject(self.engine, value, is_uc=self.is_uc)
 
+    def restore(self, value, **kwargs):
+        # The primitive is a string, the classification object has to be built around it
+        return self.check(value, **kwargs)
+
 
 class ClassificationString(Keyword):
     """A field storing the classification as a string only."""
@@ -830,6 +858,15 @@ class TypedList(list):
 
         super().__init__([type_p.check(el, context=self.context, **kwargs) for el in items])
 
+    @classmethod
+    def restore(cls, type_p, items, context=[]):
+        """Build a list of values already checked by type_p, without checking them again."""
+        out = cls.__new__(cls)
+        out.context = context
+        out.type = type_p
+        super(TypedList, out).extend(items)
+        return out
+
     def append(self, item):
         super().append(self.type.check(item, context=self.context))
 
@@ -902,6 +939,14 @@ class List(_Field):
 
         return TypedList(self.child_type, *value, **kwargs)
 
+    def restore(self, value, context=[], **kwargs):
+        if not isinstance(value, list):
+            return self.check(value, context=context, **kwargs)
+
+        return TypedList.restore(
+            self.child_type, [self.child_type.restore(el, context=context) for el in value], context=context
+        )
+
     def apply_defaults(self, index, store):
         """Initialize the default settings for the child field."""
         # First apply the default to the list itself
@@ -932,6 +977,18 @@ class TypedMapping(dict):
         super().__init__({key: type_p.check(el, context=self.context) for key, el in items.items()})
         self.type = type_p
 
+    @classmethod
+    def restore(cls, type_p, index, store, sanitizer, items, context=[]):
+        """Build a mapping of values already checked by type_p, without checking them or their keys again."""
+        out = cls.__new__(cls)
+        out.index = index
+        out.store = store
+        out.sanitizer = sanitizer
+        out.context = context
+        super(TypedMapping, out).update(items)
+        out.type = type_p
+        return out
+
     def __setitem__(self, key, item):
         if not self.sanitizer.match(key):
             raise HowlerKeyError(f"[{'.'.join(self.context)}]: Illegal key: {key}")
@@ -976,12 +1033,31 @@ class Mapping(_Field):
         if self.optional and value is None:
             return None
 
+        return TypedMapping(self.child_type, self.index, self.store, self._sanitizer(), **value)
+
+    def restore(self, value, **kwargs):
+        # Like check, the mapping isn't given the context of the field
+        return self._restore_mapping(value, [])
+
+    def _restore_mapping(self, value, context):
+        if value is None:
+            return None
+
+        return TypedMapping.restore(
+            self.child_type,
+            self.index,
+            self.store,
+            self._sanitizer(),
+            {key: self.child_type.restore(el, context=context) for key, el in value.items()},
+            context=context,
+        )
+
+    def _sanitizer(self):
+        "The pattern the keys of the mapping must match"
         if self.index or self.store:
-            sanitizer = FIELD_SANITIZER
-        else:
-            sanitizer = NOT_INDEXED_SANITIZER
+            return FIELD_SANITIZER
 
-        return TypedMapping(self.child_type, self.index, self.store, sanitizer, **value)
+        return NOT_INDEXED_SANITIZER
 
     def apply_defaults(self, index, store):
         """Initialize the default settings for the child field."""
@@ -1003,6 +1079,9 @@ class FlattenedListObject(Mapping):
 
         return TypedMapping(self.child_type, self.index, self.store, FLATTENED_OBJECT_SANITIZER, **value)
 
+    def _sanitizer(self):
+        return FLATTENED_OBJECT_SANITIZER
+
     def apply_defaults(self, index, store):
         """Initialize the default settings for the child field."""
         # First apply the default to the list itself
@@ -1030,6 +1109,12 @@ class FlattenedObject(Mapping):
             **value,
         )
 
+    def restore(self, value, context=[], **kwargs):
+        return self._restore_mapping(value, context)
+
+    def _sanitizer(self):
+        return FLATTENED_OBJECT_SANITIZER
+
     def apply_defaults(self, index, store):
         """Initialize the default settings for the child field."""
         # First apply the default to the list itself
@@ -1066,6 +1151,12 @@ class Compound(_Field):
             context=context,
         )
 
+    def restore(self, value, context=[], **kwargs):
+        if value is None or isinstance(value, self.child_type):
+            return value
+
+        return self.child_type.restore(value, context=context)
+
     def fields(self):
         out = dict()
         for name, field_data in self.child_type.fields().items():
@@ -1094,6 +1185,12 @@ class Optional(_Field):
 
         return self.child_type.check(value, *args, **kwargs)
 
+    def restore(self, value, *args, **kwargs):
+        if value is None:
+            return None
+
+        return self.child_type.restore(value, *args, **kwargs)
+
     def fields(self):
         return self.child_type.fields()
 
@@ -1160,6 +1257,8 @@ class Model:
             recursive_set_name(field_data, name)
             field_data.apply_defaults(index=index, store=store)
 
+        _forget_path_tables()
+
     @classmethod
     def remove_namespace(cls, namespace: str):
         if "_odm_field_cache_skip" in cls.__dict__:
@@ -1170,6 +1269,8 @@ class Model:
 
         delattr(cls, namespace)
 
+        _forget_path_tables()
+
     @staticmethod
     def _recurse_fields(name, field, show_compound, skip_mappings, multivalued=False):
         name = name.rstrip("_")
@@ -1431,6 +1532,40 @@ class Model:
         # attribute assignment
         self.__frozen = True
 
+    @classmethod
+    def restore(cls, data: dict, docid=None, context=[]):
+        """Rebuild an object from the primitives of an object that was already validated, without validating them again.
+
+        This is much cheaper than the constructor, and meant for primitives returned by as_primitives, e.g. by another
+        process. Values missing from the primitives are filled in as the constructor does.
+        """
+        if len(context) == 0:
+            context = [cls.__name__.lower()]
+
+        fields = cls.fields()
+
+        out = cls.__new__(cls)
+        out._odm_py_obj = {}
+        out._id = docid
+        out.context = context
+        out._odm_removed = {}
+        out.unused_keys = set(data.keys()) - set(fields.keys()) - BANNED_FIELDS - {"__index"}
+
+        for name, field_type in fields.items():
+            if name in data:
+                value = field_type.restore(data[name], context=[*context, name])
+            elif field_type.default_set:
+                value = field_type.check(copy.copy(field_type.default), context=[*context, name])
+            elif not field_type.optional:
+                raise HowlerValueError(f"[{'.'.join([*context, name])}]: value is missing from the object!")
+            else:
+                value = field_type.check(None, context=[*context, name])
+
+            out._odm_py_obj[name.rstrip("_")] = value
+
+        out.__frozen = True
+        return out
+
     def as_primitives(
         self,
         hidden_fields=False,
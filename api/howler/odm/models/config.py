@@ -495,6 +495,10 @@ class UI(BaseModel):
     """
 
     audit: bool = Field(description="Should API calls be audited and saved to a separate log file?", default=True)
+    audit_queue_size: int = Field(
+        default=10000,
+        description="How many audit records can be buffered for the background writer. 0 writes them synchronously.",
+    )
     debug: bool = Field(default=False, description="Enable debugging?")
     static_folder: Optional[str] = Field(
         default=os.path.dirname(__file__) + "/../../../static",
@@ -502,6 +506,14 @@ class UI(BaseModel):
     )
     discover_url: Optional[str] = Field(default=None, description="Discovery URL")
     enforce_quota: bool = Field(default=True, description="Enforce the user's quotas?")
+    quota_local_ratio: float = Field(
+        default=0.0,
+        description="Fraction of a user's quota that each API worker may admit without checking redis. 0 disables.",
+    )
+    quota_local_ttl: float = Field(
+        default=1.0,
+        description="How long, in seconds, the slot count last reported by redis is trusted for local admission.",
+    )
     secret_key: str = Field(
         default=os.environ.get("FLASK_SECRET_KEY", "This is the default flask secret key... you should change this!"),
         description="Flask secret key to store cookies, etc.",
@@ -0,0 +1,128 @@
+"""Dotted field paths of the ODM models, precompiled once per model.
+
+Flattening a document against a model, finding its unknown keys or expanding field patterns used to walk the fields of
+the model for every document, and finding the unknown keys deep copied every compound field on the way. The path table
+of a model is instead built once from ``Model.flat_fields()``, and dropped whenever a namespace is added to or removed
+from a model, so that it is rebuilt from the new fields.
+"""
+
+import re
+import threading
+from typing import Iterable, Optional
+
+from howler.odm.base import Mapping, Model, _Field
+from howler.odm.base import Optional as OptionalField
+
+# Maximum number of distinct field pattern sets whose expansion is kept per model
+MAX_CACHED_EXPANSIONS = 1024
+
+_tables_lock = threading.Lock()
+_tables: dict[type[Model], "PathTable"] = {}
+
+
+def path_prefixes(paths: Iterable[str]) -> frozenset[str]:
+    """Return every proper prefix of the given dotted paths, so "a.b.c" gives "a" and "a.b"."""
+    prefixes = set()
+    for path in paths:
+        index = path.find(".")
+        while index > 0:
+            prefixes.add(path[:index])
+            index = path.find(".", index + 1)
+
+    return frozenset(prefixes)
+
+
+class _FieldNode:
+    """A field of a model, whose subfields are looked up once and kept."""
+
+    __slots__ = ("field", "_children", "_mapping_child")
+
+    def __init__(self, field: type[Model] | _Field):
+        self.field = field
+        self._children: Optional[dict[str, _FieldNode]] = None
+        self._mapping_child: Optional[_FieldNode] = None
+
+    def child(self, part: str) -> Optional["_FieldNode"]:
+        """Return the node of the given key under this field, or None if the field does not accept it."""
+        if self._children is None:
+            self._children = {name: _FieldNode(field) for name, field in self.field.fields().items()}
+
+        if part in self._children:
+            return self._children[part]
+
+        field = self.field.child_type if isinstance(self.field, OptionalField) else self.field
+        if not isinstance(field, Mapping):
+            return None
+
+        # Any key is accepted by a mapping, and is followed by the fields of its values
+        if self._mapping_child is None:
+            self._mapping_child = _FieldNode(field.child_type)
+
+        return self._mapping_child
+
+
+class PathTable:
+    """The dotted paths of the fields of a model, and the lookups derived from them."""
+
+    def __init__(self, model: type[Model]):
+        self.model = model
+        self.fields: dict[str, _Field] = model.flat_fields()
+        self.paths: tuple[str, ...] = tuple(self.fields.keys())
+        self.prefixes = path_prefixes(self.paths)
+        self.deprecated = frozenset(
+            name for name, field in model.flat_fields(show_compound=True).items() if field.deprecated
+        )
+
+        self._root = _FieldNode(model)
+        self._expansions: dict[tuple[frozenset[str], bool], frozenset[str]] = {}
+
+    def is_known(self, key: str) -> bool:
+        """Whether a dotted key, as produced by flatten_deep, is part of the model."""
+        node: Optional[_FieldNode] = self._root
+        for part in key.split("."):
+            node = node.child(part)  # type: ignore[union-attr]
+            if node is None:
+                return False
+
+        return True
+
+    def expand(self, patterns: Iterable[str], preserve_all: bool = False) -> frozenset[str]:
+        """Expand `*`-wildcard field patterns against the paths of the model. See expand_field_patterns."""
+        patterns = frozenset(patterns)
+        cache_key = (patterns, preserve_all)
+
+        if (expanded := self._expansions.get(cache_key)) is not None:
+            return expanded
+
+        result: set[str] = set()
+        for pattern in patterns:
+            if "*" not in pattern or (pattern == "*" and preserve_all):
+                result.add(pattern)
+                continue
+
+            regex = re.compile("^" + re.escape(pattern).replace(r"\*", ".*") + "$")
+            result.update(path for path in self.paths if regex.match(path))
+
+        if len(self._expansions) >= MAX_CACHED_EXPANSIONS:
+            self._expansions.clear()
+
+        expanded = self._expansions[cache_key] = frozenset(result)
+        return expanded
+
+
+def get_path_table(model: type[Model]) -> PathTable:
+    """Return the path table of a model, building it on first use."""
+    table = _tables.get(model)
+    if table is None:
+        table = PathTable(model)
+
+        with _tables_lock:
+            table = _tables.setdefault(model, table)
+
+    return table
+
+
+def forget_path_tables():
+    """Drop every path table, so they are rebuilt once the fields of a model changed."""
+    with _tables_lock:
+        _tables.clear()
@@ -45,7 +45,7 @@ from howler.odm.models.user import User
 from howler.odm.models.view import View
 from howler.odm.randomizer import get_random_string, get_random_user, get_random_word, random_model_obj
 from howler.security.utils import get_password_hash
-from howler.services import analytic_service, user_service
+from howler.services import action_service, analytic_service, user_service
 
 classification = loader.get_classification()
 
@@ -796,6 +796,7 @@ def create_analytics(ds: HowlerDatastore, num_analytics: int = 10):
 def wipe_analytics(ds):
     """Wipe the analytics index"""
     ds.analytic.wipe()
+    analytic_service.forget_known_analytics()
 
 
 def create_actions(ds: HowlerDatastore, num_actions: int = 30):
@@ -862,6 +863,7 @@ def create_actions(ds: HowlerDatastore, num_actions: int = 30):
 def wipe_actions(ds: HowlerDatastore):
     """Wipe the actions index"""
     ds.action.wipe()
+    action_service.forget_cached_actions()
 
 
 def create_dossiers(ds: HowlerDatastore, num_dossiers: int = 5):
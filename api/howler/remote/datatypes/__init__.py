@@ -14,6 +14,7 @@ from packaging.version import parse
 from redis.backoff import ExponentialBackoff
 from redis.retry import Retry
 
+from howler.common.metrics import REDIS_DURATION, redis_command
 from howler.odm.models.config import config
 from howler.utils.uid import get_random_id
 
@@ -107,7 +108,11 @@ def retry_call(func, *args, **kw):
 
     while True:
         try:
-            ret_val = func(*args, **kw)
+            start = time.perf_counter()
+            try:
+                ret_val = func(*args, **kw)
+            finally:
+                REDIS_DURATION.labels(redis_command(func)).observe(time.perf_counter() - start)
 
             if exponent != -7:
                 log.info("Reconnected to Redis!")
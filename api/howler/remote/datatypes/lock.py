@@ -42,3 +42,50 @@ class Lock(object):
 
     def __exit__(self, unused1, unused2, unused3):
         retry_call(self._release, args=[self.lock_holder, self.lock_release, self.uuid])
+
+
+lease_renew_script = """
+local lease_holder = ARGV[1]
+local uuid = ARGV[2]
+local timeout = ARGV[3]
+if redis.call('get', lease_holder) == uuid then
+    redis.call('expire', lease_holder, timeout)
+    return true
+end
+return false
+"""
+
+lease_release_script = """
+local lease_holder = ARGV[1]
+local uuid = ARGV[2]
+if redis.call('get', lease_holder) == uuid then
+    redis.call('del', lease_holder)
+end
+"""
+
+
+class Lease(object):
+    """A non-blocking lock held for *timeout* seconds, which the holder must renew before it expires.
+
+    Used for leader election: every candidate periodically tries to acquire the lease, and only the holder acts.
+    """
+
+    def __init__(self, name, timeout, host=None, port=None):
+        self.uuid = get_random_id()
+        self.c: Any = get_client(host, port, False)
+        self.lease_holder = f"lease-{name}-holder"
+        self.timeout = timeout
+        self._renew = self.c.register_script(lease_renew_script)
+        self._release = self.c.register_script(lease_release_script)
+
+    def acquire(self) -> bool:
+        "Take the lease if nobody holds it"
+        return bool(retry_call(self.c.set, self.lease_holder, self.uuid, nx=True, ex=self.timeout))
+
+    def renew(self) -> bool:
+        "Extend the lease, returning False if it was lost to another holder"
+        return bool(retry_call(self._renew, args=[self.lease_holder, self.uuid, self.timeout]))
+
+    def release(self):
+        "Give up the lease if it is still held"
+        retry_call(self._release, args=[self.lease_holder, self.uuid])
@@ -1,56 +1,136 @@
-from typing import Any
-
-from redis.exceptions import ResponseError
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Optional
 
 from howler.remote.datatypes import get_client, retry_call
+from howler.utils.uid import get_random_id
 
+# Prune expired slots, check the remaining count and register the caller's token in a single round trip. Keys left
+# over from older versions of the tracker (which were not sorted sets) are dropped in place instead of surfacing a
+# WRONGTYPE error to the caller. Returns {admitted, active slot count}.
 begin_script = """
-local t = redis.call('time')
-local key = tonumber(t[1] .. string.format("%06d", t[2]))
+local name = KEYS[1]
+local max = tonumber(ARGV[1])
+local timeout = tonumber(ARGV[2] .. "000000")
+local token = ARGV[3]
+
+local key_type = redis.call('type', name)['ok']
+if key_type ~= 'zset' and key_type ~= 'none' then
+    redis.call('del', name)
+end
 
-local name = ARGV[1]
-local max = tonumber(ARGV[2])
-local timeout = tonumber(ARGV[3] .. "000000")
+local t = redis.call('time')
+local now = tonumber(t[1] .. string.format("%06d", t[2]))
 
-redis.call('zremrangebyscore', name, 0, key - timeout)
-if redis.call('zcard', name) < max then
-    redis.call('zadd', name, key, key)
-    return true
+redis.call('zremrangebyscore', name, 0, now - timeout)
+local count = redis.call('zcard', name)
+if count < max then
+    redis.call('zadd', name, now, token)
+    redis.call('expire', name, ARGV[2])
+    return {1, count + 1}
 else
-    return false
+    return {0, count}
 end
 """
 
+LOCAL_SLOT_PREFIX = "local:"
+
 
 class UserQuotaTracker(object):
-    def __init__(self, prefix, timeout=120, redis=None, host=None, port=None, private=False):
+    """Track the number of concurrent requests each user has in flight.
+
+    Every successful call to ``begin`` hands out a unique token, and ``end`` releases exactly that token, so a long
+    running request can never have its slot freed by a shorter one finishing first.
+
+    When ``local_ratio`` is set, the tracker remembers the slot count redis last reported for each user. For up to
+    ``local_ttl`` seconds after that, requests are admitted without touching redis as long as the last known count plus
+    the requests admitted locally since stays below ``local_ratio * max_quota``. Locally admitted requests are not
+    visible to other processes, so this trades strictness for latency and should only be enabled with a ratio low
+    enough that the combined overshoot of all workers is acceptable.
+    """
+
+    def __init__(
+        self,
+        prefix,
+        timeout=120,
+        redis=None,
+        host=None,
+        port=None,
+        private=False,
+        local_ratio: float = 0.0,
+        local_ttl: float = 1.0,
+    ):
         self.c: Any = redis or get_client(host, port, private)
         self.bs = self.c.register_script(begin_script)
         self.prefix = prefix
         self.timeout = timeout
+        self.local_ratio = local_ratio
+        self.local_ttl = local_ttl
+
+        self._lock = threading.Lock()
+        self._local_active: dict[str, int] = defaultdict(int)
+        self._observed: dict[str, tuple[float, int]] = {}
 
     def _queue_name(self, user):
         return f"{self.prefix}-{user}"
 
-    def begin(self, user, max_quota):
-        try:
-            return retry_call(self.bs, args=[self._queue_name(user), max_quota, self.timeout]) == 1
-        except ResponseError as er:
-            # TODO: This is a failsafe for upgrade purposes could be removed in a future version
-            if "WRONGTYPE" in str(er):
-                retry_call(self.c.delete, self._queue_name(user))
-                return retry_call(self.bs, args=[self._queue_name(user), max_quota, self.timeout]) == 1
-            else:
-                raise
-
-    def end(self, user):
-        """When only one item is requested, blocking is is possible."""
-        try:
+    def _begin_local(self, user, max_quota) -> Optional[str]:
+        if self.local_ratio <= 0:
+            return None
+
+        with self._lock:
+            observed = self._observed.get(user)
+            if observed is None or time.monotonic() - observed[0] > self.local_ttl:
+                return None
+
+            if observed[1] + self._local_active[user] + 1 > max_quota * self.local_ratio:
+                return None
+
+            self._local_active[user] += 1
+
+        return f"{LOCAL_SLOT_PREFIX}{get_random_id()}"
+
+    def begin(self, user, max_quota) -> Optional[str]:
+        """Reserve a slot for the given user.
+
+        Args:
+            user (str): The username to reserve a slot for
+            max_quota (int): The maximum number of concurrent slots the user may hold
+
+        Returns:
+            Optional[str]: A token identifying the reserved slot, to be passed to ``end``, or None if the user is over
+                their quota
+        """
+        token = self._begin_local(user, max_quota)
+        if token:
+            return token
+
+        token = get_random_id()
+        admitted, count = retry_call(self.bs, keys=[self._queue_name(user)], args=[max_quota, self.timeout, token])
+
+        if self.local_ratio > 0:
+            with self._lock:
+                self._observed[user] = (time.monotonic(), int(count))
+
+        return token if admitted == 1 else None
+
+    def end(self, user, token: Optional[str] = None):
+        """Release the slot identified by the token returned from ``begin``.
+
+        Args:
+            user (str): The username the slot was reserved for
+            token (str, optional): The token returned by ``begin``. If omitted, the oldest slot is released instead.
+        """
+        if token and token.startswith(LOCAL_SLOT_PREFIX):
+            with self._lock:
+                if self._local_active[user] <= 1:
+                    self._local_active.pop(user, None)
+                else:
+                    self._local_active[user] -= 1
+            return
+
+        if token:
+            retry_call(self.c.zrem, self._queue_name(user), token)
+        else:
             retry_call(self.c.zpopmin, self._queue_name(user))
-        except ResponseError as er:
-            # TODO: This is a failsafe for upgrade purposes could be removed in a future version
-            if "WRONGTYPE" in str(er):
-                retry_call(self.c.delete, self._queue_name(user))
-                retry_call(self.c.zpopmin, self._queue_name(user))
-            else:
-                raise
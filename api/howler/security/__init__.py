@@ -217,11 +217,14 @@ class api_login(object):  # noqa: D101, N801
                 logger.debug("Bypassing quota limits for clue enrichment")
             elif self.enforce_quota:
                 # Check current user quota
+                quota = user.get("api_quota", 25)
+                quota_token = QUOTA_TRACKER.begin(user["uname"], quota)
+
+                # Only the slot this request was granted is released when the response is sent
                 flsk_session["quota_user"] = user["uname"]
-                flsk_session["quota_set"] = True
+                flsk_session["quota_token"] = quota_token
 
-                quota = user.get("api_quota", 25)
-                if not QUOTA_TRACKER.begin(user["uname"], quota):
+                if not quota_token:
                     if config.ui.enforce_quota:
                         logger.warning("%s was prevented from using the api due to exceeded quota.", user["uname"])
                         FAILED_ATTEMPTS.labels("429").inc()
@@ -1,9 +1,12 @@
 import json
+import threading
+import time
 from collections import defaultdict
 from typing import Any, Optional, TypedDict
 
 from flask import Response
 
+import howler.services.comms_service as comms_service
 from howler import actions
 from howler.api import bad_request
 from howler.common.exceptions import HowlerValueError
@@ -30,6 +33,88 @@ class TriggeredAction(TypedDict):
 # Per-trigger persistent queues for buffering action execution requests.
 _action_queues: dict[str, NamedQueue[TriggeredAction]] = {}
 
+# Event emitted when an action is created, updated or deleted, so every pod drops its cached actions
+ACTIONS_CHANGED_EVENT = "actions_changed"
+
+# Automated actions indexed by trigger, and the users actions are run as. Both are reloaded once they expire, which
+# bounds how stale they get when an invalidation event is missed. Actions loaded right after an invalidation are only
+# kept for a short while, since the change may not have been visible to search yet.
+_ACTION_CACHE_TTL = 60
+_ACTION_REFRESH_GRACE = 5
+_USER_CACHE_TTL = 60
+_USER_CACHE_SIZE = 1000
+
+_cache_lock = threading.Lock()
+_actions_by_trigger: tuple[float, dict[str, list[Action]]] | None = None
+_actions_invalidated_at = float("-inf")
+_users: dict[str, tuple[float, Optional[User]]] = {}
+
+
+def forget_cached_actions(_payload: Any = None) -> None:
+    """Drop the cached actions and users on this pod."""
+    global _actions_by_trigger, _actions_invalidated_at
+
+    with _cache_lock:
+        _actions_by_trigger = None
+        _actions_invalidated_at = time.monotonic()
+        _users.clear()
+
+
+def invalidate_action_cache(action_id: str) -> None:
+    """Drop the cached actions on every pod after an action was created, updated or deleted.
+
+    Args:
+        action_id: The id of the action that changed.
+    """
+    forget_cached_actions()
+    comms_service.emit(ACTIONS_CHANGED_EVENT, {"action_id": action_id})
+
+
+comms_service.on(ACTIONS_CHANGED_EVENT, forget_cached_actions)
+
+
+def get_actions_for_trigger(trigger: str) -> list[Action]:
+    """Return the actions to run on *trigger*.
+
+    All automated actions are loaded in a single search and indexed by trigger, then served from memory until they
+    expire or an action changes.
+    """
+    global _actions_by_trigger
+
+    with _cache_lock:
+        now = time.monotonic()
+        if _actions_by_trigger is None or _actions_by_trigger[0] < now:
+            index: dict[str, list[Action]] = defaultdict(list)
+            for action in datastore().action.search("triggers:*", rows=10000)["items"]:
+                for action_trigger in action.triggers:
+                    index[action_trigger].append(action)
+
+            ttl = _ACTION_REFRESH_GRACE if now - _actions_invalidated_at < _ACTION_REFRESH_GRACE else _ACTION_CACHE_TTL
+            _actions_by_trigger = (now + ttl, dict(index))
+
+        return _actions_by_trigger[1].get(trigger, [])
+
+
+def _get_user(uname: Optional[str]) -> Optional[User]:
+    """Return the user with the given username, caching the lookup so that every batch does not fetch it again."""
+    if uname is None:
+        return None
+
+    with _cache_lock:
+        cached = _users.get(uname)
+        if cached and cached[0] >= time.monotonic():
+            return cached[1]
+
+    user = datastore().user.get(uname)
+
+    with _cache_lock:
+        if len(_users) >= _USER_CACHE_SIZE:
+            _users.clear()
+
+        _users[uname] = (time.monotonic() + _USER_CACHE_TTL, user)
+
+    return user
+
 
 def get_action_queue(trigger: str) -> NamedQueue[TriggeredAction]:
     """Return the action queue for *trigger*, creating it on first use.
@@ -112,7 +197,7 @@ def process_action_batch(trigger: str, items: list[TriggeredAction]) -> None:
         query = f"howler.id:({' OR '.join(sanitize_lucene_query(h) for h in unique_ids)})"
 
         try:
-            user = datastore().user.get(uname)
+            user = _get_user(uname)
             bulk_execute_on_query(query, trigger=trigger, user=user)
         except Exception:
             logger.exception("Error processing action batch for trigger=%s user=%s", trigger, uname)
@@ -160,14 +245,16 @@ def bulk_execute_on_query(query: str, trigger: str = "create", user: Optional[Us
     if trigger not in VALID_TRIGGERS:
         raise HowlerValueError(f"{trigger} is not a valid trigger. It must be one of {','.join(VALID_TRIGGERS)}")
 
-    on_trigger_actions: list[Action] = storage.action.search(f"triggers:{sanitize_lucene_query(trigger)}", rows=10000)[
-        "items"
-    ]
+    on_trigger_actions = get_actions_for_trigger(trigger)
+    if not on_trigger_actions:
+        return
 
-    for action in on_trigger_actions:
-        intersected_query = f"({query}) AND ({action.query})"
+    # Check which actions apply to the query in a single request, rather than running a count per action
+    intersected_queries = [f"({query}) AND ({action.query})" for action in on_trigger_actions]
+    counts = storage.hit.count_many(intersected_queries)
 
-        if datastore().hit.search(intersected_query, rows=0)["total"] < 1:
+    for action, intersected_query, count in zip(on_trigger_actions, intersected_queries, counts):
+        if not count:
             if TESTING:
                 logger.debug("Action %s does not apply to query %s", action.action_id, query)
 
@@ -199,6 +286,7 @@ def bulk_execute_on_query(query: str, trigger: str = "create", user: Optional[Us
                 operation_id=operation.operation_id,
                 query=intersected_query,
                 user=user,
+                hit_count=count,
                 **parsed_data,
             )
 
@@ -1,3 +1,4 @@
+import time
 from typing import Any, Literal, Union, overload
 
 from howler.common.loader import datastore
@@ -8,10 +9,25 @@ from howler.odm.models.analytic import Analytic
 from howler.odm.models.hit import Hit
 from howler.odm.models.howler_data import Assessment
 from howler.odm.models.user import User
+from howler.services import comms_service
+from howler.utils.chunk import chunked_list
 from howler.utils.str_utils import sanitize_lucene_query
 
 logger = get_logger(__file__)
 
+# Analytics known to be saved with the given contributors and (lowercased) detections, keyed by lowercased name. Ingest
+# skips analytics whose entry already covers the incoming hits, so steady-state ingest doesn't query the analytic
+# collection at all. Entries expire so that changes made by other processes are eventually picked up.
+_KNOWN_ANALYTICS: dict[str, tuple[float, set[str], set[str]]] = {}
+_KNOWN_ANALYTICS_TTL: int = 300  # 5 minutes
+_KNOWN_ANALYTICS_SIZE: int = 10000
+
+# Event emitted when analytics are deleted, so every pod drops the analytics it knows to be saved
+ANALYTICS_DELETED_EVENT = "analytics_deleted"
+
+# Number of analytic names looked up per search
+_ANALYTIC_LOOKUP_CHUNK_SIZE: int = 100
+
 
 def does_analytic_exist(analytic_id: str) -> bool:
     """Returns true if the analytic_id is already in use."""
@@ -95,6 +111,65 @@ def get_matching_analytics(hits: Union[list[Hit], list[dict[str, Any]]]) -> list
         return []
 
 
+def forget_known_analytics(_payload: Any = None):
+    """Clear the cache of analytics known to be up to date on this pod."""
+    _KNOWN_ANALYTICS.clear()
+
+
+def invalidate_known_analytics():
+    """Clear the cache of analytics known to be up to date on every pod, i.e. after analytics were deleted."""
+    forget_known_analytics()
+    comms_service.emit(ANALYTICS_DELETED_EVENT, {})
+
+
+comms_service.on(ANALYTICS_DELETED_EVENT, forget_known_analytics)
+
+
+def _remember_analytic(analytic: Analytic):
+    "Cache the contributors and detections of an analytic that is known to be saved"
+    if len(_KNOWN_ANALYTICS) >= _KNOWN_ANALYTICS_SIZE:
+        # Evict the oldest entry, dicts being ordered by insertion
+        _KNOWN_ANALYTICS.pop(next(iter(_KNOWN_ANALYTICS)), None)
+
+    _KNOWN_ANALYTICS.pop(analytic.name.lower(), None)
+    _KNOWN_ANALYTICS[analytic.name.lower()] = (
+        time.monotonic() + _KNOWN_ANALYTICS_TTL,
+        set(analytic.contributors),
+        {detection.lower() for detection in analytic.detections},
+    )
+
+
+def _is_analytic_up_to_date(analytic_name: str, hit_group: list[Hit], user: User) -> bool:
+    "Check whether the cached analytic already lists the user as a contributor and every detection of the hits"
+    known = _KNOWN_ANALYTICS.get(analytic_name.lower())
+    if known is None:
+        return False
+
+    expiry, contributors, detections = known
+    if expiry < time.monotonic():
+        _KNOWN_ANALYTICS.pop(analytic_name.lower(), None)
+        return False
+
+    return user.uname in contributors and all(
+        hit.howler.detection.lower() in detections for hit in hit_group if hit.howler.detection
+    )
+
+
+def _get_analytics_by_name(analytic_names: list[str]) -> dict[str, list[Analytic]]:
+    "Fetch the analytics matching any of the given names, grouped by lowercased name"
+    storage = datastore()
+
+    analytics_by_name: dict[str, list[Analytic]] = {}
+    for names in chunked_list(analytic_names, _ANALYTIC_LOOKUP_CHUNK_SIZE):
+        query = " OR ".join(f'"{sanitize_lucene_query(name)}"' for name in names)
+        for analytic in storage.analytic.search(f"name:({query})", rows=storage.analytic.MAX_SEARCH_ROWS, as_obj=True)[
+            "items"
+        ]:
+            analytics_by_name.setdefault(analytic.name.lower(), []).append(analytic)
+
+    return analytics_by_name
+
+
 def save_from_hits(
     hits: Hit | list[Hit],
     user: User,
@@ -102,6 +177,10 @@ def save_from_hits(
 ):
     """Save updates to analytics based on new hits that have been created
 
+    Analytics recently seen with the user as a contributor and all the detections of the hits are skipped entirely.
+    The remaining analytics are fetched with a single search, and the new or changed analytics are saved (and any
+    duplicates removed) with a single bulk request.
+
     Args:
         hits (Hit | list[Hit]): The newly created hit(s) to use to update the analytic entry/entries
         refresh (Literal["true", "false", "wait_for"] | None): Refresh strategy used when saving analytics.
@@ -111,33 +190,48 @@ def save_from_hits(
     if isinstance(hits, Hit):
         hits = [hits]
 
-    # group by analytics for bulk update
-    hits_by_analytic: dict[str, list[Hit]] = {}
+    # group by analytics for bulk update. Analytic names are case insensitive, so the first spelling seen is used.
+    hits_by_analytic: dict[str, tuple[str, list[Hit]]] = {}
     for hit in hits:
-        hits_by_analytic.setdefault(hit.howler.analytic, []).append(hit)
+        hits_by_analytic.setdefault(hit.howler.analytic.lower(), (hit.howler.analytic, []))[1].append(hit)
+
+    pending = {
+        key: group for key, group in hits_by_analytic.items() if not _is_analytic_up_to_date(group[0], group[1], user)
+    }
+
+    if not pending:
+        return
 
-    analytics = []
-    for analytic_name, hit_group in hits_by_analytic.items():
-        analytic_update = _get_analytic_updates_from_hit_group(analytic_name, hit_group, user)
-        if analytic_update:
-            analytics.append(analytic_update)
+    existing_analytics = _get_analytics_by_name([analytic_name for analytic_name, _ in pending.values()])
 
-    if analytics:
-        bulk_plan = storage.analytic.get_bulk_plan()
-        for analytic in analytics:
+    bulk_plan = storage.analytic.get_bulk_plan()
+    analytics: list[Analytic] = []
+    for key, (analytic_name, hit_group) in pending.items():
+        matches = existing_analytics.get(key, [])
+
+        analytic, save = _get_analytic_updates_from_hit_group(analytic_name, hit_group, user, matches)
+        analytics.append(analytic)
+
+        if save:
             bulk_plan.add_index_operation(analytic.analytic_id, analytic)
 
-        storage.analytic.bulk(bulk_plan, refresh=refresh)
+        if len(matches) > 1:
+            logger.warning("Duplicate analytics detected! Removing duplicates...")
+            for duplicate in matches[1:]:
+                bulk_plan.add_delete_operation(duplicate.analytic_id)
 
+    if not bulk_plan.empty and not storage.analytic.bulk(bulk_plan, refresh=refresh):
+        return
 
-def _get_analytic_updates_from_hit_group(analytic_name: str, hit_group: list[Hit], user: User) -> Analytic | None:
-    """Get the new or modified analytic object that should be saved or None if no changes"""
-    storage = datastore()
+    for analytic in analytics:
+        _remember_analytic(analytic)
 
+
+def _get_analytic_updates_from_hit_group(
+    analytic_name: str, hit_group: list[Hit], user: User, existing_analytics: list[Analytic]
+) -> tuple[Analytic, bool]:
+    """Get the new or modified analytic object, and whether it has to be saved"""
     save = False
-    existing_analytics: list[Analytic] = storage.analytic.search(f'name:"{sanitize_lucene_query(analytic_name)}"')[
-        "items"
-    ]
     if len(existing_analytics) > 0:
         analytic: Analytic = existing_analytics[0]
 
@@ -162,11 +256,6 @@ def _get_analytic_updates_from_hit_group(analytic_name: str, hit_group: list[Hit
                 save = True
                 analytic.detections = new_detections
 
-        if len(existing_analytics) > 1:
-            logger.warning("Duplicate analytics detected! Removing duplicates...")
-            for duplicate in existing_analytics[1:]:
-                storage.analytic.delete(duplicate.analytic_id)
-
     else:
         save = True
         analytic = Analytic(
@@ -183,6 +272,4 @@ def _get_analytic_updates_from_hit_group(analytic_name: str, hit_group: list[Hit
             }
         )
 
-    if save:
-        return analytic
-    return None
+    return analytic, save
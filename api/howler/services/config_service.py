@@ -1,3 +1,5 @@
+import hashlib
+import json
 from datetime import datetime
 from math import ceil
 from typing import Optional
@@ -11,7 +13,7 @@ from howler.common.loader import get_lookups
 from howler.common.logging import get_logger
 from howler.config import CLASSIFICATION, config, get_branch, get_commit, get_version
 from howler.helper.discover import get_apps_list
-from howler.helper.search import list_all_fields
+from howler.helper.search import get_fields_catalogue, list_all_fields
 from howler.odm.constants import CaseEscalation
 from howler.odm.models.howler_data import Assessment, Escalation, Scrutiny, Status
 from howler.odm.models.user import User
@@ -132,3 +134,19 @@ def get_configuration(user: User | None, **kwargs):
         "c12nDef": classification_definition,
         "indexes": list_all_fields("admin" in user["type"] if user is not None else False),
     }
+
+
+def get_configuration_etag(user: User | None, configuration: dict) -> str:
+    """Compute an ETag for the configuration returned to a user
+
+    The field listings are identified by their cached hash, so only the remainder of the configuration is serialized.
+
+    Args:
+        user (User): The user making the request
+        configuration (dict): The configuration returned by get_configuration for this user
+    """
+    _, fields_etag = get_fields_catalogue("admin" in user["type"] if user is not None else False)
+
+    remainder = json.dumps({k: v for k, v in configuration.items() if k != "indexes"}, sort_keys=True, default=str)
+
+    return hashlib.sha256(f"{fields_etag}:{remainder}".encode()).hexdigest()
@@ -17,6 +17,7 @@ from opentelemetry import trace
 from howler.common.exceptions import HowlerRuntimeError, InvalidDataException, NotFoundException
 from howler.common.loader import datastore
 from howler.common.logging import get_logger
+from howler.common.metrics import BATCH_DURATION, QUEUE_DEPTH
 from howler.config import CORRELATION_QUEUE_NAME
 from howler.odm.models.case import Case, CaseItem, CaseRule, RuleIndexTypes
 from howler.odm.models.config import config
@@ -354,7 +355,8 @@ def run_worker() -> None:  # pragma: no cover – long-running loop, tested via
 
                 logger.debug("Processing correlation batch of %d hit(s)", len(finalized_batch))
                 try:
-                    added = process_batch(finalized_batch)
+                    with BATCH_DURATION.labels("correlation").time():
+                        added = process_batch(finalized_batch)
                     logger.info(
                         "Correlation batch complete: %d case item(s) added for %d record(s)",
                         added,
@@ -362,5 +364,8 @@ def run_worker() -> None:  # pragma: no cover – long-running loop, tested via
                     )
                 except Exception:
                     logger.exception("Error processing correlation batch %s", ", ".join(finalized_batch))
+
+                # Measured once per batch rather than per item, to spare a redis call on every pop
+                QUEUE_DEPTH.labels("correlation").set(queue.length())
         except Exception:
             logger.exception("Unexpected error in correlation worker loop")
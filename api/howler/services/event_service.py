@@ -11,6 +11,7 @@ from howler.common.logging import get_logger
 from howler.odm.models.ecs.event import ECSEvent
 from howler.odm.models.event import Event
 from howler.odm.models.event import Log as EventLog
+from howler.odm.paths import get_path_table
 from howler.utils.dict_utils import extra_keys, flatten
 from howler.utils.uid import get_random_id
 
@@ -81,12 +82,11 @@ def convert_event(data: dict[str, Any], unique: bool, ignore_extra_values: bool
     except TypeError as e:
         raise HowlerTypeError(str(e), cause=e) from e
 
-    odm_flatten = odm.flat_fields(show_compound=True)
     unused_keys = extra_keys(Event, data)
 
     if unused_keys and not ignore_extra_values:
         raise HowlerValueError(f"Event was created with invalid parameters: {', '.join(unused_keys)}")
-    deprecated_keys = set(key for key in odm_flatten.keys() & data.keys() if odm_flatten[key].deprecated)
+    deprecated_keys = get_path_table(Event).deprecated & data.keys()
 
     warnings = [f"{key} is not currently used by howler." for key in unused_keys]
     warnings.extend(
@@ -31,6 +31,7 @@ from howler.odm.models.ecs.event import ECSEvent
 from howler.odm.models.hit import Hit
 from howler.odm.models.howler_data import HitOperationType, HitStatusTransition, Log, Status
 from howler.odm.models.user import User
+from howler.odm.paths import get_path_table
 from howler.services import action_service, analytic_service, dossier_service, overview_service, template_service
 from howler.utils.dict_utils import extra_keys, flatten
 from howler.utils.uid import get_random_id
@@ -293,12 +294,11 @@ def convert_hit(  # noqa: C901
         raise HowlerTypeError(str(e), cause=e) from e
 
     # Check for deprecated field and unused fields
-    odm_flatten = odm.flat_fields(show_compound=True)
     unused_keys = extra_keys(Hit, data)
 
     if unused_keys and not ignore_extra_values:
         raise HowlerValueError(f"Hit was created with invalid parameters: {', '.join(unused_keys)}")
-    deprecated_keys = set(key for key in odm_flatten.keys() & data.keys() if odm_flatten[key].deprecated)
+    deprecated_keys = get_path_table(Hit).deprecated & data.keys()
 
     warnings = [f"{key} is not currently used by howler." for key in unused_keys]
     warnings.extend(
@@ -355,6 +355,48 @@ def exists(id: str) -> bool:
     return datastore().hit.exists(id)
 
 
+@tracer.start_as_current_span(f"{__name__}.get_existing_hashes")
+def get_existing_hashes(hashes: list[str]) -> set[str]:
+    """Find which of the given hashes are already used by a hit in the datastore.
+
+    Args:
+        hashes: The hashes to look up
+
+    Returns:
+        set[str]: The hashes already in use
+    """
+    if not hashes:
+        return set()
+
+    return datastore().hit.get_existing_values("howler.hash", hashes)
+
+
+@tracer.start_as_current_span(f"{__name__}.remove_existing_hits")
+def remove_existing_hits(hits: list[Hit]) -> tuple[list[Hit], list[str]]:
+    """Remove the hits whose hash is already used, by a stored hit or an earlier hit of the list.
+
+    The hashes of the whole list are looked up at once, rather than one request per hit.
+
+    Args:
+        hits: The hits to filter
+
+    Returns:
+        tuple[list[Hit], list[str]]: The hits to create, and the hashes of the hits that were removed
+    """
+    seen_hashes = get_existing_hashes([hit.howler.hash for hit in hits])
+
+    remaining: list[Hit] = []
+    skipped: list[str] = []
+    for hit in hits:
+        if hit.howler.hash in seen_hashes:
+            skipped.append(hit.howler.hash)
+        else:
+            seen_hashes.add(hit.howler.hash)
+            remaining.append(hit)
+
+    return remaining, skipped
+
+
 @overload
 def get_hit(id: str, as_odm: Literal[True], version: Literal[True]) -> tuple[Hit, str]: ...
 
@@ -743,28 +785,33 @@ DELETED_HITS = Counter(f"{APP_NAME.replace('-', '_')}_deleted_hits_total", "The
 
 
 @tracer.start_as_current_span(f"{__name__}.delete_hits")
-def delete_hits(hit_ids: set[str], refresh: str | None = None) -> bool:
+def delete_hits(hit_ids: set[str], refresh: str | None = None) -> dict[str, str]:
     """Delete a set of hits from the database
 
+    The hits are deleted in bulk, and references to them in howler.related are then removed from all other hits in a
+    single update, no matter how many hits were deleted.
+
     Args:
         hit_ids (set[str]): The IDs of the hits to delete
         refresh (str | None): Whether to refresh the datastore before returning.
 
     Returns:
-        bool: Was the deletion successful?
+        dict[str, str]: The outcome for each hit ID - "deleted", "not_found" or the reason the deletion failed
     """
+    if not hit_ids:
+        return {}
+
     ds = datastore()
 
-    success = True
-    operations: list[OdmUpdateOperation] = []
+    results = ds.hit.delete_many(list(hit_ids), refresh=refresh)
+    deleted = [hit_id for hit_id, result in results.items() if result == "deleted"]
 
-    for hit_id in hit_ids:
-        success = success and ds.hit.delete(hit_id)
-        operations.append(odm_helper.list_remove("howler.related", hit_id, silent=True))
+    ds.hit.remove_list_values("howler.related", list(hit_ids), refresh=refresh)
 
-    ds.hit.update_by_query(f"howler.related:({' OR '.join(hit_ids)})", operations, refresh=refresh)
+    if deleted:
+        DELETED_HITS.inc(len(deleted))
 
-    return success
+    return results
 
 
 @overload
@@ -0,0 +1,142 @@
+"""Conversion of large batches of records to ODMs in a pool of worker processes.
+
+Converting a record flattens and hashes it, then validates every field of its ODM. This is CPU bound, so converting
+thousands of records in the request thread holds the GIL against the other threads of the web worker for seconds.
+Batches of at least VALIDATION_THRESHOLD records are instead split in chunks of VALIDATION_CHUNK_SIZE records,
+converted by a pool of processes shared by all the requests of the web worker. Workers send back validated primitives,
+which are restored into ODMs in the order of the records without being validated again. Smaller batches are converted
+inline, where sending them to another process costs more than it saves.
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+from opentelemetry import trace
+
+from howler.common.exceptions import HowlerException
+from howler.common.logging import get_logger
+from howler.odm.base import Model
+
+logger = get_logger(__file__)
+tracer = trace.get_tracer(__name__)
+
+# Worker processes converting large batches, per web worker. Batches are always converted inline when set to 0.
+VALIDATION_PROCESSES = int(os.environ.get("HWL_VALIDATION_PROCESSES", "2"))
+# Number of records from which a batch is converted by the worker processes
+VALIDATION_THRESHOLD = int(os.environ.get("HWL_VALIDATION_THRESHOLD", "100"))
+# Number of records sent to a worker process at once
+VALIDATION_CHUNK_SIZE = int(os.environ.get("HWL_VALIDATION_CHUNK_SIZE", "50"))
+
+# A service function converting a record, such as hit_service.convert_hit
+Converter = Callable[..., tuple[Model, list[str]]]
+
+# The converted ODM and its warnings, or the error the record was rejected with
+ConversionResult = tuple[Optional[Model], list[str], Optional[HowlerException]]
+
+_pool_lock = threading.Lock()
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _init_worker():
+    "Make the ODMs of a worker process validate the same fields as the ones of the web worker"
+    from howler.datastore.howler_store import modify_odms
+
+    modify_odms()
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+
+    with _pool_lock:
+        if _pool is None:
+            # Worker processes are spawned rather than forked, so they do not inherit the threads and connections of
+            # the web worker
+            _pool = ProcessPoolExecutor(
+                max_workers=VALIDATION_PROCESSES,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+
+        return _pool
+
+
+def _reset_pool(pool: ProcessPoolExecutor):
+    global _pool
+
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _convert(convert: Converter, record: dict[str, Any], unique: bool, ignore_extra_values: bool) -> ConversionResult:
+    try:
+        odm, warnings = convert(record, unique=unique, ignore_extra_values=ignore_extra_values)
+        return odm, warnings, None
+    except HowlerException as e:
+        return None, [], e
+
+
+def _convert_chunk(
+    convert: Converter, records: list[dict[str, Any]], ignore_extra_values: bool
+) -> list[tuple[Optional[type[Model]], Optional[dict[str, Any]], list[str], Optional[HowlerException]]]:
+    "Convert records in a worker process, returning the primitives of their ODM instead of the ODM"
+    results: list[tuple[Optional[type[Model]], Optional[dict[str, Any]], list[str], Optional[HowlerException]]] = []
+    for record in records:
+        # The ids given to records are random, and checked for uniqueness again when the records are saved
+        odm, warnings, error = _convert(convert, record, False, ignore_extra_values)
+
+        if odm is not None:
+            results.append((type(odm), odm.as_primitives(hidden_fields=True), warnings, None))
+        else:
+            # The cause of the error may not be picklable, so only the message is sent back
+            results.append((None, None, warnings, type(error)(error.message) if error else None))
+
+    return results
+
+
+@tracer.start_as_current_span(f"{__name__}.convert_records")
+def convert_records(
+    records: list[dict[str, Any]], convert: Converter, unique: bool, ignore_extra_values: bool = False
+) -> list[ConversionResult]:
+    """Convert a batch of records to ODMs, using the worker processes for large batches.
+
+    Args:
+        records (list[dict[str, Any]]): The records to convert
+        convert (Converter): The service function converting a single record, such as hit_service.convert_hit. It must
+            be importable by the worker processes.
+        unique (bool): Whether to check that the ids given to records converted inline are not used yet. Records
+            converted by the worker processes are only checked when they are saved.
+        ignore_extra_values (bool, optional): Whether to ignore fields missing from the ODM instead of rejecting the
+            record. Defaults to False.
+
+    Returns:
+        list[ConversionResult]: The converted ODM and warnings of each record, or the error it was rejected with, in
+            the order of the records
+    """
+    if VALIDATION_PROCESSES < 1 or len(records) < VALIDATION_THRESHOLD:
+        return [_convert(convert, record, unique, ignore_extra_values) for record in records]
+
+    chunk_size = max(VALIDATION_CHUNK_SIZE, 1)
+    pool = _get_pool()
+    try:
+        futures = [
+            pool.submit(_convert_chunk, convert, records[start : start + chunk_size], ignore_extra_values)
+            for start in range(0, len(records), chunk_size)
+        ]
+        chunks = [future.result() for future in futures]
+    except BrokenProcessPool:
+        logger.exception("Validation worker died, converting %s records inline", len(records))
+        _reset_pool(pool)
+        return [_convert(convert, record, unique, ignore_extra_values) for record in records]
+
+    return [
+        (model.restore(primitives) if model and primitives is not None else None, warnings, error)
+        for chunk in chunks
+        for model, primitives, warnings, error in chunk
+    ]
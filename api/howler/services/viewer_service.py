@@ -1,43 +1,120 @@
 """Viewer service for tracking active viewers of entities (hits, cases, events) in Redis.
 
-Stores viewer presence as ephemeral Redis sets with TTL, replacing the
-previous approach of persisting viewers directly in the ODM/ElasticSearch.
+Stores viewer presence as a per-entity Redis sorted set of usernames scored by their last heartbeat, replacing the
+previous approach of persisting viewers directly in the ODM/ElasticSearch. Viewers whose heartbeat is older than
+VIEWER_TIMEOUT are pruned, and viewers_update events are coalesced so each entity emits at most one per
+VIEWER_EMIT_INTERVAL.
 """
 
+import threading
+import time
+
 from howler.config import redis
 from howler.remote.datatypes import retry_call
 from howler.services import comms_service
 
-VIEWER_KEY_PREFIX = "viewers"
-VIEWER_TTL = 3600  # 1 hour
+# Distinct from the "viewers" sets used previously, so keys left over from them do not clash with the sorted sets
+VIEWER_KEY_PREFIX = "viewer_presence"
+VIEWER_TIMEOUT = 60  # Seconds without a heartbeat before a viewer is dropped
+VIEWER_HEARTBEAT_INTERVAL = 20  # Seconds between heartbeats sent for each open viewer
+VIEWER_EMIT_INTERVAL = 1.0  # Minimum seconds between two viewers_update events for an entity
+
+# Prunes stale viewers, applies the operation and returns whether the viewers changed, followed by the viewers, in a
+# single round trip
+presence_script = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local timeout = tonumber(ARGV[2])
+local operation = ARGV[3]
+local username = ARGV[4]
+local changed = redis.call('zremrangebyscore', key, '-inf', now - timeout)
+if operation == 'add' then
+    changed = changed + redis.call('zadd', key, now, username)
+    redis.call('expire', key, timeout)
+elseif operation == 'remove' then
+    changed = changed + redis.call('zrem', key, username)
+end
+local viewers = redis.call('zrange', key, 0, -1)
+table.insert(viewers, 1, changed)
+return viewers
+"""
+
+_emit_lock = threading.Lock()
+# Latest viewers of entities whose update is waiting for VIEWER_EMIT_INTERVAL to elapse
+_pending: dict[str, list[str]] = {}
+_last_emit: dict[str, float] = {}
 
 
 def _key(entity_id: str) -> str:
     return f"{VIEWER_KEY_PREFIX}:{entity_id}"
 
 
+def _update_presence(entity_id: str, operation: str, username: str = "") -> tuple[bool, list[str]]:
+    result = retry_call(
+        redis.register_script(presence_script),
+        keys=[_key(entity_id)],
+        args=[time.time(), VIEWER_TIMEOUT, operation, username],
+    )
+
+    return bool(result[0]), sorted(m.decode() if isinstance(m, bytes) else m for m in result[1:])
+
+
 def add_viewer(entity_id: str, username: str) -> None:
     """Record that a user is viewing the given entity."""
-    key = _key(entity_id)
-    retry_call(redis.sadd, key, username)
-    retry_call(redis.expire, key, VIEWER_TTL)
-    _emit_update(entity_id)
+    changed, viewers = _update_presence(entity_id, "add", username)
+    if changed:
+        _emit_update(entity_id, viewers)
+
+
+def heartbeat(entity_id: str, username: str) -> None:
+    """Record that a user is still viewing the given entity."""
+    add_viewer(entity_id, username)
 
 
 def remove_viewer(entity_id: str, username: str) -> None:
     """Record that a user has stopped viewing the given entity."""
-    retry_call(redis.srem, _key(entity_id), username)
-    _emit_update(entity_id)
+    changed, viewers = _update_presence(entity_id, "remove", username)
+    if changed:
+        _emit_update(entity_id, viewers)
 
 
 def get_viewers(entity_id: str) -> list[str]:
     """Return the list of usernames currently viewing the given entity."""
-    members = retry_call(redis.smembers, _key(entity_id))
-    return sorted(m.decode() if isinstance(m, bytes) else m for m in members)
+    changed, viewers = _update_presence(entity_id, "list")
+    if changed:
+        _emit_update(entity_id, viewers)
 
+    return viewers
 
-def _emit_update(entity_id: str) -> None:
-    comms_service.emit(
-        "viewers_update",
-        {"id": entity_id, "viewers": get_viewers(entity_id)},
-    )
+
+def _flush_update(entity_id: str) -> None:
+    with _emit_lock:
+        viewers = _pending.pop(entity_id)
+        _last_emit[entity_id] = time.monotonic()
+
+    comms_service.emit("viewers_update", {"id": entity_id, "viewers": viewers})
+
+
+def _emit_update(entity_id: str, viewers: list[str]) -> None:
+    now = time.monotonic()
+
+    with _emit_lock:
+        if entity_id in _pending:
+            # An update is already scheduled, it will carry these viewers instead
+            _pending[entity_id] = viewers
+            return
+
+        for stale_id in [key for key, last in _last_emit.items() if now - last >= VIEWER_EMIT_INTERVAL]:
+            del _last_emit[stale_id]
+
+        delay = _last_emit.get(entity_id, now - VIEWER_EMIT_INTERVAL) + VIEWER_EMIT_INTERVAL - now
+        if delay > 0:
+            _pending[entity_id] = viewers
+            timer = threading.Timer(delay, _flush_update, args=(entity_id,))
+            timer.daemon = True
+            timer.start()
+            return
+
+        _last_emit[entity_id] = now
+
+    comms_service.emit("viewers_update", {"id": entity_id, "viewers": viewers})
@@ -79,37 +79,38 @@ def flatten(data: _Mapping, parent_key: Optional[str] = None, odm: Optional[type
     Args:
         data: The mapping to flatten
         parent_key: Optional parent key for nested flattening
-        odm: Optional ODM model for field validation
+        odm: Optional ODM model for field validation. Dicts under keys that are not the parent of a field of the model
+            are kept as they are.
 
     Returns:
         Flattened dictionary with dot-notation keys
     """
-    # Pre-compute ODM valid keys if provided
-    valid_keys_set: set[str] | None = None
+    prefixes: frozenset[str] | None = None
     if odm:
-        valid_keys_set = set(odm.flat_fields().keys())
+        from howler.odm.paths import get_path_table
 
-    def _flatten_recursive(mapping: _Mapping, prefix: str = "") -> dict[str, Any]:
-        """Inner recursive function for flattening."""
-        result = {}
+        table = get_path_table(odm)
+        if table.paths:
+            prefixes = table.prefixes
 
-        for key, value in mapping.items():
+    result: dict[str, Any] = {}
+
+    # Walk the mapping depth first with a stack of iterators, keeping the order of the keys
+    stack = [(parent_key or "", iter(data.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for key, value in items:
             current_key = f"{prefix}.{key}" if prefix else key
 
-            if isinstance(value, dict):
-                # ODM validation check
-                if valid_keys_set and not any(valid_key.startswith(f"{current_key}.") for valid_key in valid_keys_set):
-                    result[current_key] = value
-                else:
-                    # Recursively flatten and merge
-                    result.update(_flatten_recursive(value, current_key))
-            else:
-                result[current_key] = value
+            if isinstance(value, dict) and (prefixes is None or current_key in prefixes):
+                stack.append((current_key, iter(value.items())))
+                break
 
-        return result
+            result[current_key] = value
+        else:
+            stack.pop()
 
-    flattened = _flatten_recursive(data, parent_key or "")
-    return flattened
+    return result
 
 
 def flatten_deep(data: _Mapping):
@@ -155,30 +156,11 @@ def unflatten(data: _Mapping) -> _Mapping:
 
 def extra_keys(odm: type["Model"], data: _Mapping) -> set[str]:
     "Geta list of extra keys when compared to a list of permitted keys"
-    from howler.odm.base import Mapping, Optional
-
-    data = flatten_deep(data)
+    from howler.odm.paths import get_path_table
 
-    result: set[str] = set()
-    for key in data.keys():
-        parts = key.split(".")
-        current_odm = odm
-        for part in parts:
-            sub_fields: dict[str, Any] = current_odm.fields()
+    table = get_path_table(odm)
 
-            if part in sub_fields:
-                current_odm = sub_fields[part]
-            else:
-                if isinstance(current_odm, Optional):
-                    current_odm = current_odm.child_type
-
-                if isinstance(current_odm, Mapping):
-                    current_odm = current_odm.child_type
-                else:
-                    result.add(key)
-                    break
-
-    return result
+    return {key for key in flatten_deep(data).keys() if not table.is_known(key)}
 
 
 def prune(  # noqa: C901
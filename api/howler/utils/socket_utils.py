@@ -43,3 +43,13 @@ def check_action(
         outstanding_actions = [a for a in outstanding_actions if a[1] != "stop_viewing"]
 
     return outstanding_actions
+
+
+def send_heartbeats(outstanding_actions: list[tuple[str, str, bool]], **kwargs) -> None:
+    """Refresh the presence of the user on every entity they are still viewing
+
+    Args:
+        outstanding_actions (list[tuple[str, str, bool]]): The actions that must be run after the user is disconnected
+    """
+    for id in {id for id, action, _ in outstanding_actions if action == "stop_viewing"}:
+        viewer_service.heartbeat(id, kwargs["username"])
@@ -0,0 +1,123 @@
+"""Standalone background worker, running the cronjobs and queue consumers outside of the API's web workers.
+
+The main process competes for the scheduler leader lease and runs the scheduled jobs (retention, view cleanup, ...)
+while it holds it, so they run once per cluster however many workers are deployed. It also supervises a pool of
+consumer processes, each draining the correlation and action queues, which scale independently of the API replicas.
+"""
+
+import argparse
+import multiprocessing
+import os
+import signal
+import sys
+import threading
+from pathlib import Path
+from typing import Any
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Plugins may provide cronjobs and actions, so they are made importable the same way as in the API
+sys.path.insert(0, str(Path(os.environ.get("HWL_PLUGIN_DIRECTORY", "/etc/howler/plugins"))))
+
+from howler.common.logging import get_logger  # noqa: E402
+
+logger = get_logger(__file__)
+
+# Seconds between checks that every consumer process is still alive
+SUPERVISE_INTERVAL = 5
+
+
+def _wait_for_signal() -> threading.Event:
+    "Return an event that is set once this process receives SIGTERM or SIGINT"
+    stop = threading.Event()
+
+    def _handle(signum, _frame):
+        logger.info("Received signal %s, stopping", signum)
+        stop.set()
+
+    signal.signal(signal.SIGTERM, _handle)
+    signal.signal(signal.SIGINT, _handle)
+
+    return stop
+
+
+def run_consumers() -> None:  # pragma: no cover - long-running process
+    "Start the queue consumer threads in this process and keep them running until it is asked to stop"
+    stop = _wait_for_signal()
+
+    import howler.services.comms_service as comms_service
+    from howler.cronjobs import setup_jobs
+
+    # Consumers cache actions and users, and drop them when other pods report changes
+    comms_service.start_watcher()
+    setup_jobs(scheduled=False)
+
+    stop.wait()
+
+
+def _start_consumer(context: Any, index: int) -> Any:
+    process = context.Process(target=run_consumers, name=f"howler-consumer-{index}", daemon=True)
+    process.start()
+    logger.info("Started consumer process %s (pid %s)", process.name, process.pid)
+    return process
+
+
+def main() -> int:  # pragma: no cover - long-running process
+    """Run the scheduled jobs on the elected leader and supervise the consumer processes."""
+    parser = argparse.ArgumentParser(description="Run Howler's scheduled jobs and queue consumers.")
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=int(os.environ.get("HWL_WORKER_PROCESSES", "1")),
+        help="Consumer processes to run. Use 0 to only run scheduled jobs (default: HWL_WORKER_PROCESSES or 1).",
+    )
+    parser.add_argument(
+        "--no-scheduler",
+        action="store_true",
+        help="Do not compete for the scheduler lease, and only run the queue consumers.",
+    )
+    args = parser.parse_args()
+
+    if args.processes < 0:
+        parser.error("--processes must not be negative.")
+
+    stop = _wait_for_signal()
+
+    from howler.common.metrics import get_registry, mark_process_dead
+
+    if metrics_port := os.environ.get("HWL_WORKER_METRICS_PORT"):
+        from prometheus_client import start_http_server
+
+        start_http_server(int(metrics_port), registry=get_registry())
+
+    # Consumer processes are spawned rather than forked, so they do not inherit the connections of this process
+    context = multiprocessing.get_context("spawn")
+    consumers = [_start_consumer(context, index) for index in range(args.processes)]
+
+    from howler.cronjobs import setup_jobs, stop_jobs
+
+    if not args.no_scheduler:
+        setup_jobs(consumers=False)
+
+    try:
+        while not stop.wait(SUPERVISE_INTERVAL):
+            for index, process in enumerate(consumers):
+                if not process.is_alive():
+                    logger.error("Consumer process %s exited with code %s, restarting", process.name, process.exitcode)
+                    mark_process_dead(process.pid)
+                    consumers[index] = _start_consumer(context, index)
+    finally:
+        stop_jobs()
+
+        for process in consumers:
+            process.terminate()
+        for process in consumers:
+            process.join(timeout=30)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -86,6 +86,57 @@ def test_facet_search(datastore, login_session):
             assert isinstance(v, int)
 
 
+def test_aggregate(datastore, login_session):
+    """A single aggregate request returns the same results as the individual facet and stats endpoints."""
+    session, host = login_session
+
+    resp = get_api_data(
+        session,
+        f"{host}/api/v2/search/aggregate/hit",
+        method="POST",
+        data=json.dumps(
+            {
+                "query": "howler.id:*",
+                "aggs": {
+                    "status": {"type": "facet", "field": "howler.status"},
+                    "analytics": {"type": "terms", "field": "howler.analytic", "sort": "_key asc"},
+                    "created": {"type": "histogram", "field": "event.created", "start": "now-1y", "gap": "30d"},
+                    "score": {"type": "stats", "field": "howler.score"},
+                },
+            }
+        ),
+    )
+
+    facet_resp = get_api_data(
+        session, f"{host}/api/v2/search/facet/hit", params={"query": "howler.id:*", "fields": "howler.status"}
+    )
+    assert resp["status"] == facet_resp["howler.status"]
+
+    analytics = [row["value"] for row in resp["analytics"]]
+    assert analytics == sorted(analytics)
+
+    assert isinstance(resp["created"], dict)
+    assert resp["score"]["count"] <= datastore.hit.search("howler.id:*", rows=0)["total"]
+
+    with pytest.raises(APIError) as api_err:
+        get_api_data(
+            session,
+            f"{host}/api/v2/search/aggregate/hit",
+            method="POST",
+            data=json.dumps({"aggs": {"bad": {"type": "facet", "field": "not.a.field"}}}),
+        )
+    assert "400" in str(api_err)
+
+    with pytest.raises(APIError) as api_err:
+        get_api_data(
+            session,
+            f"{host}/api/v2/search/aggregate/hit",
+            method="POST",
+            data=json.dumps({"aggs": {"bad": {"type": "facet", "field": ["howler.status"]}}}),
+        )
+    assert "400" in str(api_err)
+
+
 def test_search(datastore, login_session):
     session, host = login_session
 
@@ -17,6 +17,7 @@ from howler.common.exceptions import HowlerInvalidParameterException
 from howler.datastore.collection import ESCollection
 from howler.odm import random_data
 from howler.odm.models.hit import Hit
+from howler.services import analytic_service
 
 _TEST_TOKEN = f"Basic {base64.b64encode(b'admin:devkey:admin').decode('utf-8')}"
 
@@ -72,9 +73,13 @@ class SpyCollection:
         self._record_write("delete_by_search_object", refresh)
         return self.wrapped_collection.delete_by_search_object(query, sort, max_docs, refresh)
 
-    def update_by_query(self, query, operations, filters=None, access_control=None, max_docs=None, refresh=None):
+    def update_by_query(
+        self, query, operations, filters=None, access_control=None, max_docs=None, refresh=None, **kwargs
+    ):
         self._record_write("update_by_query", refresh)
-        return self.wrapped_collection.update_by_query(query, operations, filters, access_control, max_docs, refresh)
+        return self.wrapped_collection.update_by_query(
+            query, operations, filters, access_control, max_docs, refresh, **kwargs
+        )
 
 
 @pytest.fixture(autouse=True, scope="function")
@@ -150,6 +155,7 @@ def tool_hit_raw_hit(datastore_connection):
 
     datastore_connection.hit.delete_by_query("howler.analytic:tool-refresh-forwarding", refresh="true")
     datastore_connection.analytic.delete_by_query("name:tool-refresh-forwarding", refresh="true")
+    analytic_service.forget_known_analytics()
 
 
 @pytest.fixture(scope="function")
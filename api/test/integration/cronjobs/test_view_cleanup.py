@@ -37,6 +37,7 @@ def datastore(datastore_connection):
                 "config": '{"limit":3,"viewId":"7h1515n074r34lv13w"}',
             }
         )
+        u.favourite_views = [view.view_id, "7h1515n074r34lv13w"]
         ds.user.save(u.uname, u)
         ds.user_avatar.save(u.uname, AVATAR)
 
@@ -60,8 +61,10 @@ def test_view_cleanup(datastore, login_session):
 
     assert resp["uname"] == new_user["uname"]
     assert len(resp["dashboard"]) == 2
+    assert len(resp["favourite_views"]) == 2
 
     execute()  # Executes the view_cleanup cronjob
 
     resp = get_api_data(session, f"{host}/api/v1/user/{username}/")
     assert len(resp["dashboard"]) == 1  # Our non-existent view is removed but our valid one remains
+    assert len(resp["favourite_views"]) == 1
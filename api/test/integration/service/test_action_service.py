@@ -72,6 +72,8 @@ def test_execute_action(datastore_connection: HowlerDatastore):
 
     datastore_connection.action.save(action_demote.action_id, action_demote)
 
+    action_service.invalidate_action_cache(action_demote.action_id)
+
     # Create actions
     action_promote = Action(
         {
@@ -90,6 +92,8 @@ def test_execute_action(datastore_connection: HowlerDatastore):
 
     datastore_connection.action.save(action_promote.action_id, action_promote)
 
+    action_service.invalidate_action_cache(action_promote.action_id)
+
     datastore_connection.action.commit()
 
     assert datastore_connection.action.exists(action_demote.action_id)
@@ -121,9 +125,11 @@ def test_execute_action(datastore_connection: HowlerDatastore):
 
     datastore_connection.hit.delete(test_hit_demote.howler.id)
     datastore_connection.action.delete(action_demote.action_id)
+    action_service.invalidate_action_cache(action_demote.action_id)
 
     datastore_connection.hit.delete(test_hit_promote.howler.id)
     datastore_connection.action.delete(action_promote.action_id)
+    action_service.invalidate_action_cache(action_promote.action_id)
 
 
 def test_execute_action_no_results(datastore_connection: HowlerDatastore):
@@ -153,6 +159,8 @@ def test_execute_action_no_results(datastore_connection: HowlerDatastore):
     )
 
     datastore_connection.action.save(test_action.action_id, test_action)
+
+    action_service.invalidate_action_cache(test_action.action_id)
     datastore_connection.action.commit()
     assert datastore_connection.action.exists(test_action.action_id)
 
@@ -173,6 +181,7 @@ def test_execute_action_no_results(datastore_connection: HowlerDatastore):
 
     datastore_connection.hit.delete(test_hit.howler.id)
     datastore_connection.action.delete(test_action.action_id)
+    action_service.invalidate_action_cache(test_action.action_id)
 
 
 def test_process_action_batch_create_trigger(datastore_connection: HowlerDatastore, caplog):
@@ -207,6 +216,7 @@ def test_process_action_batch_create_trigger(datastore_connection: HowlerDatasto
         }
     )
     datastore_connection.action.save(action.action_id, action)
+    action_service.invalidate_action_cache(action.action_id)
     datastore_connection.action.commit()
     datastore_connection.hit.commit()
 
@@ -225,6 +235,7 @@ def test_process_action_batch_create_trigger(datastore_connection: HowlerDatasto
 
     datastore_connection.hit.delete(test_hit.howler.id)
     datastore_connection.action.delete(action.action_id)
+    action_service.invalidate_action_cache(action.action_id)
 
 
 def test_process_action_batch_no_matching_action(datastore_connection: HowlerDatastore, caplog):
@@ -256,6 +267,7 @@ def test_process_action_batch_no_matching_action(datastore_connection: HowlerDat
         }
     )
     datastore_connection.action.save(action.action_id, action)
+    action_service.invalidate_action_cache(action.action_id)
     datastore_connection.action.commit()
     datastore_connection.hit.commit()
 
@@ -275,6 +287,7 @@ def test_process_action_batch_no_matching_action(datastore_connection: HowlerDat
 
     datastore_connection.hit.delete(test_hit.howler.id)
     datastore_connection.action.delete(action.action_id)
+    action_service.invalidate_action_cache(action.action_id)
 
 
 def test_process_action_batch_coalesces_duplicates(datastore_connection: HowlerDatastore, caplog):
@@ -316,6 +329,7 @@ def test_process_action_batch_coalesces_duplicates(datastore_connection: HowlerD
         }
     )
     datastore_connection.action.save(action.action_id, action)
+    action_service.invalidate_action_cache(action.action_id)
     datastore_connection.action.commit()
     datastore_connection.hit.commit()
 
@@ -339,3 +353,4 @@ def test_process_action_batch_coalesces_duplicates(datastore_connection: HowlerD
     datastore_connection.hit.delete(hit1.howler.id)
     datastore_connection.hit.delete(hit2.howler.id)
     datastore_connection.action.delete(action.action_id)
+    action_service.invalidate_action_cache(action.action_id)
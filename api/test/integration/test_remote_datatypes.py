@@ -417,19 +417,29 @@ def test_user_quota_tracker(redis_connection):
         uqt = UserQuotaTracker("test-quota", timeout=timeout)
 
         # First 0 to max_quota items should succeed
-        for _ in range(max_quota):
-            assert uqt.begin(name, max_quota) is True
+        tokens = [uqt.begin(name, max_quota) for _ in range(max_quota)]
+        assert all(tokens)
+        assert len(set(tokens)) == max_quota
 
         # All other items should fail until items timeout
         for _ in range(max_quota):
-            assert uqt.begin(name, max_quota) is False
+            assert uqt.begin(name, max_quota) is None
 
         # if you remove and item only one should be able to go in
-        uqt.end(name)
-        assert uqt.begin(name, max_quota) is True
-        assert uqt.begin(name, max_quota) is False
+        uqt.end(name, tokens[1])
+        assert uqt.begin(name, max_quota)
+        assert uqt.begin(name, max_quota) is None
+
+        # Ending a request must release its own slot, not the oldest one
+        assert uqt.c.zscore(uqt._queue_name(name), tokens[0]) is not None
+        assert uqt.c.zscore(uqt._queue_name(name), tokens[1]) is None
 
         # if you wait the timeout, all items can go in
         time.sleep(timeout + 1)
         for _ in range(max_quota):
-            assert uqt.begin(name, max_quota) is True
+            assert uqt.begin(name, max_quota)
+
+        # Keys left behind with the wrong type are replaced instead of raising
+        uqt.c.delete(uqt._queue_name(name))
+        uqt.c.set(uqt._queue_name(name), "legacy")
+        assert uqt.begin(name, max_quota)
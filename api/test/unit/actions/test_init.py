@@ -2,7 +2,8 @@ import os
 from pathlib import Path
 from unittest.mock import patch
 
-from howler.actions import execute, specifications
+import howler.actions as actions
+from howler.actions import check_hit_limit, execute, specifications
 from howler.config import config
 from howler.odm.models.user import User
 from howler.odm.randomizer import random_model_obj
@@ -133,3 +134,54 @@ def test_execute_user_with_both_basic_and_advanced_roles(mock_ds):
 
     # Should use advanced limit, so 50 hits should be allowed
     assert all(r["title"] != "Hit limit exceeded" for r in result)
+
+
+def test_operations_imported_once():
+    actions._get_operation("add_label")
+
+    with patch("howler.actions.importlib.import_module") as import_module:
+        assert actions._get_operation("add_label").OPERATION_ID == "add_label"
+        assert actions._get_operation("example_plugin").OPERATION_ID == "example_plugin"
+        assert actions._get_operation("doesntexist") is None
+        specifications()
+
+    import_module.assert_not_called()
+
+
+def test_specifications_cached():
+    first = specifications()
+    first.clear()
+
+    with patch.object(actions, "_get_operations") as get_operations:
+        second = specifications()
+
+    get_operations.assert_not_called()
+    assert second
+    assert all(spec["id"] != "example_plugin" for spec in second)
+
+
+@patch("howler.actions.datastore")
+def test_hit_limit_uses_known_count(mock_ds):
+    user: User = random_model_obj(User)
+    user.type = ["user", "actionrunner_basic"]
+
+    assert check_hit_limit("howler.id:*", user, 20, 1000, hit_count=20) is None
+
+    result = check_hit_limit("howler.id:*", user, 20, 1000, hit_count=21)
+    assert result is not None
+    assert "affects 21 hits" in result["message"]
+
+    mock_ds.return_value.hit.search.assert_not_called()
+
+
+@patch("howler.actions.datastore")
+def test_hit_limit_count_bounded(mock_ds):
+    user: User = random_model_obj(User)
+    user.type = ["user", "actionrunner_basic"]
+    mock_ds.return_value.hit.search.return_value = {"total": 21}
+
+    result = check_hit_limit("howler.id:*", user, 20, 1000)
+
+    assert result is not None
+    assert "affects at least 21 hits" in result["message"]
+    assert mock_ds.return_value.hit.search.call_args.kwargs["track_total_hits"] == 21
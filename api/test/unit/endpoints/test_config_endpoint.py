@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 from flask import Flask
 from flask import Response as FlaskResponse
@@ -23,3 +25,28 @@ def test_configs(request_context):
         assert "configuration" in response.get_json()["api_response"]
 
         assert "mapping" in response.get_json()["api_response"]["configuration"]
+
+
+def test_configs_etag(request_context):
+    configuration = {"configuration": {"mapping": {}}, "indexes": {"hit": {}}}
+
+    with (
+        patch("howler.services.config_service.get_configuration", return_value=configuration),
+        patch("howler.services.config_service.get_fields_catalogue", return_value=({"hit": {}}, "fields")),
+    ):
+        with request_context.test_request_context():
+            response: FlaskResponse = configs()
+
+        assert response.status_code == 200
+        etag, _ = response.get_etag()
+        assert etag
+        assert response.headers["Cache-Control"] == "private, no-cache"
+
+        with request_context.test_request_context(headers={"If-None-Match": f'"{etag}"'}):
+            response = configs()
+
+        assert response.status_code == 304
+        assert response.get_etag()[0] == etag
+
+        with request_context.test_request_context(headers={"If-None-Match": '"stale"'}):
+            assert configs().status_code == 200
@@ -0,0 +1,83 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import howler.helper.search as search
+from howler.datastore.collection import ESCollection
+
+
+@pytest.fixture
+def collections():
+    hit = MagicMock()
+    hit.fields.return_value = {"howler.id": {"type": "keyword"}}
+    user = MagicMock()
+    user.fields.return_value = {"uname": {"type": "keyword"}}
+
+    search.forget_cached_fields()
+    with (
+        patch.dict(search.INDEX_MAP, {"hit": lambda: hit}, clear=True),
+        patch.dict(search.ADMIN_INDEX_MAP, {"user": lambda: user}, clear=True),
+    ):
+        yield hit, user
+    search.forget_cached_fields()
+
+
+def test_fields_catalogue_is_cached_per_admin_status(collections):
+    """Field listings are computed once for admins and once for everyone else."""
+    hit, user = collections
+
+    fields, etag = search.get_fields_catalogue(False)
+    assert fields == {"hit": {"howler.id": {"type": "keyword"}}}
+    assert search.get_fields_catalogue(False) == (fields, etag)
+
+    admin_fields, admin_etag = search.get_fields_catalogue(True)
+    assert set(admin_fields) == {"hit", "user"}
+    assert admin_etag != etag
+    assert search.list_all_fields(True) is admin_fields
+
+    assert hit.fields.call_count == 2
+    assert user.fields.call_count == 1
+
+
+def test_fields_catalogue_expires(collections):
+    """Listings are reloaded once their TTL elapses."""
+    hit, _ = collections
+
+    with patch.object(search.time, "monotonic", return_value=1000):
+        search.get_fields_catalogue()
+
+    with patch.object(search.time, "monotonic", return_value=1000 + search._FIELDS_CACHE_TTL + 1):
+        search.get_fields_catalogue()
+
+    assert hit.fields.call_count == 2
+
+
+def test_mapping_change_invalidates_every_pod(collections):
+    """A mapping change drops the local listings and tells other pods to drop theirs."""
+    hit, _ = collections
+    assert search.invalidate_fields_cache in ESCollection.MAPPING_CHANGE_LISTENERS
+
+    _, etag = search.get_fields_catalogue()
+    hit.fields.return_value = {"howler.id": {"type": "keyword"}, "howler.new": {"type": "text"}}
+
+    with patch.object(search.comms_service, "emit") as emit:
+        collection = MagicMock(spec=ESCollection)
+        collection.name = "howler-hit"
+        ESCollection._mapping_changed(collection)
+
+    emit.assert_called_once_with(search.FIELDS_CHANGED_EVENT, {"collection": "howler-hit"})
+
+    fields, new_etag = search.get_fields_catalogue()
+    assert "howler.new" in fields["hit"]
+    assert new_etag != etag
+
+
+def test_invalidation_event_drops_cached_listings(collections):
+    """Listings are reloaded after another pod reports a mapping change."""
+    hit, _ = collections
+
+    search.get_fields_catalogue()
+    search.forget_cached_fields({"collection": "howler-hit"})
+    search.get_fields_catalogue()
+
+    assert hit.fields.call_count == 2
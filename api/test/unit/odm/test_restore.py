@@ -0,0 +1,121 @@
+import datetime
+
+import pytest
+
+from howler import odm
+from howler.common.exceptions import HowlerKeyError, HowlerValueError
+from howler.odm.base import TypedList, TypedMapping
+from howler.odm.models.action import Action
+from howler.odm.models.analytic import Analytic
+from howler.odm.models.hit import Hit
+from howler.odm.models.template import Template
+from howler.odm.models.user import User
+from howler.odm.models.view import View
+from howler.odm.randomizer import random_model_obj
+
+
+@odm.model()
+class InnerModel(odm.Model):
+    timestamp = odm.Date()
+    tags = odm.List(odm.Keyword(), default=[])
+
+
+@odm.model()
+class RestoredModel(odm.Model):
+    keyword = odm.Keyword()
+    score = odm.Float()
+    timestamp = odm.Date()
+    optional_timestamp = odm.Optional(odm.Date())
+    default_keyword = odm.Keyword(default="default")
+    inner = odm.Compound(InnerModel)
+    inners = odm.List(odm.Compound(InnerModel), default=[])
+    timestamps = odm.Mapping(odm.Date(), default={})
+    flattened = odm.FlattenedObject(default={})
+
+
+def assert_same(expected, actual, path):
+    assert type(expected) is type(actual), path
+
+    if isinstance(expected, odm.Model):
+        assert expected._odm_py_obj.keys() == actual._odm_py_obj.keys(), path
+        assert expected.unused_keys == actual.unused_keys, path
+        for key, value in expected._odm_py_obj.items():
+            assert_same(value, actual._odm_py_obj[key], f"{path}.{key}")
+    elif isinstance(expected, list):
+        if isinstance(expected, TypedList):
+            assert (expected.type, expected.context) == (actual.type, actual.context), path
+
+        assert len(expected) == len(actual), path
+        for index, (value, other) in enumerate(zip(expected, actual)):
+            assert_same(value, other, f"{path}[{index}]")
+    elif isinstance(expected, dict):
+        if isinstance(expected, TypedMapping):
+            assert (expected.type, expected.index, expected.store, expected.sanitizer, expected.context) == (
+                actual.type,
+                actual.index,
+                actual.store,
+                actual.sanitizer,
+                actual.context,
+            ), path
+
+        assert expected.keys() == actual.keys(), path
+        for key, value in expected.items():
+            assert_same(value, actual[key], f"{path}.{key}")
+    else:
+        assert expected == actual, path
+
+
+def test_restore():
+    data = {
+        "keyword": "value",
+        "score": 1.5,
+        "timestamp": "2026-01-01T00:00:00.000000Z",
+        "inner": {"timestamp": "2026-01-01T12:30:00.123456Z"},
+        "inners": [{"timestamp": "2026-01-02T00:00:00.000000Z", "tags": ["a", "b"]}],
+        "timestamps": {"key": "2026-01-03T00:00:00.000000Z"},
+        "flattened": {"a.b": "c"},
+        "unknown": "kept aside",
+    }
+
+    restored = RestoredModel.restore(data)
+
+    assert restored.timestamp == datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)
+    assert restored.inner.timestamp == datetime.datetime(2026, 1, 1, 12, 30, 0, 123456, tzinfo=datetime.timezone.utc)
+    assert restored.optional_timestamp is None
+    assert restored.default_keyword == "default"
+    assert restored.inner.tags == []
+    assert restored.unused_keys == {"unknown"}
+    assert_same(RestoredModel(data), restored, "restoredmodel")
+
+    with pytest.raises(HowlerKeyError):
+        restored.unknown_attribute = "value"
+
+
+def test_restore_does_not_validate():
+    restored = RestoredModel.restore(
+        {
+            "keyword": ["not", "a", "keyword"],
+            "score": 1.0,
+            "timestamp": "2026-01-01T00:00:00.000000Z",
+            "inner": {"timestamp": "2026-01-01T00:00:00.000000Z"},
+        }
+    )
+
+    assert restored.keyword == ["not", "a", "keyword"]
+
+
+def test_restore_missing_required_value():
+    with pytest.raises(HowlerValueError):
+        RestoredModel.restore({"keyword": "value", "score": 1.0, "inner": {}})
+
+
+@pytest.mark.parametrize("model", [Hit, Analytic, User, View, Template, Action])
+def test_restore_matches_validation(model):
+    for _ in range(10):
+        primitives = random_model_obj(model).as_primitives(hidden_fields=True)
+
+        expected = model(primitives)
+        restored = model.restore(primitives)
+
+        assert_same(expected, restored, model.__name__.lower())
+        assert restored.as_primitives(hidden_fields=True) == expected.as_primitives(hidden_fields=True)
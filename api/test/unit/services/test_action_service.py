@@ -0,0 +1,111 @@
+"""Unit tests for the cached, trigger-indexed automated actions and the single request applicability check."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from howler.odm.models.action import Action
+from howler.services import action_service
+
+
+@pytest.fixture(autouse=True)
+def storage():
+    action_service.forget_cached_actions()
+    with (
+        patch("howler.services.action_service.datastore") as datastore,
+        patch("howler.services.action_service.actions") as actions,
+        patch("howler.services.action_service.audit"),
+    ):
+        actions.execute.return_value = []
+        storage = datastore.return_value
+        storage.action.search.return_value = {"items": []}
+        storage.hit.count_many.side_effect = lambda queries: [1] * len(queries)
+        yield storage
+    action_service.forget_cached_actions()
+
+
+def _action(name: str, triggers: list[str], query: str = "howler.id:*") -> Action:
+    return Action(
+        {
+            "name": name,
+            "owner_id": "admin",
+            "query": query,
+            "triggers": triggers,
+            "operations": [{"operation_id": "add_label", "data_json": '{"category": "generic", "label": "a"}'}],
+        }
+    )
+
+
+def test_actions_indexed_by_trigger(storage):
+    promote = _action("promote", ["promote"])
+    both = _action("both", ["promote", "create"])
+    storage.action.search.return_value = {"items": [promote, both]}
+
+    assert action_service.get_actions_for_trigger("promote") == [promote, both]
+    assert action_service.get_actions_for_trigger("create") == [both]
+    assert action_service.get_actions_for_trigger("demote") == []
+
+    storage.action.search.assert_called_once()
+
+
+def test_cache_expires(storage):
+    action_service.get_actions_for_trigger("create")
+
+    with patch("howler.services.action_service.time.monotonic", return_value=float("inf")):
+        action_service.get_actions_for_trigger("create")
+
+    assert storage.action.search.call_count == 2
+
+
+def test_invalidation_reaches_other_pods(storage):
+    action_service.get_actions_for_trigger("create")
+
+    with patch("howler.services.action_service.comms_service") as comms_service:
+        action_service.invalidate_action_cache("action_id")
+
+    comms_service.emit.assert_called_once_with(action_service.ACTIONS_CHANGED_EVENT, {"action_id": "action_id"})
+
+    action_service.get_actions_for_trigger("create")
+    assert storage.action.search.call_count == 2
+
+
+def test_reload_after_invalidation_kept_briefly(storage):
+    action_service.forget_cached_actions()
+    action_service.get_actions_for_trigger("create")
+
+    expiry = action_service._actions_by_trigger[0]
+    assert expiry <= action_service.time.monotonic() + action_service._ACTION_REFRESH_GRACE
+
+
+def test_applicability_checked_in_one_request(storage):
+    actions = [_action(f"action {i}", ["create"], f"howler.analytic:{i}") for i in range(5)]
+    storage.action.search.return_value = {"items": actions}
+    storage.hit.count_many.side_effect = lambda queries: [0, 3, None, 0, 1]
+
+    action_service.bulk_execute_on_query("howler.id:(a OR b)", trigger="create", user=MagicMock())
+
+    storage.hit.count_many.assert_called_once_with(
+        [f"(howler.id:(a OR b)) AND (howler.analytic:{i})" for i in range(5)]
+    )
+    storage.hit.search.assert_not_called()
+
+    calls = [(call.kwargs["query"], call.kwargs["hit_count"]) for call in action_service.actions.execute.call_args_list]
+    assert calls == [
+        ("(howler.id:(a OR b)) AND (howler.analytic:1)", 3),
+        ("(howler.id:(a OR b)) AND (howler.analytic:4)", 1),
+    ]
+
+
+def test_no_actions_skips_counts(storage):
+    action_service.bulk_execute_on_query("howler.id:a", trigger="create", user=MagicMock())
+
+    storage.hit.count_many.assert_not_called()
+
+
+def test_users_cached_across_batches(storage):
+    with patch.object(action_service, "bulk_execute_on_query") as bulk_execute_on_query:
+        for _ in range(3):
+            action_service.process_action_batch("create", [{"hit_ids": ["id1"], "uname": "admin"}])
+
+    storage.user.get.assert_called_once_with("admin")
+    assert bulk_execute_on_query.call_count == 3
@@ -0,0 +1,165 @@
+"""Unit tests for registering analytics from ingested hits with analytic_service.save_from_hits."""
+
+import json
+from typing import cast
+from unittest.mock import patch
+
+import pytest
+
+from howler.datastore.bulk import ElasticBulkPlan
+from howler.odm.base import Model
+from howler.odm.models.analytic import Analytic
+from howler.odm.models.hit import Hit
+from howler.odm.models.user import User
+from howler.odm.randomizer import random_model_obj
+from howler.services import analytic_service
+
+
+@pytest.fixture(autouse=True)
+def storage():
+    analytic_service.forget_known_analytics()
+    with patch("howler.services.analytic_service.datastore") as datastore:
+        storage = datastore.return_value
+        storage.analytic.MAX_SEARCH_ROWS = 500
+        storage.analytic.search.return_value = {"items": []}
+        storage.analytic.bulk.return_value = True
+        storage.analytic.get_bulk_plan.side_effect = lambda: ElasticBulkPlan(["analytic"], Analytic)
+        yield storage
+    analytic_service.forget_known_analytics()
+
+
+@pytest.fixture
+def user() -> User:
+    user: User = random_model_obj(cast(Model, User))
+    user.uname = "analyst"
+    return user
+
+
+def _hit(analytic: str, detection: str | None = None) -> Hit:
+    hit: Hit = random_model_obj(cast(Model, Hit))
+    hit.howler.analytic = analytic
+    hit.howler.detection = detection
+    return hit
+
+
+def _analytic(name: str, detections: list[str], contributors: list[str]) -> Analytic:
+    return Analytic(
+        {
+            "name": name,
+            "owner": contributors[0],
+            "contributors": contributors,
+            "detections": detections,
+        }
+    )
+
+
+def _bulk_ids(storage, action: str) -> list[str]:
+    """The ids of the documents queued with the given action in the plan passed to bulk"""
+    plan: ElasticBulkPlan = storage.analytic.bulk.call_args.args[0]
+    headers = [json.loads(operation[0]) for operation in plan.operations]
+    return [header[action]["_id"] for header in headers if action in header]
+
+
+def test_single_lookup_for_all_analytics(storage, user):
+    hits = [_hit(f"Analytic {i % 5}", f"Detection {i}") for i in range(50)]
+
+    analytic_service.save_from_hits(hits, user)
+
+    storage.analytic.search.assert_called_once()
+    query = storage.analytic.search.call_args.args[0]
+    assert all(f'"Analytic {i}"' in query for i in range(5))
+
+    storage.analytic.bulk.assert_called_once()
+    assert len(_bulk_ids(storage, "index")) == 5
+
+
+def test_names_grouped_case_insensitively(storage, user):
+    existing = _analytic("Analytic", ["Detection"], ["analyst"])
+    storage.analytic.search.return_value = {"items": [existing]}
+
+    analytic_service.save_from_hits([_hit("ANALYTIC", "Detection"), _hit("analytic", "Other")], user)
+
+    assert _bulk_ids(storage, "index") == [existing.analytic_id]
+    assert existing.detections == ["Detection", "Other"]
+
+
+def test_unchanged_analytics_not_saved(storage, user):
+    storage.analytic.search.return_value = {"items": [_analytic("Analytic", ["Detection"], ["analyst"])]}
+
+    analytic_service.save_from_hits([_hit("Analytic", "Detection")], user)
+
+    storage.analytic.bulk.assert_not_called()
+
+
+def test_known_analytics_skip_lookup(storage, user):
+    analytic_service.save_from_hits([_hit("Analytic", "Detection")], user)
+    storage.analytic.search.reset_mock()
+    storage.analytic.bulk.reset_mock()
+
+    # Same analytic, user and detection: nothing to do
+    analytic_service.save_from_hits([_hit("Analytic", "detection"), _hit("Analytic")], user)
+    storage.analytic.search.assert_not_called()
+    storage.analytic.bulk.assert_not_called()
+
+    # A new detection has to be registered
+    storage.analytic.search.return_value = {"items": [_analytic("Analytic", ["Detection"], ["analyst"])]}
+    analytic_service.save_from_hits([_hit("Analytic", "New Detection")], user)
+    storage.analytic.search.assert_called_once()
+    storage.analytic.bulk.assert_called_once()
+
+
+def test_known_analytics_expire(storage, user):
+    analytic_service.save_from_hits([_hit("Analytic", "Detection")], user)
+    storage.analytic.search.reset_mock()
+
+    with patch("howler.services.analytic_service.time.monotonic", return_value=float("inf")):
+        analytic_service.save_from_hits([_hit("Analytic", "Detection")], user)
+
+    storage.analytic.search.assert_called_once()
+
+
+def test_failed_bulk_not_cached(storage, user):
+    storage.analytic.bulk.return_value = False
+
+    analytic_service.save_from_hits([_hit("Analytic", "Detection")], user)
+    analytic_service.save_from_hits([_hit("Analytic", "Detection")], user)
+
+    assert storage.analytic.search.call_count == 2
+
+
+def test_duplicates_deleted_in_same_bulk(storage, user):
+    analytics = [_analytic("Analytic", [], ["analyst"]) for _ in range(3)]
+    storage.analytic.search.return_value = {"items": analytics}
+
+    analytic_service.save_from_hits([_hit("Analytic", "Detection")], user)
+
+    storage.analytic.delete.assert_not_called()
+    assert _bulk_ids(storage, "delete") == [analytic.analytic_id for analytic in analytics[1:]]
+    assert _bulk_ids(storage, "index") == [analytics[0].analytic_id]
+
+
+def test_deleted_analytics_forgotten_on_every_pod(storage, user):
+    analytic_service.save_from_hits([_hit("Analytic", "Detection")], user)
+
+    with patch.object(analytic_service.comms_service, "emit") as emit:
+        analytic_service.invalidate_known_analytics()
+
+    emit.assert_called_once_with(analytic_service.ANALYTICS_DELETED_EVENT, {})
+    assert (
+        analytic_service.forget_known_analytics
+        in analytic_service.comms_service.handlers[analytic_service.ANALYTICS_DELETED_EVENT]
+    )
+
+    storage.analytic.search.reset_mock()
+    analytic_service.save_from_hits([_hit("Analytic", "Detection")], user)
+    storage.analytic.search.assert_called_once()
+
+
+def test_deletion_event_drops_known_analytics(storage, user):
+    analytic_service.save_from_hits([_hit("Analytic", "Detection")], user)
+    storage.analytic.search.reset_mock()
+
+    analytic_service.comms_service._dispatch({"__event__": analytic_service.ANALYTICS_DELETED_EVENT, "__payload__": {}})
+    analytic_service.save_from_hits([_hit("Analytic", "Detection")], user)
+
+    storage.analytic.search.assert_called_once()
@@ -5,6 +5,13 @@ import pytest
 from howler.services import action_service
 
 
+@pytest.fixture(autouse=True)
+def forget_cached_actions():
+    action_service.forget_cached_actions()
+    yield
+    action_service.forget_cached_actions()
+
+
 class TestEnqueueActionExecution:
     """Tests for enqueue_action_execution."""
 
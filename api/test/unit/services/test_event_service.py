@@ -7,6 +7,7 @@ import pytest
 from howler.common.exceptions import HowlerTypeError, HowlerValueError, ResourceExists
 from howler.odm.base import UTC_TZ
 from howler.odm.models.event import Event
+from howler.odm.paths import get_path_table
 from howler.services import event_service
 
 # ========================
@@ -195,11 +196,7 @@ def test_convert_event_deprecated_fields(mock_exists):
         "howler.score": 0.5,
     }
 
-    ff = Event.flat_fields()
-    with patch.object(Event, "flat_fields") as mock_flat_fields:
-        ff["howler.score"] = MagicMock(deprecated=True)
-        mock_flat_fields.return_value = ff
-
+    with patch.object(get_path_table(Event), "deprecated", frozenset({"howler.score"})):
         _, warnings = event_service.convert_event(data, unique=True, ignore_extra_values=True)
 
         assert any("howler.score" in w and "deprecated" in w for w in warnings)
@@ -0,0 +1,104 @@
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from howler import odm
+from howler.common.exceptions import HowlerValueError, ResourceExists
+from howler.services import validation_service
+
+
+@odm.model(description="Record converted in the tests")
+class Record(odm.Model):
+    name: str = odm.Keyword(description="Name of the record")
+    hidden: str = odm.Keyword(description="Hidden field of the record", default="secret", store=False)
+
+
+def convert_record(data, unique, ignore_extra_values=False):
+    if "name" not in data:
+        raise HowlerValueError(f"Record {data} has no name", cause=KeyError("name"))
+
+    if unique and data["name"] == "taken":
+        raise ResourceExists("Resource with id taken already exists")
+
+    return Record(data), [f"{data['name']} converted"]
+
+
+@pytest.fixture
+def thread_pool():
+    pool = ThreadPoolExecutor(max_workers=2)
+    with (
+        patch.object(validation_service, "VALIDATION_THRESHOLD", 3),
+        patch.object(validation_service, "VALIDATION_CHUNK_SIZE", 2),
+        patch.object(validation_service, "_get_pool", return_value=pool),
+    ):
+        yield pool
+
+    pool.shutdown()
+
+
+def test_small_batches_are_converted_inline(thread_pool):
+    with patch.object(thread_pool, "submit") as submit:
+        results = validation_service.convert_records([{"name": "a"}, {}], convert_record, unique=True)
+
+    submit.assert_not_called()
+    assert results[0][0].name == "a"
+    assert results[0][1] == ["a converted"]
+    assert results[1][0] is None
+    assert isinstance(results[1][2], HowlerValueError)
+
+
+def test_large_batches_are_converted_in_chunks_in_order(thread_pool):
+    records = [{"name": "a"}, {}, {"name": "taken"}, {"name": "c", "hidden": "kept"}, {"name": "d"}]
+
+    with (
+        patch.object(thread_pool, "submit", wraps=thread_pool.submit) as submit,
+        patch.object(Record, "restore", wraps=Record.restore) as restore,
+    ):
+        results = validation_service.convert_records(records, convert_record, unique=True)
+
+    assert [len(call.args[2]) for call in submit.call_args_list] == [2, 2, 1]
+    # Records validated by the worker processes aren't validated again
+    assert restore.call_count == 4
+
+    assert [odm.name if odm else None for odm, _, _ in results] == ["a", None, "taken", "c", "d"]
+    assert [warnings for _, warnings, _ in results] == [
+        ["a converted"],
+        [],
+        ["taken converted"],
+        ["c converted"],
+        ["d converted"],
+    ]
+    assert all(isinstance(odm, Record) for odm, _, _ in results if odm)
+    assert results[3][0].hidden == "kept"
+
+    error = results[1][2]
+    assert isinstance(error, HowlerValueError)
+    assert str(error) == "Record {} has no name"
+    # Only the message is sent back by the worker processes
+    assert not isinstance(error.cause, KeyError)
+    assert all(error is None for odm, _, error in results if odm is not None)
+
+
+def test_disabled_pool_converts_inline(thread_pool):
+    with patch.object(validation_service, "VALIDATION_PROCESSES", 0), patch.object(thread_pool, "submit") as submit:
+        results = validation_service.convert_records([{"name": "a"}] * 5, convert_record, unique=True)
+
+    submit.assert_not_called()
+    assert len(results) == 5
+
+
+def test_broken_pool_falls_back_inline(thread_pool):
+    pool = MagicMock()
+    pool.submit.return_value.result.side_effect = BrokenProcessPool("worker died")
+    validation_service._pool = pool
+
+    try:
+        with patch.object(validation_service, "_get_pool", return_value=pool):
+            results = validation_service.convert_records([{"name": "taken"}] * 3, convert_record, unique=True)
+    finally:
+        validation_service._pool = None
+
+    pool.shutdown.assert_called_once()
+    assert all(isinstance(error, ResourceExists) for _, _, error in results)
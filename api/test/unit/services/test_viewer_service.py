@@ -1,27 +1,54 @@
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
+
+import pytest
 
 from howler.services import viewer_service
 
 
+@pytest.fixture(autouse=True)
+def reset_emit_state():
+    viewer_service._pending.clear()
+    viewer_service._last_emit.clear()
+    yield
+    viewer_service._pending.clear()
+    viewer_service._last_emit.clear()
+
+
+@pytest.fixture
+def mock_redis():
+    with patch.object(viewer_service, "redis") as mock_redis:
+        mock_redis.register_script.return_value = MagicMock(return_value=[0])
+        yield mock_redis
+
+
+@pytest.fixture
+def mock_event():
+    with patch.object(viewer_service, "comms_service") as mock_event:
+        yield mock_event
+
+
+def _script_result(mock_redis, changed, *viewers):
+    mock_redis.register_script.return_value.return_value = [changed, *viewers]
+
+
 class TestAddViewer:
     """Tests for viewer_service.add_viewer."""
 
-    @patch.object(viewer_service, "comms_service")
-    @patch.object(viewer_service, "redis")
-    def test_add_viewer_calls_sadd_and_expire(self, mock_redis, mock_event):
-        """add_viewer writes the username to a Redis set and refreshes the TTL."""
-        mock_redis.smembers.return_value = {b"alice"}
+    @patch.object(viewer_service.time, "time", return_value=1000.0)
+    def test_add_viewer_runs_presence_script(self, _time, mock_redis, mock_event):
+        """add_viewer scores the username by heartbeat time in a single script call."""
+        _script_result(mock_redis, 1, b"alice")
 
         viewer_service.add_viewer("entity-1", "alice")
 
-        mock_redis.sadd.assert_called_once_with("viewers:entity-1", "alice")
-        mock_redis.expire.assert_called_once_with("viewers:entity-1", viewer_service.VIEWER_TTL)
+        mock_redis.register_script.assert_called_with(viewer_service.presence_script)
+        mock_redis.register_script.return_value.assert_called_once_with(
+            keys=["viewer_presence:entity-1"], args=[1000.0, viewer_service.VIEWER_TIMEOUT, "add", "alice"]
+        )
 
-    @patch.object(viewer_service, "comms_service")
-    @patch.object(viewer_service, "redis")
     def test_add_viewer_emits_viewers_update(self, mock_redis, mock_event):
         """add_viewer emits a viewers_update event with the current viewer list."""
-        mock_redis.smembers.return_value = {b"alice", b"bob"}
+        _script_result(mock_redis, 1, b"bob", b"alice")
 
         viewer_service.add_viewer("entity-1", "alice")
 
@@ -30,25 +57,30 @@ class TestAddViewer:
             {"id": "entity-1", "viewers": ["alice", "bob"]},
         )
 
+    def test_heartbeat_of_known_viewer_does_not_emit(self, mock_redis, mock_event):
+        """Refreshing a viewer that is already listed leaves the viewers unchanged."""
+        _script_result(mock_redis, 0, b"alice")
+
+        viewer_service.heartbeat("entity-1", "alice")
+
+        assert mock_redis.register_script.return_value.call_args.kwargs["args"][2] == "add"
+        mock_event.emit.assert_not_called()
+
 
 class TestRemoveViewer:
     """Tests for viewer_service.remove_viewer."""
 
-    @patch.object(viewer_service, "comms_service")
-    @patch.object(viewer_service, "redis")
-    def test_remove_viewer_calls_srem(self, mock_redis, mock_event):
-        """remove_viewer removes the username from the Redis set."""
-        mock_redis.smembers.return_value = set()
-
+    def test_remove_viewer_runs_presence_script(self, mock_redis, mock_event):
+        """remove_viewer removes the username from the sorted set."""
         viewer_service.remove_viewer("entity-1", "alice")
 
-        mock_redis.srem.assert_called_once_with("viewers:entity-1", "alice")
+        args = mock_redis.register_script.return_value.call_args.kwargs["args"]
+        assert args[2:] == ["remove", "alice"]
+        mock_event.emit.assert_not_called()
 
-    @patch.object(viewer_service, "comms_service")
-    @patch.object(viewer_service, "redis")
     def test_remove_viewer_emits_viewers_update(self, mock_redis, mock_event):
         """remove_viewer emits a viewers_update event after removal."""
-        mock_redis.smembers.return_value = {b"bob"}
+        _script_result(mock_redis, 1, b"bob")
 
         viewer_service.remove_viewer("entity-1", "alice")
 
@@ -61,29 +93,66 @@ class TestRemoveViewer:
 class TestGetViewers:
     """Tests for viewer_service.get_viewers."""
 
-    @patch.object(viewer_service, "redis")
-    def test_get_viewers_returns_sorted_list(self, mock_redis):
+    def test_get_viewers_returns_sorted_list(self, mock_redis, mock_event):
         """get_viewers decodes bytes and returns a sorted list of usernames."""
-        mock_redis.smembers.return_value = {b"charlie", b"alice", b"bob"}
+        _script_result(mock_redis, 0, b"charlie", b"alice", b"bob")
 
         result = viewer_service.get_viewers("entity-1")
 
         assert result == ["alice", "bob", "charlie"]
+        mock_event.emit.assert_not_called()
 
-    @patch.object(viewer_service, "redis")
-    def test_get_viewers_handles_string_members(self, mock_redis):
+    def test_get_viewers_handles_string_members(self, mock_redis, mock_event):
         """get_viewers handles members that are already strings."""
-        mock_redis.smembers.return_value = {"charlie", "alice"}
+        _script_result(mock_redis, 0, "charlie", "alice")
 
         result = viewer_service.get_viewers("entity-1")
 
         assert result == ["alice", "charlie"]
 
-    @patch.object(viewer_service, "redis")
-    def test_get_viewers_returns_empty_for_missing_key(self, mock_redis):
-        """get_viewers returns an empty list when the Redis set does not exist."""
-        mock_redis.smembers.return_value = set()
-
+    def test_get_viewers_returns_empty_for_missing_key(self, mock_redis, mock_event):
+        """get_viewers returns an empty list when the sorted set does not exist."""
         result = viewer_service.get_viewers("nonexistent")
 
         assert result == []
+
+    def test_get_viewers_emits_when_stale_viewers_were_pruned(self, mock_redis, mock_event):
+        """Viewers whose heartbeat expired are announced as gone."""
+        _script_result(mock_redis, 1, b"alice")
+
+        assert viewer_service.get_viewers("entity-1") == ["alice"]
+
+        assert mock_redis.register_script.return_value.call_args.kwargs["args"][2] == "list"
+        mock_event.emit.assert_called_once_with("viewers_update", {"id": "entity-1", "viewers": ["alice"]})
+
+
+class TestCoalescing:
+    """Tests for coalescing viewers_update events per entity."""
+
+    @patch.object(viewer_service.threading, "Timer")
+    def test_updates_within_interval_are_coalesced(self, timer, mock_redis, mock_event):
+        """Only the first update is sent immediately, later ones are merged into one delayed update."""
+        for viewers in ([b"alice"], [b"alice", b"bob"], [b"alice", b"bob", b"carol"]):
+            _script_result(mock_redis, 1, *viewers)
+            viewer_service.add_viewer("entity-1", viewers[-1].decode())
+
+        mock_event.emit.assert_called_once_with("viewers_update", {"id": "entity-1", "viewers": ["alice"]})
+        timer.assert_called_once()
+        delay, flush = timer.call_args.args[:2]
+        assert 0 < delay <= viewer_service.VIEWER_EMIT_INTERVAL
+
+        flush(*timer.call_args.kwargs["args"])
+
+        assert mock_event.emit.call_count == 2
+        mock_event.emit.assert_called_with("viewers_update", {"id": "entity-1", "viewers": ["alice", "bob", "carol"]})
+        assert viewer_service._pending == {}
+
+    @patch.object(viewer_service.threading, "Timer")
+    def test_entities_are_coalesced_separately(self, timer, mock_redis, mock_event):
+        _script_result(mock_redis, 1, b"alice")
+
+        viewer_service.add_viewer("entity-1", "alice")
+        viewer_service.add_viewer("entity-2", "alice")
+
+        assert mock_event.emit.call_count == 2
+        timer.assert_not_called()
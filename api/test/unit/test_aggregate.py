@@ -0,0 +1,101 @@
+"""Unit tests for running several aggregations in a single request with ESCollection.aggregate."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from howler.datastore.collection import ESCollection
+from howler.datastore.exceptions import SearchException
+
+
+@pytest.fixture(autouse=True)
+def skip_ensure_collection():
+    ESCollection.IGNORE_ENSURE_COLLECTION = True
+    yield
+    ESCollection.IGNORE_ENSURE_COLLECTION = False
+
+
+@pytest.fixture()
+def collection():
+    return ESCollection(MagicMock(), "testcol")
+
+
+def test_single_request_for_all_aggregations(collection):
+    collection.datastore.client.search.return_value = {
+        "aggregations": {
+            "status": {"buckets": [{"key": "open", "doc_count": 3}, {"key": "resolved", "doc_count": 1}]},
+            "analytics": {"buckets": [{"key": "A", "doc_count": 1}, {"key": "B", "doc_count": 3}]},
+            "scores": {"histogram": {"buckets": [{"key": 0, "doc_count": 2}, {"key": 100, "doc_count": 2}]}},
+            "score": {"count": 4, "min": 0, "max": 150, "avg": 75, "sum": 300},
+        }
+    }
+
+    result = collection.aggregate(
+        "howler.id:*",
+        filters=["howler.escalation:hit"],
+        aggs={
+            "status": {"type": "facet", "field": "howler.status"},
+            "analytics": {"type": "terms", "field": "howler.analytic", "sort": "_key asc", "rows": 5},
+            "scores": {"type": "histogram", "field": "howler.score", "start": 0, "end": 200, "gap": 100},
+            "score": {"type": "stats", "field": "howler.score"},
+        },
+        access_control="classification:U",
+    )
+
+    collection.datastore.client.search.assert_called_once()
+    kwargs = collection.datastore.client.search.call_args.kwargs
+    assert kwargs["size"] == 0
+    assert kwargs["query"]["bool"]["filter"] == [
+        {"query_string": {"query": "howler.escalation:hit"}},
+        {"query_string": {"query": "classification:U"}},
+    ]
+    assert kwargs["aggregations"]["analytics"] == {
+        "terms": {"field": "howler.analytic", "min_doc_count": 1, "size": 5, "order": {"_key": "asc"}}
+    }
+    assert kwargs["aggregations"]["scores"]["filter"] == {"query_string": {"query": "howler.score:[0 TO 200]"}}
+    assert kwargs["aggregations"]["scores"]["aggregations"]["histogram"]["histogram"]["interval"] == 100
+
+    assert result == {
+        "status": {"open": 3, "resolved": 1},
+        "analytics": [{"value": "A", "count": 1}, {"value": "B", "count": 3}],
+        "scores": {0: 2, 100: 2},
+        "score": {"count": 4, "min": 0, "max": 150, "avg": 75, "sum": 300},
+    }
+
+
+def test_date_histogram(collection):
+    collection.datastore.to_pydatemath.side_effect = lambda value: value
+    collection.datastore.client.search.return_value = {"aggregations": {"created": {"histogram": {"buckets": []}}}}
+
+    collection.aggregate(
+        aggs={"created": {"type": "histogram", "field": "event.created", "start": "now-1d", "end": "now", "gap": "+1h"}}
+    )
+
+    body = collection.datastore.client.search.call_args.kwargs["aggregations"]["created"]["aggregations"]
+    assert body["histogram"]["date_histogram"]["fixed_interval"] == "1h"
+
+
+def test_no_aggregations_skips_request(collection):
+    assert collection.aggregate("id:*", aggs={}) == {}
+    collection.datastore.client.search.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        {"type": "unknown", "field": "howler.status"},
+        {"type": "facet"},
+        {"type": "facet", "field": "howler.status", "rows": ESCollection.MAX_FACET_LIMIT + 1},
+        {"type": "facet", "field": "howler.status", "rows": "many"},
+        {"type": "terms", "field": "howler.status", "mincount": ["1"]},
+        {"type": "terms", "field": "howler.status", "sort": "howler.status asc"},
+        {"type": "terms", "field": "howler.status", "sort": ["_key", "asc"]},
+        {"type": "histogram", "field": "howler.score", "start": 0, "end": 100, "gap": 10, "mincount": "none"},
+        {"type": "histogram", "field": "howler.score", "start": 0, "end": 100000, "gap": 1},
+    ],
+)
+def test_invalid_aggregations(collection, spec):
+    with pytest.raises(SearchException):
+        collection.aggregate("id:*", aggs={"bad": spec})
+
+    collection.datastore.client.search.assert_not_called()
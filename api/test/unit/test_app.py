@@ -1,4 +1,8 @@
+import gc
+from unittest.mock import MagicMock
+
 import howler.app as howler_app
+from howler import gunicorn_config
 
 
 def test_should_start_background_services(monkeypatch):
@@ -29,3 +33,41 @@ def test_should_start_background_services(monkeypatch):
     monkeypatch.setattr(howler_app, "DEBUG", False)
     monkeypatch.setattr(howler_app.sys, "argv", ["flask"])
     assert howler_app._should_start_background_services()
+
+
+def test_start_background_services(monkeypatch):
+    """Preloaded workers start the event watcher and job system the app would have started on import."""
+    setup_jobs = MagicMock()
+    start_watcher = MagicMock()
+    monkeypatch.setattr(howler_app, "setup_jobs", setup_jobs)
+    monkeypatch.setattr("howler.services.comms_service.start_watcher", start_watcher)
+    monkeypatch.setattr(howler_app, "DEBUG", False)
+    monkeypatch.setattr(howler_app, "HWL_USE_WEBSOCKET_API", True)
+    monkeypatch.setattr(howler_app, "HWL_USE_JOB_SYSTEM", False)
+
+    howler_app.start_background_services()
+
+    start_watcher.assert_called_once()
+    setup_jobs.assert_not_called()
+
+    monkeypatch.setattr(howler_app, "HWL_USE_WEBSOCKET_API", False)
+    monkeypatch.setattr(howler_app, "HWL_USE_JOB_SYSTEM", True)
+    howler_app.start_background_services()
+
+    start_watcher.assert_called_once()
+    setup_jobs.assert_called_once()
+
+
+def test_preloaded_app_is_frozen(monkeypatch):
+    """The objects of the preloaded app are frozen before forking, and collection resumes."""
+    monkeypatch.setattr(gunicorn_config, "preload_app", True)
+
+    gc.disable()
+    try:
+        gunicorn_config.when_ready(None)
+
+        assert gc.isenabled()
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+        gc.enable()
@@ -0,0 +1,104 @@
+import logging
+import logging.handlers
+import threading
+import time
+import uuid
+from queue import Queue
+
+import pytest
+
+from howler.common.logging.audit import AUDIT_DROPPED, AuditWriter
+
+
+@pytest.fixture
+def audit_logger():
+    logger = logging.Logger(name=uuid.uuid4().hex)
+    output: Queue = Queue()
+    logger.addHandler(logging.handlers.QueueHandler(output))
+
+    yield logger, output
+
+
+def _record(logger: logging.Logger, msg: str) -> logging.LogRecord:
+    return logger.makeRecord(logger.name, logging.INFO, __file__, 0, msg, (), None)
+
+
+def test_records_written_in_order(audit_logger):
+    logger, output = audit_logger
+    writer = AuditWriter(logger, max_size=100, batch_size=7)
+
+    for i in range(50):
+        writer.submit(_record(logger, f"record {i}"))
+
+    assert writer.flush()
+    assert [output.get_nowait().getMessage() for _ in range(50)] == [f"record {i}" for i in range(50)]
+
+    writer.stop()
+
+
+def test_records_written_off_request_thread(audit_logger):
+    logger, output = audit_logger
+    writer = AuditWriter(logger)
+
+    writer.submit(_record(logger, "hello"))
+    writer.flush()
+
+    assert output.get_nowait().getMessage() == "hello"
+    assert writer._thread is not None
+    assert writer._thread is not threading.current_thread()
+
+    writer.stop()
+
+
+def test_synchronous_when_disabled(audit_logger):
+    logger, output = audit_logger
+    writer = AuditWriter(logger, max_size=0)
+
+    writer.submit(_record(logger, "hello"))
+
+    assert output.get_nowait().getMessage() == "hello"
+    assert writer._thread is None
+
+
+def test_full_queue_drops_records(audit_logger):
+    logger, output = audit_logger
+    writer = AuditWriter(logger, max_size=2)
+
+    release = threading.Event()
+
+    class BlockingHandler(logging.Handler):
+        def emit(self, record):
+            release.wait(5)
+
+    logger.addHandler(BlockingHandler())
+
+    before = AUDIT_DROPPED._value.get()
+
+    # The writer holds the first record while the handler blocks, which leaves room for two more
+    writer.submit(_record(logger, "first"))
+    while writer._queue.qsize() > 0:
+        time.sleep(0.01)
+    for i in range(5):
+        writer.submit(_record(logger, f"record {i}"))
+
+    assert AUDIT_DROPPED._value.get() - before == 3
+
+    release.set()
+    assert writer.flush()
+    assert output.qsize() == 3
+
+    writer.stop()
+
+
+def test_stop_flushes_pending_records(audit_logger):
+    logger, output = audit_logger
+    writer = AuditWriter(logger)
+
+    for i in range(10):
+        writer.submit(_record(logger, f"record {i}"))
+
+    writer.stop()
+
+    assert output.qsize() == 10
+    assert writer._thread is not None
+    assert not writer._thread.is_alive()
@@ -0,0 +1,139 @@
+"""Unit tests for deleting documents in bulk and removing list references with a single update on ESCollection."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from howler.datastore.collection import ESCollection
+from howler.datastore.scripts import REMOVE_VALUES_SCRIPT_ID
+from howler.services import hit_service
+
+
+@pytest.fixture(autouse=True)
+def skip_ensure_collection():
+    ESCollection.IGNORE_ENSURE_COLLECTION = True
+    yield
+    ESCollection.IGNORE_ENSURE_COLLECTION = False
+
+
+@pytest.fixture()
+def collection():
+    ds = MagicMock()
+    ds.client.update_by_query.return_value = {"task": "node:1"}
+    ds.client.tasks.get.return_value = {
+        "completed": True,
+        "task": {"status": {}},
+        "response": {"updated": 2, "total": 2, "version_conflicts": 0},
+    }
+    return ESCollection(ds, "testcol")
+
+
+def _search_result(*docs):
+    return {"hits": {"hits": [{"_id": doc_id, "_index": index} for doc_id, index in docs]}}
+
+
+def test_document_indexes_located_with_one_search(collection):
+    collection.datastore.client.search.return_value = _search_result(("a", "testcol-000001"), ("b", "testcol-000002"))
+
+    assert collection.get_document_indexes(["a", "b", "c", "a"]) == {"a": "testcol-000001", "b": "testcol-000002"}
+
+    collection.datastore.client.search.assert_called_once()
+    kwargs = collection.datastore.client.search.call_args.kwargs
+    assert kwargs["index"] == collection.name
+    assert kwargs["query"] == {"ids": {"values": ["a", "b", "c"]}}
+    assert kwargs["_source"] is False
+
+
+def test_document_indexes_chunked(collection):
+    collection.datastore.client.search.return_value = _search_result()
+
+    collection.get_document_indexes([str(i) for i in range(ESCollection.MAX_SEARCH_ROWS * 2 + 1)])
+
+    assert collection.datastore.client.search.call_count == 3
+
+
+def test_delete_many_reports_each_id(collection):
+    collection.datastore.client.search.return_value = _search_result(("a", "testcol-000001"), ("b", "testcol-000002"))
+    collection.datastore.client.bulk.return_value = {
+        "errors": True,
+        "items": [
+            {"delete": {"_id": "a", "result": "deleted"}},
+            {"delete": {"_id": "b", "error": {"type": "cluster_block_exception", "reason": "index read-only"}}},
+        ],
+    }
+
+    assert collection.delete_many(["a", "b", "c"], refresh="wait_for") == {
+        "a": "deleted",
+        "b": "index read-only",
+        "c": "not_found",
+    }
+
+    collection.datastore.client.bulk.assert_called_once()
+    kwargs = collection.datastore.client.bulk.call_args.kwargs
+    assert kwargs["refresh"] == "wait_for"
+    assert [json.loads(line) for line in kwargs["operations"].splitlines()] == [
+        {"delete": {"_index": "testcol-000001", "_id": "a"}},
+        {"delete": {"_index": "testcol-000002", "_id": "b"}},
+    ]
+
+
+def test_delete_many_nothing_found(collection):
+    collection.datastore.client.search.return_value = _search_result()
+
+    assert collection.delete_many(["a"]) == {"a": "not_found"}
+    collection.datastore.client.bulk.assert_not_called()
+
+
+def test_remove_list_values_single_update(collection):
+    collection.datastore.ensure_stored_scripts.return_value = True
+
+    assert collection.remove_list_values("howler.related", ["a", "b"]) == 2
+
+    collection.datastore.client.update_by_query.assert_called_once()
+    kwargs = collection.datastore.client.update_by_query.call_args.kwargs
+    assert kwargs["query"] == {"terms": {"howler.related": ["a", "b"]}}
+    assert kwargs["script"] == {
+        "id": REMOVE_VALUES_SCRIPT_ID,
+        "params": {"path": ["howler", "related"], "values": ["a", "b"]},
+    }
+    assert kwargs["slices"] == "auto"
+
+
+def test_remove_list_values_inline_fallback(collection):
+    collection.datastore.ensure_stored_scripts.return_value = False
+
+    collection.remove_list_values("howler.related", ["a"])
+
+    script = collection.datastore.client.update_by_query.call_args.kwargs["script"]
+    assert script["lang"] == "painless"
+    assert "removeIf" in script["source"]
+
+
+def test_remove_list_values_nothing_to_remove(collection):
+    assert collection.remove_list_values("howler.related", []) == 0
+    collection.datastore.client.update_by_query.assert_not_called()
+
+
+def test_delete_hits_single_cleanup():
+    with (
+        patch("howler.services.hit_service.datastore") as datastore,
+        patch("howler.services.hit_service.comms_service") as comms_service,
+    ):
+        storage = datastore.return_value
+        storage.hit.delete_many.return_value = {"a": "deleted", "b": "deleted", "c": "not_found"}
+
+        results = hit_service.delete_hits({"a", "b", "c"}, refresh="true")
+
+    assert results == {"a": "deleted", "b": "deleted", "c": "not_found"}
+    storage.hit.delete.assert_not_called()
+    storage.hit.update_by_query.assert_not_called()
+
+    storage.hit.remove_list_values.assert_called_once()
+    args = storage.hit.remove_list_values.call_args
+    assert args.args[0] == "howler.related"
+    assert sorted(args.args[1]) == ["a", "b", "c"]
+    assert args.kwargs["refresh"] == "true"
+
+    # Listeners of the "hits" event expect a single hit, deletions are not broadcast
+    comms_service.emit.assert_not_called()
@@ -1,34 +1,48 @@
-from unittest.mock import MagicMock, call
+import json
+import zlib
+from unittest.mock import MagicMock
 
-from howler.external.check_duplicates import delete_duplicates, iter_duplicates
+from howler.datastore.bulk import ElasticBulkPlan
+from howler.external.check_duplicates import ThrottledDeleter, delete_duplicates, iter_duplicates
 
 
 class FakeClient:
-    """In-memory Elasticsearch client with search_after pagination."""
+    """In-memory Elasticsearch client answering bulk deletes."""
 
-    def __init__(self, documents: dict[str, list[str]]):
-        self.documents = documents
-        self.delete = MagicMock(return_value={"result": "deleted"})
-
-    def search(self, *, index, search_after=None, size, **kwargs):
-        document_ids = self.documents[index]
-        if search_after is not None:
-            document_ids = [document_id for document_id in document_ids if document_id > search_after[0]]
+    def __init__(self):
+        self.bulk = MagicMock(side_effect=self._bulk)
 
-        hits = [{"_id": document_id, "sort": [document_id]} for document_id in document_ids[:size]]
-        return {"hits": {"hits": hits}}
+    def _bulk(self, *, operations, **kwargs):
+        items = []
+        for line in operations.splitlines():
+            if line:
+                info = json.loads(line)["delete"]
+                items.append({"delete": {"_index": info["_index"], "_id": info["_id"], "result": "deleted"}})
+        return {"errors": False, "items": items}
 
 
 class FakeCollection:
-    """Collection wrapper that delegates retry calls to the in-memory client."""
+    """Collection wrapper streaming sorted, sliced IDs out of memory."""
 
     def __init__(self, documents: dict[str, list[str]]):
+        self.documents = documents
         self.datastore = MagicMock()
-        self.datastore.client = FakeClient(documents)
+        self.datastore.client = FakeClient()
+        self.scans = []
 
     def with_retries(self, func, *args, **kwargs):
         return func(*args, **kwargs)
 
+    def scan_with_pit(self, *, index, size, slice_id=None, slice_max=None, **kwargs):
+        self.scans.append((index, slice_id, slice_max))
+        for document_id in sorted(self.documents[index]):
+            if slice_max and zlib.crc32(document_id.encode()) % slice_max != slice_id:
+                continue
+            yield {"_id": document_id, "sort": [document_id]}
+
+    def get_bulk_plan(self):
+        return ElasticBulkPlan(list(self.documents))
+
 
 def test_iter_duplicates_merges_paginated_physical_indexes():
     """Duplicate IDs are found without loading every physical index into memory."""
@@ -48,13 +62,54 @@ def test_iter_duplicates_merges_paginated_physical_indexes():
     ]
 
 
+def test_iter_duplicates_merges_sliced_streams():
+    """Every index is read with one cursor per slice, and duplicates are still merged in ID order."""
+    indexes = ["howler-hit-000002", "howler-hit-000001"]
+    collection = FakeCollection(
+        {
+            indexes[0]: [f"id-{i:03}" for i in range(0, 200, 2)],
+            indexes[1]: [f"id-{i:03}" for i in range(0, 200, 3)],
+        }
+    )
+
+    duplicates = list(iter_duplicates(collection, indexes, batch_size=7, slices=4))
+
+    assert [document_id for document_id, _ in duplicates] == [f"id-{i:03}" for i in range(0, 200, 6)]
+    assert all(sorted(duplicate_indexes) == sorted(indexes) for _, duplicate_indexes in duplicates)
+    assert sorted(collection.scans) == sorted((index, i, 4) for index in indexes for i in range(4))
+
+
 def test_delete_duplicates_deletes_only_requested_physical_copies():
-    """Deletion calls target old indexes directly rather than the rollover alias."""
-    collection = FakeCollection({})
+    """Deletion calls target old indexes directly rather than the rollover alias, in one bulk request."""
+    collection = FakeCollection({"howler-hit-000002": [], "howler-hit-000001": []})
 
-    assert delete_duplicates(collection, "duplicate-id", ["howler-hit-000001", "howler-hit-000002"]) == 2
+    assert (
+        delete_duplicates(collection, [("howler-hit-000001", "duplicate-id"), ("howler-hit-000002", "duplicate-id")])
+        == 2
+    )
 
-    assert collection.datastore.client.delete.call_args_list == [
-        call(index="howler-hit-000001", id="duplicate-id"),
-        call(index="howler-hit-000002", id="duplicate-id"),
+    collection.datastore.client.bulk.assert_called_once()
+    operations = [
+        json.loads(line) for line in collection.datastore.client.bulk.call_args.kwargs["operations"].splitlines()
+    ]
+    assert operations == [
+        {"delete": {"_index": "howler-hit-000001", "_id": "duplicate-id"}},
+        {"delete": {"_index": "howler-hit-000002", "_id": "duplicate-id"}},
     ]
+
+
+def test_throttled_deleter_flushes_full_batches():
+    """Stale copies are only sent once a full batch is pending, or on the final flush."""
+    collection = FakeCollection({"howler-hit-000001": []})
+    deleter = ThrottledDeleter(collection, batch_size=2, max_per_second=1_000_000)
+
+    for document_id in ["a", "b", "c"]:
+        deleter.add("howler-hit-000001", document_id)
+
+    assert collection.datastore.client.bulk.call_count == 1
+    assert deleter.deleted == 2
+
+    deleter.flush()
+
+    assert collection.datastore.client.bulk.call_count == 2
+    assert deleter.deleted == 3
@@ -0,0 +1,89 @@
+"""Unit tests for the shared default classification engine and the memoized classification checks."""
+
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from howler.common import loader
+from howler.common.classification import Classification
+
+YML_CONFIG = os.path.join(os.path.dirname(os.path.dirname(__file__)), "classification.yml")
+
+
+@pytest.fixture
+def conf_folder(tmp_path: Path, monkeypatch):
+    shutil.copy(YML_CONFIG, tmp_path / "classification.yml")
+    monkeypatch.setenv("HWL_CONF_FOLDER", str(tmp_path))
+    monkeypatch.setattr(loader, "_DEFAULT_CLASSIFICATION", None)
+    return tmp_path
+
+
+@pytest.fixture
+def engine():
+    return Classification(loader.get_classification(yml_config=YML_CONFIG).original_definition)
+
+
+def test_default_engine_shared(conf_folder):
+    engine = loader.get_classification()
+
+    assert loader.get_classification() is engine
+    assert engine.enforce
+
+
+def test_default_engine_reloaded_on_change(conf_folder, monkeypatch):
+    monkeypatch.setattr(loader, "CLASSIFICATION_RELOAD_INTERVAL", 0)
+    engine = loader.get_classification()
+
+    yml_path = conf_folder / "classification.yml"
+    yml_path.write_text(yml_path.read_text().replace("enforce: true", "enforce: false"))
+    os.utime(yml_path, ns=(0, 0))
+
+    reloaded = loader.get_classification()
+    assert reloaded is not engine
+    assert not reloaded.enforce
+
+
+def test_default_engine_not_checked_within_interval(conf_folder, monkeypatch):
+    engine = loader.get_classification()
+
+    monkeypatch.setattr(loader, "_default_classification_path", lambda *_: pytest.fail("Checked the file again"))
+    assert loader.get_classification() is engine
+
+
+def test_checks_memoized(engine):
+    engine._normalize_memo.cache_clear()
+    engine._is_accessible_memo.cache_clear()
+    engine._max_classification_memo.cache_clear()
+
+    for _ in range(3):
+        assert engine.normalize_classification("R//GOD//G1") == "RESTRICTED//ADMIN//ANY/GROUP 1"
+        assert engine.is_accessible("R//GOD//G1", "U//REL DEPTS")
+        assert engine.max_classification("U//REL DEPTS", "R//GOD//G1") == "RESTRICTED//ADMIN//ANY/GROUP 1"
+
+    assert engine._is_accessible_memo.cache_info().hits == 2
+    assert engine._max_classification_memo.cache_info().hits == 2
+    assert engine._normalize_memo.cache_info().misses == engine._normalize_memo.cache_info().currsize
+
+
+def test_memo_follows_engine_settings(engine):
+    assert not engine.is_valid("U//REL TEST")
+
+    engine.dynamic_groups = True
+    assert engine.is_valid("U//REL TEST")
+    assert engine.is_accessible("U//GOD//REL TEST", "U//REL TEST")
+
+    engine.dynamic_groups = False
+    with pytest.raises(Exception):
+        engine.is_accessible("U//GOD//REL TEST", "U//REL TEST")
+
+
+def test_parsed_definition_excludes_memos(engine):
+    engine.normalize_classification("R//GOD//G1")
+
+    definition = engine.get_parsed_classification_definition()
+
+    assert not any(key.endswith("_memo") for key in definition)
+    json.dumps(definition, default=list)
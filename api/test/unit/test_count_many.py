@@ -0,0 +1,60 @@
+"""Unit tests for counting the documents matching several queries in one request with ESCollection.count_many."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from howler.datastore.collection import ESCollection
+
+
+@pytest.fixture(autouse=True)
+def skip_ensure_collection():
+    ESCollection.IGNORE_ENSURE_COLLECTION = True
+    yield
+    ESCollection.IGNORE_ENSURE_COLLECTION = False
+
+
+@pytest.fixture()
+def collection():
+    return ESCollection(MagicMock(), "testcol")
+
+
+def test_counts_in_one_request(collection):
+    collection.datastore.client.msearch.return_value = {
+        "responses": [
+            {"hits": {"total": {"value": 3, "relation": "eq"}}},
+            {"error": {"type": "query_shard_exception"}},
+            {"hits": {"total": 0}},
+        ]
+    }
+
+    assert collection.count_many(["a:1", "b:(", "c:3"], filters="d:4", access_control="classification:U") == [
+        3,
+        None,
+        0,
+    ]
+
+    collection.datastore.client.msearch.assert_called_once()
+    searches = collection.datastore.client.msearch.call_args.kwargs["searches"]
+    assert searches[0::2] == [{}, {}, {}]
+    assert searches[1] == {
+        "query": {
+            "bool": {
+                "must": {"query_string": {"query": "a:1", "default_field": ESCollection.DEFAULT_SEARCH_FIELD}},
+                "filter": [{"query_string": {"query": "d:4"}}, {"query_string": {"query": "classification:U"}}],
+            }
+        },
+        "size": 0,
+        "track_total_hits": True,
+    }
+
+
+def test_counts_chunked(collection):
+    collection.datastore.client.msearch.side_effect = lambda searches, **_: {
+        "responses": [{"hits": {"total": {"value": 1}}}] * (len(searches) // 2)
+    }
+
+    assert collection.count_many(["a:1"] * (ESCollection.MAX_SEARCH_ROWS + 1)) == [1] * (
+        ESCollection.MAX_SEARCH_ROWS + 1
+    )
+    assert collection.datastore.client.msearch.call_count == 2
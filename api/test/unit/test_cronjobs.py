@@ -0,0 +1,113 @@
+"""Unit tests for registering cronjobs and electing the process that runs scheduled jobs."""
+
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.base import STATE_PAUSED, STATE_RUNNING
+
+import howler.cronjobs as cronjobs
+
+
+class FakeLease:
+    """Lease answering acquire and renew from a scripted list of outcomes."""
+
+    def __init__(self, outcomes, stop: threading.Event, scheduler: BackgroundScheduler):
+        self.outcomes = list(outcomes)
+        self.stop = stop
+        self.scheduler = scheduler
+        self.states = []
+        self.calls = []
+        self.released = False
+
+    def _next(self, call):
+        if self.calls:
+            # Record the scheduler state the previous outcome led to
+            self.states.append(self.scheduler.state)
+        self.calls.append(call)
+        outcome = self.outcomes.pop(0)
+        if not self.outcomes:
+            self.stop.set()
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    def acquire(self):
+        return self._next("acquire")
+
+    def renew(self):
+        return self._next("renew")
+
+    def release(self):
+        self.released = True
+
+
+def test_leader_election_resumes_and_pauses_scheduler():
+    """The scheduler only runs while the lease is held, and the lease is given up on stop."""
+    scheduler = BackgroundScheduler()
+    scheduler.start(paused=True)
+    stop = threading.Event()
+    lease = FakeLease([False, True, True, False, True, ConnectionError("redis down"), True], stop, scheduler)
+
+    try:
+        cronjobs.run_leader_election(lease, scheduler, stop, interval=0)
+
+        assert lease.calls == ["acquire", "acquire", "renew", "renew", "acquire", "renew", "acquire"]
+        assert lease.states == [STATE_PAUSED, STATE_RUNNING, STATE_RUNNING, STATE_PAUSED, STATE_RUNNING, STATE_PAUSED]
+        assert scheduler.state == STATE_RUNNING
+        assert lease.released
+    finally:
+        scheduler.shutdown(wait=False)
+
+
+def test_leader_election_keeps_lease_when_never_acquired():
+    scheduler = BackgroundScheduler()
+    scheduler.start(paused=True)
+    stop = threading.Event()
+    lease = FakeLease([False, False], stop, scheduler)
+
+    try:
+        cronjobs.run_leader_election(lease, scheduler, stop, interval=0)
+
+        assert scheduler.state == STATE_PAUSED
+        assert not lease.released
+    finally:
+        scheduler.shutdown(wait=False)
+
+
+def test_setup_jobs_splits_scheduled_jobs_and_consumers():
+    """Consumers and scheduled jobs can be started in separate processes."""
+    scheduled = SimpleNamespace(__name__="scheduled", setup_job=MagicMock())
+    consumer = SimpleNamespace(__name__="consumer", CONSUMER=True, setup_job=MagicMock())
+
+    with patch.object(cronjobs, "_import_jobs", return_value=[scheduled, consumer]):
+        cronjobs.setup_jobs(scheduled=False)
+
+    scheduled.setup_job.assert_not_called()
+    consumer.setup_job.assert_called_once_with(cronjobs.scheduler)
+    assert cronjobs._leader_thread is None
+
+
+def test_setup_jobs_starts_paused_until_elected():
+    scheduled = SimpleNamespace(__name__="scheduled", setup_job=MagicMock())
+    consumer = SimpleNamespace(__name__="consumer", CONSUMER=True, setup_job=MagicMock())
+    lease = MagicMock()
+    lease.acquire.return_value = False
+
+    with (
+        patch.object(cronjobs, "_import_jobs", return_value=[scheduled, consumer]),
+        patch("howler.remote.datatypes.lock.Lease", return_value=lease),
+    ):
+        try:
+            cronjobs.setup_jobs(consumers=False)
+
+            scheduled.setup_job.assert_called_once_with(cronjobs.scheduler)
+            consumer.setup_job.assert_not_called()
+            assert cronjobs.scheduler.state == STATE_PAUSED
+        finally:
+            cronjobs.stop_jobs()
+            cronjobs._leader_thread = None
+
+    lease.acquire.assert_called()
+    assert not cronjobs.scheduler.running
@@ -1,5 +1,9 @@
 """Unit tests for datastore field-selection utilities."""
 
+import pytest
+
+from howler.common.exceptions import HowlerValueError
+from howler.datastore.operations import OdmHelper
 from howler.datastore.utils import expand_field_patterns, prune_to_paths
 from howler.odm import Compound, Keyword, List, model
 from howler.odm.base import Model
@@ -82,3 +86,33 @@ def test_prune_to_paths_prunes_nested_dicts_and_list_entries():
         "items": [{"item_type": "hit"}, {"item_type": "event"}],
         "owner": {"id": "user-1"},
     }
+
+
+def test_expand_field_patterns_follows_added_namespaces():
+    @model()
+    class _Extended(Model):
+        title = Keyword()
+
+    assert expand_field_patterns(_Extended, ["*"]) == {"title"}
+
+    _Extended.add_namespace("extra", Compound(_Item))
+    assert expand_field_patterns(_Extended, ["*"]) == {"title", "extra.item_type", "extra.value"}
+
+    _Extended.remove_namespace("extra")
+    assert expand_field_patterns(_Extended, ["*"]) == {"title"}
+
+
+def test_odm_helper_validates_against_added_namespaces():
+    @model()
+    class _Extended(Model):
+        title = Keyword()
+
+    helper = OdmHelper(_Extended)
+    with pytest.raises(HowlerValueError):
+        helper.update("extra.value", "value")
+
+    _Extended.add_namespace("extra", Compound(_Item))
+    try:
+        assert helper.update("extra.value", "value").key == "extra.value"
+    finally:
+        _Extended.remove_namespace("extra")
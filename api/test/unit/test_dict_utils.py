@@ -1,4 +1,19 @@
-from howler.utils.dict_utils import flatten_deep
+from howler.odm import Compound, Keyword, List, Mapping, model
+from howler.odm.base import Model
+from howler.utils.dict_utils import extra_keys, flatten, flatten_deep
+
+
+@model()
+class _Labels(Model):
+    name = Keyword()
+
+
+@model()
+class _Document(Model):
+    title = Keyword()
+    labels = Compound(_Labels)
+    tags = Mapping(Keyword())
+    items = List(Compound(_Labels))
 
 
 def test_flatten_deep():
@@ -26,3 +41,28 @@ def test_flatten_deep():
         "nested.list.field2": ["test5", "test6", "test8", "test9"],
         "nested.list.list": [],
     }
+
+
+def test_flatten_with_odm_keeps_unknown_dicts():
+    data = {"title": "test", "labels": {"name": "label"}, "raw": {"nested": {"field": 1}}, "empty": {}}
+
+    assert flatten(data) == {"title": "test", "labels.name": "label", "raw.nested.field": 1}
+    assert flatten(data, odm=_Document) == {
+        "title": "test",
+        "labels.name": "label",
+        "raw": {"nested": {"field": 1}},
+        "empty": {},
+    }
+    assert list(flatten(data, odm=_Document).keys()) == ["title", "labels.name", "raw", "empty"]
+
+
+def test_extra_keys():
+    data = {
+        "title": "test",
+        "labels": {"name": "label", "colour": "red"},
+        "tags": {"any": "value", "other": "value"},
+        "items": [{"name": "item"}, {"size": 1}],
+        "missing": {"field": True},
+    }
+
+    assert extra_keys(_Document, data) == {"labels.colour", "items.size", "missing.field"}
@@ -0,0 +1,43 @@
+"""Unit tests for looking up which values of a field already exist on ESCollection."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from howler.datastore.collection import ESCollection
+
+
+@pytest.fixture(autouse=True)
+def skip_ensure_collection():
+    ESCollection.IGNORE_ENSURE_COLLECTION = True
+    yield
+    ESCollection.IGNORE_ENSURE_COLLECTION = False
+
+
+@pytest.fixture()
+def collection():
+    return ESCollection(MagicMock(), "testcol")
+
+
+def test_existing_values_aggregated_in_one_search(collection):
+    collection.datastore.client.search.return_value = {"aggregations": {"existing": {"buckets": [{"key": "b"}]}}}
+
+    assert collection.get_existing_values("howler.hash", ["a", "b", "a"]) == {"b"}
+
+    collection.datastore.client.search.assert_called_once()
+    kwargs = collection.datastore.client.search.call_args.kwargs
+    assert kwargs["index"] == collection.name
+    assert kwargs["query"] == {"terms": {"howler.hash": ["a", "b"]}}
+    assert kwargs["size"] == 0
+    assert kwargs["aggs"] == {"existing": {"terms": {"field": "howler.hash", "size": 2}}}
+
+
+def test_existing_values_chunked(collection):
+    collection.datastore.client.search.return_value = {"aggregations": {"existing": {"buckets": []}}}
+
+    assert (
+        collection.get_existing_values("howler.hash", [str(i) for i in range(ESCollection.MAX_SEARCH_ROWS + 1)])
+        == set()
+    )
+
+    assert collection.datastore.client.search.call_count == 2
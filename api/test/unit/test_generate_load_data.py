@@ -0,0 +1,107 @@
+import io
+import json
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from howler.external.generate_load_data import (
+    DocumentGenerator,
+    LoadProfile,
+    bulk_payload,
+    document_id,
+    send_batches,
+    write_ndjson,
+)
+from howler.odm.models.case import Case
+from howler.odm.models.event import Event
+from howler.odm.models.hit import Hit
+from howler.utils.dict_utils import extra_keys
+
+UNTIL = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def generator(**kwargs):
+    return DocumentGenerator(LoadProfile(**{"hits": 40, "events": 10, "cases": 5, **kwargs}), seed="test", until=UNTIL)
+
+
+@pytest.mark.parametrize("document_type,model", [("hit", Hit), ("event", Event), ("case", Case)])
+def test_documents_are_valid(document_type, model):
+    for document in generator().generate(document_type):
+        data = {key: value for key, value in document.items() if key != "id" and not key.startswith("__")}
+
+        assert not extra_keys(model, data)
+        model(data)
+
+
+def test_documents_are_reproducible():
+    first = [
+        json.dumps(document) for document_type in ("hit", "case") for document in generator().generate(document_type)
+    ]
+    second = [
+        json.dumps(document) for document_type in ("hit", "case") for document in generator().generate(document_type)
+    ]
+
+    assert first == second
+    assert first != [
+        json.dumps(document)
+        for document_type in ("hit", "case")
+        for document in DocumentGenerator(LoadProfile(hits=40, cases=5), seed="other", until=UNTIL).generate(
+            document_type
+        )
+    ]
+
+
+def test_documents_reference_the_dataset():
+    load_generator = generator(max_related=5, max_case_items=30)
+    event_ids = {document_id("test", "event", position) for position in range(10)}
+    hit_ids = {hit["howler"]["id"] for hit in load_generator.generate("hit")}
+
+    assert hit_ids == {document_id("test", "hit", position) for position in range(40)}
+    assert all(set(hit["howler"]["related"]) <= event_ids for hit in load_generator.generate("hit"))
+
+    for case in load_generator.generate("case"):
+        for item in case["items"]:
+            if item["type"] == "hit":
+                assert item["value"] in hit_ids
+            elif item["type"] == "event":
+                assert item["value"] in event_ids
+
+
+def test_cardinalities():
+    hits = list(generator(hits=500, analytics=4, detections=2, users=3, labels=5).generate("hit"))
+
+    assert len({hit["howler"]["analytic"] for hit in hits}) == 4
+    assert len({hit["howler"]["detection"] for hit in hits}) == 2
+    assert {hit["howler"]["assignment"] for hit in hits} <= {"unassigned", *generator(users=3).users}
+    assert len({label for hit in hits for labels in hit["howler"]["labels"].values() for label in labels}) <= 5
+
+    timestamps = [datetime.fromisoformat(hit["timestamp"].replace("Z", "+00:00")) for hit in hits]
+    assert all(0 <= (UNTIL - timestamp).days < 30 for timestamp in timestamps)
+
+
+def test_write_ndjson():
+    output = io.StringIO()
+
+    assert write_ndjson(generator().generate("event"), output) == 10
+    assert [json.loads(line)["howler"]["id"] for line in output.getvalue().splitlines()] == [
+        document_id("test", "event", position) for position in range(10)
+    ]
+
+
+def test_send_batches():
+    def bulk(*, operations):
+        lines = operations.splitlines()
+        items = [{"index": {"_id": json.loads(line)["index"]["_id"], "status": 201}} for line in lines[::2]]
+        items[-1]["index"]["error"] = {"type": "mapper_parsing_exception"}
+        return {"errors": True, "items": items}
+
+    collection = MagicMock(index_name="howler-hit_hot")
+    collection.with_retries.side_effect = lambda func, **kwargs: func(**kwargs)
+    collection.datastore.client.bulk.side_effect = bulk
+
+    assert send_batches(collection, generator(hits=25).generate("hit"), batch_size=10) == (22, 3)
+    assert collection.datastore.client.bulk.call_count == 3
+
+    payload = bulk_payload("howler-hit_hot", [{"id": "a", "value": 1}])
+    assert payload == '{"index": {"_index": "howler-hit_hot", "_id": "a"}}\n{"id": "a", "value": 1}\n'
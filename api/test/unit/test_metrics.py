@@ -0,0 +1,84 @@
+from unittest.mock import MagicMock
+
+from flask import Blueprint, Flask
+from prometheus_client import REGISTRY, CollectorRegistry
+
+from howler.common import metrics
+from howler.remote.datatypes import retry_call
+
+
+def _sample(name, labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def test_request_duration_labels():
+    app = Flask("metrics_test_app")
+    blueprint = Blueprint("metrics_test", __name__)
+
+    @blueprint.route("/answer", methods=["GET", "POST"])
+    def answer():
+        return "42", 201
+
+    app.register_blueprint(blueprint)
+    metrics.setup_metrics(app)
+    client = app.test_client()
+
+    name = f"{metrics.METRIC_PREFIX}_http_request_duration_seconds_count"
+    matched = {"blueprint": "metrics_test", "endpoint": "metrics_test.answer", "method": "POST", "status": "201"}
+    unmatched = {"blueprint": "none", "endpoint": "none", "method": "GET", "status": "404"}
+    before = _sample(name, matched), _sample(name, unmatched)
+
+    assert client.post("/answer").status_code == 201
+    assert client.get("/nowhere/to/be/found").status_code == 404
+
+    assert _sample(name, matched) == before[0] + 1
+    assert _sample(name, unmatched) == before[1] + 1
+
+
+def test_datastore_method_names():
+    class IndicesClient:
+        def exists(self):
+            pass
+
+    class Elasticsearch:
+        def search(self):
+            pass
+
+    assert metrics.datastore_method(IndicesClient().exists) == "indices.exists"
+    assert metrics.datastore_method(Elasticsearch().search) == "search"
+
+
+def test_redis_command_names():
+    class Script:
+        def __call__(self):
+            pass
+
+    class Redis:
+        def hget(self):
+            pass
+
+    assert metrics.redis_command(Redis().hget) == "hget"
+    assert metrics.redis_command(Script()) == "script"
+
+
+def test_retry_call_observes_duration():
+    func = MagicMock(return_value=True)
+    func.__name__ = "llen"
+
+    name = f"{metrics.METRIC_PREFIX}_redis_call_duration_seconds_count"
+    before = _sample(name, {"command": "llen"})
+
+    retry_call(func, "queue")
+
+    assert _sample(name, {"command": "llen"}) == before + 1
+
+
+def test_get_registry_aggregates_processes(monkeypatch, tmp_path):
+    monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+    assert metrics.get_registry() is REGISTRY
+
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    registry = metrics.get_registry()
+
+    assert isinstance(registry, CollectorRegistry)
+    assert registry is not REGISTRY
@@ -1,7 +1,10 @@
+import gzip
+import json
 from typing import cast
 
 import pytest
 from flask import Flask
+from werkzeug.exceptions import BadRequest
 
 import howler.api as api
 from howler.odm import Model
@@ -158,3 +161,25 @@ def test_coerce_response_data_passthrough_for_plain_values():
     coerced = api._coerce_response_data(payload)
 
     assert coerced is payload
+
+
+def test_get_json_body_inflates_gzip(request_context):
+    body = [{"howler.hash": "abc"}]
+
+    with request_context.test_request_context(method="POST", json=body):
+        assert api.get_json_body() == body
+
+    with request_context.test_request_context(
+        method="POST",
+        data=gzip.compress(json.dumps(body).encode()),
+        headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+    ):
+        assert api.get_json_body() == body
+
+    with request_context.test_request_context(
+        method="POST",
+        data=b"not gzip",
+        headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+    ):
+        with pytest.raises(BadRequest):
+            api.get_json_body()
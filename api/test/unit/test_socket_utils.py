@@ -1,6 +1,6 @@
 from unittest.mock import patch
 
-from howler.utils.socket_utils import check_action
+from howler.utils.socket_utils import check_action, send_heartbeats
 
 _ID = "test_id"
 _USER = "test_user"
@@ -105,3 +105,20 @@ class TestCheckActionViewing:
         check_action(_ID, "viewing", False, outstanding_actions=[], **_KWARGS)
 
         emit.assert_not_called()
+
+
+class TestSendHeartbeats:
+    """Tests for refreshing the presence of open viewers."""
+
+    @patch("howler.services.viewer_service.heartbeat")
+    def test_heartbeats_each_viewed_entity_once(self, heartbeat):
+        outstanding_actions = [
+            ("hit-1", "stop_viewing", False),
+            ("hit-1", "stop_viewing", False),
+            ("hit-2", "stop_typing", True),
+            ("case-1", "stop_viewing", False),
+        ]
+
+        send_heartbeats(outstanding_actions, **_KWARGS)
+
+        assert sorted(call.args for call in heartbeat.call_args_list) == [("case-1", _USER), ("hit-1", _USER)]
@@ -0,0 +1,110 @@
+"""Unit tests for sliced, throttled update_by_query with progress reporting on ESCollection."""
+
+from unittest.mock import MagicMock
+
+import elasticsearch
+import pytest
+from elastic_transport import ApiResponseMeta
+
+from howler.datastore.collection import ESCollection
+
+
+@pytest.fixture(autouse=True)
+def skip_ensure_collection():
+    ESCollection.IGNORE_ENSURE_COLLECTION = True
+    yield
+    ESCollection.IGNORE_ENSURE_COLLECTION = False
+
+
+@pytest.fixture()
+def collection():
+    ds = MagicMock()
+    ds.client.update_by_query.return_value = {"task": "node:1"}
+    return ESCollection(ds, "testcol")
+
+
+def _timeout():
+    meta = ApiResponseMeta(status=408, http_version="1.1", headers={}, duration=0.0, node=None)
+    return elasticsearch.ApiError("timeout_exception", meta, {})
+
+
+def _status(updated, total, conflicts=0):
+    return {"updated": updated, "total": total, "version_conflicts": conflicts}
+
+
+def _done(updated, total, conflicts=0):
+    return {
+        "completed": True,
+        "task": {"status": _status(updated, total, conflicts)},
+        "response": _status(updated, total, conflicts),
+    }
+
+
+def test_sliced_by_default(collection):
+    collection.datastore.client.tasks.get.return_value = _done(3, 3)
+
+    assert collection.update_by_query("*:*", [(ESCollection.UPDATE_SET, "a", 1)]) == 3
+
+    kwargs = collection.datastore.client.update_by_query.call_args.kwargs
+    assert kwargs["slices"] == "auto"
+    assert kwargs["requests_per_second"] is None
+
+
+def test_throttling_passed_through(collection):
+    collection.datastore.client.tasks.get.return_value = _done(3, 3)
+
+    collection.update_by_query("*:*", [(ESCollection.UPDATE_SET, "a", 1)], slices=4, requests_per_second=500)
+
+    kwargs = collection.datastore.client.update_by_query.call_args.kwargs
+    assert kwargs["slices"] == 4
+    assert kwargs["requests_per_second"] == 500
+
+
+def test_progress_reported_while_running(collection):
+    responses = iter(
+        [
+            _timeout(),
+            {"completed": False, "task": {"status": _status(40, 100, 1)}},
+            _timeout(),
+            {"completed": False, "task": {"status": _status(80, 100, 2)}},
+            _done(100, 100),
+        ]
+    )
+
+    def tasks_get(**_):
+        response = next(responses)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    collection.datastore.client.tasks.get.side_effect = tasks_get
+    progress = MagicMock()
+
+    assert collection.update_by_query("*:*", [(ESCollection.UPDATE_SET, "a", 1)], progress_callback=progress) == 100
+
+    assert [call.args for call in progress.call_args_list] == [(40, 100, 1), (80, 100, 2), (100, 100, 0)]
+
+    # The blocking wait uses a short timeout so progress can be reported in between
+    blocking_calls = [
+        call for call in collection.datastore.client.tasks.get.call_args_list if call.kwargs.get("wait_for_completion")
+    ]
+    assert all(call.kwargs["timeout"] == ESCollection.TASK_PROGRESS_INTERVAL for call in blocking_calls)
+
+
+def test_progress_accumulates_across_conflict_retries(collection):
+    collection.datastore.client.tasks.get.side_effect = [
+        _done(60, 100, 40),
+        _done(40, 40),
+    ]
+    progress = MagicMock()
+
+    assert collection.update_by_query("*:*", [(ESCollection.UPDATE_SET, "a", 1)], progress_callback=progress) == 100
+
+    progress.assert_called_once_with(100, 100, 40)
+
+
+def test_unexpected_task_error_fails_update(collection):
+    meta = ApiResponseMeta(status=500, http_version="1.1", headers={}, duration=0.0, node=None)
+    collection.datastore.client.tasks.get.side_effect = elasticsearch.ApiError("illegal_state", meta, {})
+
+    assert collection.update_by_query("*:*", [(ESCollection.UPDATE_SET, "a", 1)]) is False
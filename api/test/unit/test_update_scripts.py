@@ -0,0 +1,94 @@
+"""Unit tests for the stored painless scripts used by ESCollection.update and update_by_query."""
+
+from unittest.mock import MagicMock
+
+import elasticsearch
+import pytest
+from elastic_transport import ApiResponseMeta
+
+from howler.datastore.collection import ESCollection
+from howler.datastore.scripts import STORED_SCRIPTS, UPDATE_OPERATIONS_SCRIPT, UPDATE_OPERATIONS_SCRIPT_ID
+from howler.datastore.store import ESStore
+
+
+@pytest.fixture(autouse=True)
+def skip_ensure_collection():
+    ESCollection.IGNORE_ENSURE_COLLECTION = True
+    yield
+    ESCollection.IGNORE_ENSURE_COLLECTION = False
+
+
+@pytest.fixture()
+def store():
+    store = ESStore()
+    store.client = MagicMock()
+    return store
+
+
+OPERATIONS = [
+    (ESCollection.UPDATE_SET, "howler.status", "open"),
+    (ESCollection.UPDATE_APPEND, "howler.log", {"key": "howler.status"}),
+    (ESCollection.UPDATE_INC, "count", 1),
+]
+
+
+def test_operations_passed_as_params(store):
+    collection = ESCollection(store, "testcol")
+
+    script = collection._create_scripts_from_operations(OPERATIONS)
+
+    assert script == {
+        "id": UPDATE_OPERATIONS_SCRIPT_ID,
+        "params": {
+            "ops": [
+                {"op": "SET", "path": ["howler", "status"], "value": "open"},
+                {"op": "APPEND", "path": ["howler", "log"], "value": {"key": "howler.status"}},
+                {"op": "INC", "path": ["count"], "value": 1},
+            ]
+        },
+    }
+
+
+def test_script_does_not_depend_on_operations(store):
+    collection = ESCollection(store, "testcol")
+
+    first = collection._create_scripts_from_operations(OPERATIONS)
+    second = collection._create_scripts_from_operations([(ESCollection.UPDATE_REMOVE, "howler.labels.generic", "a")])
+
+    assert first["id"] == second["id"]
+
+
+def test_scripts_registered_once(store):
+    assert store.ensure_stored_scripts() is True
+    assert store.ensure_stored_scripts() is True
+
+    assert store.client.put_script.call_count == len(STORED_SCRIPTS)
+    store.client.put_script.assert_any_call(
+        id=UPDATE_OPERATIONS_SCRIPT_ID, script={"lang": "painless", "source": UPDATE_OPERATIONS_SCRIPT}
+    )
+
+
+def test_inline_fallback_when_not_allowed(store):
+    meta = ApiResponseMeta(status=403, http_version="1.1", headers={}, duration=0.0, node=None)
+    store.client.put_script.side_effect = elasticsearch.AuthorizationException("forbidden", meta, {})
+
+    collection = ESCollection(store, "testcol")
+    script = collection._create_scripts_from_operations(OPERATIONS)
+
+    assert "id" not in script
+    assert script["source"] == UPDATE_OPERATIONS_SCRIPT
+    assert len(script["params"]["ops"]) == 3
+
+    # The refusal is remembered, so the cluster isn't asked again
+    collection._create_scripts_from_operations(OPERATIONS)
+    assert store.client.put_script.call_count == 1
+
+
+def test_transient_failure_retried(store):
+    meta = ApiResponseMeta(status=503, http_version="1.1", headers={}, duration=0.0, node=None)
+    store.client.put_script.side_effect = [elasticsearch.ApiError("unavailable", meta, {})] + [
+        {"acknowledged": True}
+    ] * len(STORED_SCRIPTS)
+
+    assert store.ensure_stored_scripts() is False
+    assert store.ensure_stored_scripts() is True
@@ -0,0 +1,104 @@
+"""
+UserQuotaTracker - Unique tokens from begin, token-specific release on end, rejection returns None, local pre-check
+                   admission below the configured ratio, expiry of the observed count, local tokens never reach redis
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from howler.remote.datatypes.user_quota_tracker import LOCAL_SLOT_PREFIX, UserQuotaTracker
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    client.script_result = [1, 1]
+    client.register_script.return_value = MagicMock(side_effect=lambda **_: client.script_result)
+    return client
+
+
+def test_begin_returns_unique_tokens(client):
+    uqt = UserQuotaTracker("test-quota", redis=client)
+
+    tokens = {uqt.begin("user", 5) for _ in range(5)}
+
+    assert len(tokens) == 5
+    assert all(tokens)
+
+
+def test_begin_passes_key_and_token_to_script(client):
+    uqt = UserQuotaTracker("test-quota", timeout=30, redis=client)
+
+    token = uqt.begin("user", 5)
+
+    script = client.register_script.return_value
+    script.assert_called_once_with(keys=["test-quota-user"], args=[5, 30, token])
+
+
+def test_begin_rejected_returns_none(client):
+    client.script_result = [0, 5]
+    uqt = UserQuotaTracker("test-quota", redis=client)
+
+    assert uqt.begin("user", 5) is None
+
+
+def test_end_removes_own_token(client):
+    uqt = UserQuotaTracker("test-quota", redis=client)
+
+    uqt.end("user", "abc")
+
+    client.zrem.assert_called_once_with("test-quota-user", "abc")
+    client.zpopmin.assert_not_called()
+
+
+def test_end_without_token_pops_oldest(client):
+    uqt = UserQuotaTracker("test-quota", redis=client)
+
+    uqt.end("user")
+
+    client.zpopmin.assert_called_once_with("test-quota-user")
+
+
+def test_local_precheck_disabled_by_default(client):
+    uqt = UserQuotaTracker("test-quota", redis=client)
+
+    for _ in range(3):
+        assert not uqt.begin("user", 100).startswith(LOCAL_SLOT_PREFIX)
+
+    assert client.register_script.return_value.call_count == 3
+
+
+def test_local_precheck_admits_below_ratio(client):
+    uqt = UserQuotaTracker("test-quota", redis=client, local_ratio=0.5, local_ttl=60)
+    script = client.register_script.return_value
+
+    # The first request always goes to redis, which reports a single active slot
+    assert not uqt.begin("user", 10).startswith(LOCAL_SLOT_PREFIX)
+
+    # 1 remote + 4 local slots fit within 50% of a quota of 10
+    local_tokens = [uqt.begin("user", 10) for _ in range(4)]
+    assert all(token.startswith(LOCAL_SLOT_PREFIX) for token in local_tokens)
+    assert script.call_count == 1
+
+    # The next request would exceed the ratio, so redis is consulted again
+    assert not uqt.begin("user", 10).startswith(LOCAL_SLOT_PREFIX)
+    assert script.call_count == 2
+
+    # Releasing a local token never reaches redis
+    for token in local_tokens:
+        uqt.end("user", token)
+    client.zrem.assert_not_called()
+    assert "user" not in uqt._local_active
+
+
+def test_local_precheck_expires(client):
+    uqt = UserQuotaTracker("test-quota", redis=client, local_ratio=0.5, local_ttl=1)
+
+    with patch("howler.remote.datatypes.user_quota_tracker.time.monotonic", return_value=100.0):
+        uqt.begin("user", 10)
+
+    with patch("howler.remote.datatypes.user_quota_tracker.time.monotonic", return_value=102.0):
+        assert not uqt.begin("user", 10).startswith(LOCAL_SLOT_PREFIX)
+
+    assert client.register_script.return_value.call_count == 2
@@ -0,0 +1,126 @@
+"""Unit tests for streaming documents with a point in time, and the view cleanup cronjob built on it."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from howler.cronjobs import view_cleanup
+from howler.datastore.bulk import ElasticBulkPlan
+from howler.datastore.collection import ESCollection
+from howler.odm.models.user import User
+
+
+@pytest.fixture(autouse=True)
+def skip_ensure_collection():
+    ESCollection.IGNORE_ENSURE_COLLECTION = True
+    yield
+    ESCollection.IGNORE_ENSURE_COLLECTION = False
+
+
+@pytest.fixture()
+def collection():
+    ds = MagicMock()
+    ds.client.open_point_in_time.return_value = {"id": "pit-1"}
+    return ESCollection(ds, "testcol")
+
+
+def _page(*ids, pit_id="pit-1"):
+    return {"pit_id": pit_id, "hits": {"hits": [{"_id": _id, "_index": "testcol", "sort": [_id]} for _id in ids]}}
+
+
+def test_scan_with_pit_pages_with_search_after(collection):
+    pages = [_page("a", "b"), _page("c", pit_id="pit-2"), _page(pit_id="pit-2")]
+    calls = []
+
+    def search(**kwargs):
+        calls.append(json.loads(json.dumps(kwargs)))
+        return pages[len(calls) - 1]
+
+    collection.datastore.client.search.side_effect = search
+
+    assert [hit["_id"] for hit in collection.scan_with_pit(source=False, size=2)] == ["a", "b", "c"]
+
+    assert [call.get("search_after") for call in calls] == [None, ["b"], ["c"]]
+    assert [call["pit"]["id"] for call in calls] == ["pit-1", "pit-1", "pit-2"]
+    assert all(call["sort"] == [{"_shard_doc": "asc"}] and call["_source"] is False for call in calls)
+    assert "from_" not in calls[0]
+
+    collection.datastore.client.close_point_in_time.assert_called_once_with(id="pit-2")
+
+
+def test_scan_with_pit_sliced(collection):
+    collection.datastore.client.search.return_value = _page()
+
+    list(collection.scan_with_pit(sort=[{"id": "asc"}], index="testcol-000001", slice_id=1, slice_max=4))
+
+    collection.datastore.client.open_point_in_time.assert_called_once_with(index="testcol-000001", keep_alive="5m")
+    kwargs = collection.datastore.client.search.call_args.kwargs
+    assert kwargs["slice"] == {"id": 1, "max": 4}
+    assert kwargs["sort"] == [{"id": "asc"}, {"_shard_doc": "asc"}]
+
+
+def test_scan_with_pit_closed_when_abandoned(collection):
+    collection.datastore.client.search.return_value = _page("a", "b")
+
+    stream = collection.scan_with_pit()
+    next(stream)
+    stream.close()
+
+    collection.datastore.client.close_point_in_time.assert_called_once_with(id="pit-1")
+
+
+def _user(uname, dashboard=(), favourite_views=()):
+    return {
+        "_id": uname,
+        "_index": "user",
+        "_source": {
+            "dashboard": [{"entry_id": entry, "type": "view", "config": "{}"} for entry in dashboard],
+            "favourite_views": list(favourite_views),
+        },
+    }
+
+
+def test_view_cleanup_updates_changed_users_in_bulk():
+    storage = MagicMock()
+    storage.view.scan_with_pit.return_value = iter([{"_id": "view-1"}, {"_id": "view-2"}])
+    storage.user.scan_with_pit.return_value = iter(
+        [
+            _user("unchanged", ["view-1"], ["view-2"]),
+            _user("stale_pin", ["view-1", "deleted"]),
+            _user("stale_favourite", favourite_views=["deleted", "view-1"]),
+            _user("analytic_pin"),
+        ]
+    )
+    storage.user.get_bulk_plan.side_effect = lambda: ElasticBulkPlan(["user"], User)
+
+    with patch("howler.common.loader.datastore", return_value=storage):
+        view_cleanup.execute()
+
+    storage.user.save.assert_not_called()
+    storage.user.bulk.assert_called_once()
+
+    lines = [json.loads(line) for line in storage.user.bulk.call_args.args[0].get_plan_data().splitlines()]
+    assert lines == [
+        {"update": {"_index": "user", "_id": "stale_pin"}},
+        {"doc": {"dashboard": [{"entry_id": "view-1", "type": "view", "config": "{}"}]}},
+        {"update": {"_index": "user", "_id": "stale_favourite"}},
+        {"doc": {"favourite_views": ["view-1"]}},
+    ]
+
+
+def test_view_cleanup_batches_updates():
+    storage = MagicMock()
+    storage.view.scan_with_pit.return_value = iter([])
+    storage.user.scan_with_pit.return_value = iter(
+        [_user(f"user-{i}", ["deleted"]) for i in range(view_cleanup.UPDATE_BATCH_SIZE + 1)]
+    )
+    storage.user.get_bulk_plan.side_effect = lambda: ElasticBulkPlan(["user"], User)
+
+    with patch("howler.common.loader.datastore", return_value=storage):
+        view_cleanup.execute()
+
+    assert [len(call.args[0].operations) for call in storage.user.bulk.call_args_list] == [
+        view_cleanup.UPDATE_BATCH_SIZE,
+        1,
+    ]
@@ -1,6 +1,6 @@
 from importlib.metadata import PackageNotFoundError, version
 
-from howler_client.client import Client
+from howler_client.client import AsyncHowlerClient, Client
 from howler_client.connection import Connection
 
 try:
@@ -44,3 +44,45 @@ def get_client(
         authenticate,
     )
     return Client(connection)
+
+
+def get_async_client(
+    server,
+    auth=None,
+    cert=None,
+    debug=lambda x: None,
+    headers=None,
+    retries=RETRY_FOREVER,
+    apikey=None,
+    verify=True,
+    timeout=None,
+    throw_on_bad_request=True,
+    throw_on_max_retries=True,
+    authenticate=None,
+    http2=True,
+    max_connections=100,
+    max_keepalive_connections=20,
+    max_concurrency=50,
+):
+    "Initialize an asynchronous howler client object, requires the async extra"
+    from howler_client.async_connection import AsyncConnection
+
+    connection = AsyncConnection(
+        server,
+        auth,
+        cert,
+        debug,
+        headers,
+        retries,
+        apikey,
+        verify,
+        timeout,
+        throw_on_bad_request,
+        throw_on_max_retries,
+        authenticate,
+        http2,
+        max_connections,
+        max_keepalive_connections,
+        max_concurrency,
+    )
+    return AsyncHowlerClient(connection)
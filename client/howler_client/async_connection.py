@@ -0,0 +1,251 @@
+import asyncio
+import base64
+import random
+import sys
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, MutableMapping, Optional
+
+import httpx
+
+from howler_client.common.utils import ClientError
+from howler_client.logger import get_logger
+
+if sys.version_info >= (3, 11):
+    from typing import Self
+else:
+    from typing_extensions import Self
+
+SUPPORTED_APIS = {"v1"}
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+MAX_BACKOFF = 30.0
+
+logger = get_logger("async_connection")
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    "Return the delay requested by a Retry-After header, in seconds"
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _backoff(retries: int) -> float:
+    "Exponential backoff with full jitter, capped at MAX_BACKOFF seconds"
+    return random.uniform(0, min(MAX_BACKOFF, 0.1 * 2**retries))  # noqa: S311
+
+
+class AsyncConnection(object):
+    """Abstraction for executing network requests to the Howler API from asyncio code.
+
+    Requests are sent through a single pooled httpx client, over HTTP/2 when the server supports it. The number of
+    requests in flight is bounded by ``max_concurrency``.
+    """
+
+    def __init__(  # pylint: disable=R0913
+        self: Self,
+        server: str,
+        auth: str | tuple[str, str] | None = None,
+        cert: str | tuple[str, str] | None = None,
+        debug: Callable[[str], None] = lambda x: None,
+        headers: MutableMapping[str, str] | None = None,
+        retries: int = 0,
+        apikey: tuple[str, str] | None = None,
+        verify: bool = True,
+        timeout: float | None = None,
+        throw_on_bad_request: bool = True,
+        throw_on_max_retries: bool = True,
+        authenticate: Callable[[str | tuple[str, str] | None, tuple[str, str] | None], str] | None = None,
+        http2: bool = True,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        max_concurrency: int = 50,
+    ):
+        self.apikey = apikey
+        self.authenticate = authenticate
+        self.debug = debug
+        self.max_retries = retries
+        self.server = server
+        self.default_timeout = timeout
+        self.throw_on_bad_request = throw_on_bad_request
+        self.throw_on_max_retries = throw_on_max_retries
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+        session_headers: dict[str, str] = {"Content-Type": "application/json"}
+
+        if self.authenticate:
+            session_headers["Authorization"] = f"Bearer {self.authenticate(auth, apikey)}"
+        elif auth:
+            if not isinstance(auth, str):
+                auth = base64.b64encode(":".join(auth).encode("utf-8")).decode("utf-8")
+
+            if "." in auth:
+                logger.info("Using JWT Authentication")
+                session_headers["Authorization"] = f"Bearer {auth}"
+            else:
+                logger.info("Using Password Authentication")
+                session_headers["Authorization"] = f"Basic {auth}"
+        elif apikey:
+            logger.info("Using API Key Authentication")
+            session_headers["Authorization"] = (
+                f"Basic {base64.b64encode(':'.join(apikey).encode('utf-8')).decode('utf-8')}"
+            )
+
+        if headers:
+            logger.debug("Adding additional headers")
+            session_headers.update(headers)
+
+        self.session = httpx.AsyncClient(
+            headers=session_headers,
+            verify=verify,
+            cert=cert,
+            http2=http2,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+        )
+
+    async def validate(self: Self) -> None:
+        "Ensure the server exposes a supported API version"
+        if "pytest" in sys.modules:
+            logger.info("Skipping API validation, running in a test environment")
+            return
+
+        r = await self.get("api/")
+        if not isinstance(r, list) or not set(r).intersection(SUPPORTED_APIS):
+            raise ClientError("Supported APIS (%s) are not available" % SUPPORTED_APIS, 400)
+
+    async def close(self: Self) -> None:
+        "Close the pooled connections"
+        await self.session.aclose()
+
+    def delete(self, path: str, **kw) -> Awaitable[Any]:
+        "Execute a DELETE request"
+        # httpx only accepts a request body on DELETE through the generic request method
+        return self.request(self._method("DELETE"), path, None, **kw)
+
+    def download(self, path: str, process: Callable[[httpx.Response], Any], **kw) -> Awaitable[Any]:
+        "Download a file from the remote server"
+        return self.request(self.session.get, path, process, **kw)
+
+    def get(self, path: str, **kw) -> Awaitable[Any]:
+        "Execute a GET request"
+        return self.request(self.session.get, path, None, **kw)
+
+    def post(self, path: str, **kw) -> Awaitable[Any]:
+        "Execute a POST request"
+        return self.request(self.session.post, path, None, **kw)
+
+    def put(self, path: str, **kw) -> Awaitable[Any]:
+        "Execute a PUT request"
+        return self.request(self.session.put, path, None, **kw)
+
+    def _method(self, method: str) -> Callable[..., Awaitable[httpx.Response]]:
+        def _send(url, **kw):
+            return self.session.request(method, url, **kw)
+
+        return _send
+
+    async def request(self, func, path, process, **kw):  # noqa: C901
+        """Main request function - prepare and execute a request.
+
+        When no ``process`` function is supplied, the response body is decoded once and its ``api_response`` returned.
+        Connection errors and 429/502/503/504 responses are retried with exponential backoff, honouring ``Retry-After``.
+        """
+        self.debug(path)
+
+        # Raw request bodies are passed as content to httpx
+        if isinstance(kw.get("data"), (str, bytes)):
+            kw["content"] = kw.pop("data")
+
+        if self.default_timeout is not None:
+            kw.setdefault("timeout", self.default_timeout)
+
+        retries = 0
+        delay = 0.0
+        while self.max_retries < 1 or retries <= self.max_retries:
+            if retries:
+                await asyncio.sleep(delay)
+
+            try:
+                async with self._semaphore:
+                    response = await func(f"{self.server}/{path}", **kw)
+            except (httpx.ConnectError, httpx.RemoteProtocolError, httpx.ReadError, httpx.PoolTimeout):
+                retries += 1
+                delay = _backoff(retries)
+                continue
+
+            if "XSRF-TOKEN" in response.cookies:
+                self.session.headers["X-XSRF-TOKEN"] = response.cookies["XSRF-TOKEN"]
+
+            if response.status_code in RETRY_STATUS_CODES:
+                retries += 1
+                retry_after = _retry_after(response)
+                delay = min(MAX_BACKOFF, retry_after) if retry_after is not None else _backoff(retries)
+                logger.debug("%s on %s, retrying in %.2fs", response.status_code, path, delay)
+                continue
+
+            resp_data = None
+            if response.content and (process is None or not response.is_success):
+                try:
+                    resp_data = response.json()
+                except ValueError:
+                    logger.warning(
+                        "There was an error when decoding the JSON response from the server, no warnings will be shown."
+                    )
+
+            if isinstance(resp_data, dict):
+                for warning in resp_data.get("api_warning", None) or []:
+                    logger.warning(warning)
+
+            if response.is_success:
+                if process is not None:
+                    return process(response)
+
+                if response.status_code == 204 or not isinstance(resp_data, dict):
+                    return None
+
+                return resp_data["api_response"]
+
+            if response.status_code == 400 and not self.throw_on_bad_request:
+                logger.error("%s: %s", response.status_code, response.text)
+                return None
+
+            if not isinstance(resp_data, dict) or "api_error_message" not in resp_data:
+                raise ClientError(response.content, response.status_code)
+
+            api_response = resp_data.get("api_response") or []
+            message = "\n".join([item["error"] for item in api_response if isinstance(item, dict) and "error" in item])
+
+            err_msg = resp_data["api_error_message"]
+            if message:
+                err_msg = f"{err_msg}\n{message}"
+
+            logger.error("%s: %s", response.status_code, err_msg)
+
+            raise ClientError(
+                err_msg,
+                response.status_code,
+                api_version=resp_data.get("api_server_version"),
+                api_response=resp_data.get("api_response"),
+                resp_data=resp_data,
+            )
+
+        if self.throw_on_max_retries:
+            raise ClientError("Max retry reached, could not perform the request.", None)
+
+        logger.error("Max retry reached, could not perform the request.")
+        return None
@@ -1,18 +1,25 @@
+import asyncio
 import sys
+from typing import TYPE_CHECKING, Any, Awaitable, Optional, TypeVar
 
 from howler_client.common.utils import walk_api_path
 from howler_client.connection import Connection
 from howler_client.module.help import Help
-from howler_client.module.hit import Hit
-from howler_client.module.search import Search
+from howler_client.module.hit import AsyncHit, Hit
+from howler_client.module.search import AsyncSearch, Search
 from howler_client.module.user import User
-from howler_client.module.v2 import V2
+from howler_client.module.v2 import V2, AsyncV2
 
 if sys.version_info >= (3, 11):
     from typing import Self
 else:
     from typing_extensions import Self
 
+if TYPE_CHECKING:
+    from howler_client.async_connection import AsyncConnection
+
+_T = TypeVar("_T")
+
 
 class Client(object):
     "Main howler client object, wrapping API calls"
@@ -30,3 +37,54 @@ class Client(object):
         walk_api_path(self, [""], paths)
 
         self.__doc__ = "Client provides the following methods:\n\n" + "\n".join(["\n".join(p + "\n") for p in paths])
+
+
+class AsyncHowlerClient(object):
+    """Asynchronous howler client object, wrapping API calls.
+
+    It exposes the same modules as ``Client``, but every API method returns an awaitable. Use it as an async context
+    manager so the pooled connections are closed once done.
+    """
+
+    def __init__(self: Self, connection: "AsyncConnection"):
+        self._connection: "AsyncConnection" = connection
+
+        self.help = Help(self._connection)  # type: ignore[arg-type]
+        self.search = AsyncSearch(self._connection)
+        self.hit = AsyncHit(self._connection, self.search)  # type: ignore[arg-type]
+        self.user = User(self._connection)  # type: ignore[arg-type]
+        self.v2 = AsyncV2(self._connection)  # type: ignore[arg-type]
+
+    async def __aenter__(self: Self) -> Self:
+        await self._connection.validate()
+        return self
+
+    async def __aexit__(self: Self, *args: Any) -> None:
+        await self.close()
+
+    async def close(self: Self) -> None:
+        "Close the client's pooled connections"
+        await self._connection.close()
+
+    async def gather(
+        self: Self, *awaitables: Awaitable[_T], limit: Optional[int] = None, return_exceptions: bool = False
+    ) -> list[Any]:
+        """Await many API calls concurrently, with at most ``limit`` of them running at once.
+
+        Args:
+            *awaitables (Awaitable): The API calls to run, e.g. ``client.hit.create(batch)``
+            limit (int, optional): Maximum number of calls running at once. Defaults to the connection's
+                ``max_concurrency``.
+            return_exceptions (bool, optional): Return exceptions as results instead of raising the first one.
+                Defaults to False.
+
+        Returns:
+            list: The results, in the order the calls were given
+        """
+        semaphore = asyncio.Semaphore(limit or self._connection.max_concurrency)
+
+        async def _bounded(awaitable: Awaitable[_T]) -> _T:
+            async with semaphore:
+                return await awaitable
+
+        return await asyncio.gather(*(_bounded(a) for a in awaitables), return_exceptions=return_exceptions)
@@ -1,6 +1,9 @@
+import asyncio
+import gzip
 import json
 import sys
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from hashlib import sha256
 from typing import TYPE_CHECKING, Any, Literal, TypedDict
 
@@ -8,6 +11,7 @@ from howler_client.common.dict_utils import flatten
 from howler_client.common.utils import ClientError, api_path
 from howler_client.logger import get_logger
 from howler_client.module.comment import Comment
+from howler_client.module.search.chunk import chunked_list
 from howler_client.utils.json_encoders import BytesDatetimeEncoder, DatetimeEncoder
 
 if sys.version_info >= (3, 11):
@@ -31,6 +35,13 @@ UPDATE_APPEND_IF_MISSING = "APPEND_IF_MISSING"
 UPDATE_REMOVE = "REMOVE"
 UPDATE_DELETE = "DELETE"
 
+# Upper bound on the size of a single hit creation request body, before compression
+DEFAULT_MAX_CHUNK_BYTES = 5 * 1024 * 1024
+DEFAULT_CONCURRENCY = 4
+
+# Number of hashes looked up per facet query, keeping the query string of the request short enough for most servers
+HASH_LOOKUP_CHUNK_SIZE = 100
+
 UPDATE_OPERATIONS = [
     UPDATE_APPEND,
     UPDATE_APPEND_IF_MISSING,
@@ -50,6 +61,33 @@ class CreateHitsResponse(TypedDict):
     valid: list[dict[str, Any]]
     invalid: list[dict[str, Any]]
     warnings: list[str]
+    skipped: list[str]
+
+
+def _chunk_hits(hits: list[dict[str, Any]], max_chunk_bytes: int, compress: bool) -> list[bytes]:
+    "Serialize hits into JSON array bodies of at most max_chunk_bytes each, unless a single hit is larger"
+    bodies: list[bytes] = []
+    chunk: list[bytes] = []
+    size = 2
+
+    def _flush() -> None:
+        body = b"[" + b",".join(chunk) + b"]"
+        bodies.append(gzip.compress(body, compresslevel=6) if compress else body)
+
+    for hit in hits:
+        encoded = json.dumps(hit, cls=DatetimeEncoder).encode("utf-8")
+        if chunk and size + len(encoded) + 1 > max_chunk_bytes:
+            _flush()
+            chunk = []
+            size = 2
+
+        chunk.append(encoded)
+        size += len(encoded) + 1
+
+    if chunk:
+        _flush()
+
+    return bodies
 
 
 class Hit(object):
@@ -110,15 +148,25 @@ class Hit(object):
                 json=data,
             )
         except ClientError as e:
-            if e.api_response and isinstance(e.api_response, list):
-                for res in e.api_response:
-                    if "warn" in res and res["warn"]:
-                        logger.warning(res["warn"])
-
-                    if "error" in res and res["error"]:
-                        logger.error(res["error"])  # noqa: TRY400
+            self._log_map_errors(e)
             raise
 
+        self._log_map_warnings(result)
+
+        return result
+
+    def _log_map_errors(self: Self, error: ClientError) -> None:
+        "Log the warnings and errors of the documents rejected by create_from_map"
+        if error.api_response and isinstance(error.api_response, list):
+            for res in error.api_response:
+                if "warn" in res and res["warn"]:
+                    logger.warning(res["warn"])
+
+                if "error" in res and res["error"]:
+                    logger.error(res["error"])
+
+    def _log_map_warnings(self: Self, result: list[dict[str, str | list[str] | None]]) -> None:
+        "Log the warnings of the documents created by create_from_map"
         for res in result:
             if "warn" in res and res["warn"]:
                 warn = res["warn"]
@@ -128,8 +176,6 @@ class Hit(object):
                 else:
                     logger.warning(warn)
 
-        return result
-
     def generate_hash(self: Self, hit: dict[str, Any]) -> str:
         """Generate hash value for hit using the analytic, detection, and raw_data values from the hit data.
 
@@ -154,25 +200,66 @@ class Hit(object):
 
         return sha256(json.dumps(hash_contents, sort_keys=True, ensure_ascii=True).encode("utf-8")).hexdigest()
 
-    def create(  # noqa: C901
+    def create(
         self: Self,
         data: dict[str, Any] | list[dict[str, Any]],
         ignore_extra_values: bool = False,
         refresh: bool | Literal["true", "false", "wait_for"] = False,
+        skip_existing: bool = False,
+        max_chunk_bytes: int = DEFAULT_MAX_CHUNK_BYTES,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        compress: bool = False,
     ) -> CreateHitsResponse | None:
         """Create one or many hits using the howler schema.
 
+        Large inputs are split into requests of at most ``max_chunk_bytes`` of JSON, sent concurrently. Each request
+        is validated and created on its own, so when one of them is rejected the others may still have been created.
+
         Args:
             data (dict[str, Any] | list[dict[str, Any]]): The hit or list of hits to create
             ignore_extra_values (bool, optional): Whtether to ignore extra values, or throw an exception.
                 Defaults to False.
             refresh (bool | Literal["true", "false", "wait_for"], optional): Whether to refresh the index.
                 Defaults to False.
+            skip_existing (bool, optional): Have the server skip hits whose hash already exists, instead of looking the
+                hashes up before sending the hits. Requires a server supporting it. Defaults to False.
+            max_chunk_bytes (int, optional): Maximum size of the JSON sent in a single request. Defaults to 5MiB.
+            concurrency (int, optional): Maximum number of requests sent at once. Defaults to 4.
+            compress (bool, optional): Whether to gzip the request bodies. Requires a server accepting them.
+                Defaults to False.
 
         Returns:
             CreateHitsResponse | None: Created and invalid hits with warnings, or ``None`` when no
                 new hits are submitted (e.g., input is empty or all submitted hits already exist).
         """
+        final_hit_list = self._prepare_hits(data)
+        if final_hit_list and not skip_existing:
+            existing_hashes: set[str] = set()
+            for lookup in self._hash_lookups(final_hit_list):
+                existing_hashes.update(self._search.facet.hit("howler.hash", **lookup))
+
+            final_hit_list = self._drop_existing(final_hit_list, existing_hashes)
+
+        if len(final_hit_list) < 1:
+            logger.info("No hits to submit.")
+            return None
+
+        path, headers = self._create_request(ignore_extra_values, refresh, skip_existing, compress)
+        bodies = _chunk_hits(final_hit_list, max_chunk_bytes, compress)
+
+        def _post(body: bytes) -> CreateHitsResponse | None:
+            return self._connection.post(path, data=body, headers=headers)
+
+        if len(bodies) == 1 or concurrency < 2:
+            results = [_post(body) for body in bodies]
+        else:
+            with ThreadPoolExecutor(max_workers=min(concurrency, len(bodies))) as executor:
+                results = list(executor.map(_post, bodies))
+
+        return self._merge_create_results(results)
+
+    def _prepare_hits(self: Self, data: dict[str, Any] | list[dict[str, Any]]) -> list[dict[str, Any]]:
+        "Flatten the hits to create, computing their hash and serializing their raw data"
         if not isinstance(data, list):
             data = [data]
 
@@ -203,39 +290,72 @@ class Hit(object):
 
             final_hit_list.append(hit)
 
-        hashes = [hit["howler.hash"] for hit in final_hit_list]
-        existing_hashes: dict[str, int] = self._search.facet.hit(
-            "howler.hash",
-            query=f"howler.hash:({' OR '.join(hashes)})",
-            rows=len(hashes),
-        )
+        return final_hit_list
+
+    def _hash_lookups(self: Self, hits: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        "Build the arguments of the facet queries listing which hashes of the hits already exist"
+        hashes = list(dict.fromkeys(hit["howler.hash"] for hit in hits))
 
-        for hit in list(final_hit_list):
+        return [
+            {"query": f"howler.hash:({' OR '.join(chunk)})", "rows": len(chunk)}
+            for chunk in chunked_list(hashes, HASH_LOOKUP_CHUNK_SIZE)
+        ]
+
+    def _drop_existing(self: Self, hits: list[dict[str, Any]], existing_hashes: set[str]) -> list[dict[str, Any]]:
+        "Remove the hits whose hash already exists in the DB"
+        remaining = []
+        for hit in hits:
             if hit["howler.hash"] in existing_hashes:
-                logger.warning(
-                    "Hit with hash %s already exists in the DB, reusing",
-                    hit["howler.hash"],
-                )
-                final_hit_list.remove(hit)
+                logger.warning("Hit with hash %s already exists in the DB, reusing", hit["howler.hash"])
+            else:
+                remaining.append(hit)
 
-        if len(final_hit_list) < 1:
-            logger.info("No hits to submit.")
-            return None
+        return remaining
 
-        result = self._connection.post(
-            api_path("hit", ignore_extra_values=ignore_extra_values, refresh=refresh),
-            data=json.dumps(final_hit_list, cls=DatetimeEncoder),
-            headers={"Content-Type": "application/json"},
+    def _create_request(
+        self: Self,
+        ignore_extra_values: bool,
+        refresh: bool | Literal["true", "false", "wait_for"],
+        skip_existing: bool,
+        compress: bool,
+    ) -> tuple[str, dict[str, str]]:
+        "Build the path and headers of the hit creation requests"
+        path = api_path(
+            "hit",
+            ignore_extra_values=ignore_extra_values,
+            refresh=refresh,
+            skip_existing=skip_existing if skip_existing else None,
         )
 
-        if not result:
-            logger.warning("No result was returned.")
-            return result
+        headers = {"Content-Type": "application/json"}
+        if compress:
+            headers["Content-Encoding"] = "gzip"
+
+        return path, headers
+
+    def _merge_create_results(self: Self, results: list[CreateHitsResponse | None]) -> CreateHitsResponse | None:
+        "Combine the responses of every hit creation request, logging the hits the server skipped or rejected"
+        merged: CreateHitsResponse = {"valid": [], "invalid": [], "warnings": [], "skipped": []}
+        for result in results:
+            if not result:
+                continue
 
-        for invalid_hit in result["invalid"]:
+            merged["valid"].extend(result.get("valid", []))
+            merged["invalid"].extend(result.get("invalid", []))
+            merged["warnings"].extend(result.get("warnings", []))
+            merged["skipped"].extend(result.get("skipped", []))
+
+        for invalid_hit in merged["invalid"]:
             logger.error(invalid_hit["error"])
 
-        return result
+        if merged["skipped"]:
+            logger.warning("%s hit(s) already exist in the DB and were skipped.", len(merged["skipped"]))
+
+        if not merged["valid"] and not merged["invalid"]:
+            logger.info("No new hits were created.")
+            return None
+
+        return merged
 
     def overwrite(
         self: Self,
@@ -345,3 +465,113 @@ class Hit(object):
             hit_ids = [hit_ids]
 
         return self._connection.delete(api_path("hit", refresh=refresh), json=hit_ids)
+
+
+class AsyncHit(Hit):
+    """Operations pertaining to ingesting and interacting with Howler hits, for use with an asynchronous connection.
+
+    Every method returns an awaitable.
+    """
+
+    async def create(  # type: ignore[override]
+        self: Self,
+        data: dict[str, Any] | list[dict[str, Any]],
+        ignore_extra_values: bool = False,
+        refresh: bool | Literal["true", "false", "wait_for"] = False,
+        skip_existing: bool = False,
+        max_chunk_bytes: int = DEFAULT_MAX_CHUNK_BYTES,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        compress: bool = False,
+    ) -> CreateHitsResponse | None:
+        """Create one or many hits using the howler schema.
+
+        Large inputs are split into requests of at most ``max_chunk_bytes`` of JSON, sent concurrently. Each request
+        is validated and created on its own, so when one of them is rejected the others may still have been created.
+
+        Args:
+            data (dict[str, Any] | list[dict[str, Any]]): The hit or list of hits to create
+            ignore_extra_values (bool, optional): Whtether to ignore extra values, or throw an exception.
+                Defaults to False.
+            refresh (bool | Literal["true", "false", "wait_for"], optional): Whether to refresh the index.
+                Defaults to False.
+            skip_existing (bool, optional): Have the server skip hits whose hash already exists, instead of looking the
+                hashes up before sending the hits. Requires a server supporting it. Defaults to False.
+            max_chunk_bytes (int, optional): Maximum size of the JSON sent in a single request. Defaults to 5MiB.
+            concurrency (int, optional): Maximum number of requests sent at once. Defaults to 4.
+            compress (bool, optional): Whether to gzip the request bodies. Requires a server accepting them.
+                Defaults to False.
+
+        Returns:
+            CreateHitsResponse | None: Created and invalid hits with warnings, or ``None`` when no
+                new hits are submitted (e.g., input is empty or all submitted hits already exist).
+        """
+        final_hit_list = self._prepare_hits(data)
+        if final_hit_list and not skip_existing:
+            facets = await asyncio.gather(
+                *(self._search.facet.hit("howler.hash", **lookup) for lookup in self._hash_lookups(final_hit_list))
+            )
+
+            final_hit_list = self._drop_existing(final_hit_list, {value for facet in facets for value in facet})
+
+        if len(final_hit_list) < 1:
+            logger.info("No hits to submit.")
+            return None
+
+        path, headers = self._create_request(ignore_extra_values, refresh, skip_existing, compress)
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def _post(body: bytes) -> CreateHitsResponse | None:
+            async with semaphore:
+                return await self._connection.post(path, data=body, headers=headers)
+
+        results = await asyncio.gather(
+            *(_post(body) for body in _chunk_hits(final_hit_list, max_chunk_bytes, compress))
+        )
+
+        return self._merge_create_results(list(results))
+
+    async def create_from_map(  # type: ignore[override]
+        self: Self,
+        tool_name: str,
+        map: dict[str, list[str]],
+        documents: list[dict[str, Any]],
+        ignore_extra_values: bool = False,
+        refresh: bool | Literal["true", "false", "wait_for"] = False,
+    ) -> list[dict[str, str | list[str] | None]]:
+        """Create hits for a given tool using the raw documents and a map of the document fields to howler's fields.
+
+        Args:
+            tool_name (str): Name of the tool the hits will be created for
+            map (dict[str, list[str]]): Dictionary where the keys are the flattened path of the tool's raw document and
+                    the values are a list of flattened path for Howler's fields where the data will be copied into
+            documents (list[dict[str, Any]]): The data to ingest into howler, in the tool's raw document format
+            ignore_extra_values (bool, optional): Whether to allow extra fields, or raise an error. Defaults to False.
+            refresh (bool | Literal["true", "false", "wait_for"], optional): Whether to refresh the index.
+                Defaults to False.
+
+        Returns:
+            list[dict[str, str | list[str] | None]]: One entry per document, each with keys ``id``, ``error``,
+                and ``warn``.
+
+        .. deprecated::
+            Use the regular create() function instead, mapping the record before ingestion.
+        """
+        warnings.warn(
+            "create_from_map is deprecated and will be removed in a future version.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        data = {"map": map, "hits": documents}
+
+        try:
+            result = await self._connection.post(
+                api_path("tools", tool_name, "hits", ignore_extra_values=ignore_extra_values, refresh=refresh),
+                json=data,
+            )
+        except ClientError as e:
+            self._log_map_errors(e)
+            raise
+
+        self._log_map_warnings(result)
+
+        return result
@@ -6,7 +6,7 @@ from howler_client.module.search.fields import Fields
 from howler_client.module.search.grouped import Grouped
 from howler_client.module.search.histogram import Histogram
 from howler_client.module.search.stats import Stats
-from howler_client.module.search.stream import Stream
+from howler_client.module.search.stream import AsyncStream, Stream
 
 
 class Search(object):
@@ -77,3 +77,14 @@ class Search(object):
             timeout=timeout,
             track_total_hits=track_total_hits,
         )
+
+
+class AsyncSearch(Search):
+    """Module dedicated to searching collections, for use with an asynchronous connection.
+
+    Every method returns an awaitable, except ``stream`` methods which return async generators.
+    """
+
+    def __init__(self, connection):
+        super().__init__(connection)
+        self.stream = AsyncStream(connection, self._do_search)  # type: ignore[assignment]
@@ -1,42 +1,60 @@
+import queue
 import threading
-import time
 from typing import Any
 
 from howler_client.common.utils import INVALID_STREAM_SEARCH_PARAMS, SEARCHABLE, ClientError
 
+# Marks the end of the pages put on the queue by the fetching thread
+_DONE = object()
+
+
+class _FetchError(object):
+    "Wraps an exception raised by the fetching thread, so it is raised again in the consumer"
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
 
 class Stream(object):
     "Module for streaming search results"
 
-    def __init__(self, connection, do_search):
+    def __init__(self, connection, do_search, page_size=100, prefetch=2):
         self._connection = connection
         self._do_search = do_search
-        self._page_size = 100
-        self._max_yield_cache = 100
-
-    def _auto_fill(self, items, lock, index, query, **kwargs):
-        done = False
-        while not done:
-            skip = False
-            with lock:
-                if len(items) > self._max_yield_cache:
-                    skip = True
-
-            if skip:
-                time.sleep(0.01)
+        self._page_size = page_size
+        self._prefetch = prefetch
+
+    def _put(self, pages: queue.Queue, stop: threading.Event, item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
                 continue
 
-            j = self._do_search(index, query, **kwargs)
+        return False
 
-            # Replace cursorMark.
-            kwargs["deep_paging_id"] = j.get("next_deep_paging_id", "*")
+    def _auto_fill(self, pages, stop, page_size, index, query, **kwargs):
+        try:
+            while not stop.is_set():
+                j = self._do_search(index, query, **kwargs)
 
-            with lock:
-                items.extend(j["items"])
+                if j["items"] and not self._put(pages, stop, j["items"]):
+                    return
 
-            done = bool(self._page_size - len(j["items"]))
+                # Continue from the cursor returned with the page, until a partial page or no cursor is returned
+                next_deep_paging_id = j.get("next_deep_paging_id")
+                if len(j["items"]) < page_size or not next_deep_paging_id:
+                    break
 
-    def _do_stream(self, index, query, **kwargs):
+                kwargs["deep_paging_id"] = next_deep_paging_id
+        except Exception as e:
+            self._put(pages, stop, _FetchError(e))
+            return
+
+        self._put(pages, stop, _DONE)
+
+    def _do_stream(self, index, query, page_size=None, prefetch=None, **kwargs):
         if index not in SEARCHABLE:
             raise ClientError("Index %s is not searchable" % index, 400)
 
@@ -47,36 +65,92 @@ class Stream(object):
                     ", ".join(INVALID_STREAM_SEARCH_PARAMS),
                 )
 
-        kwargs.update({"rows": str(self._page_size), "deep_paging_id": "*"})
+        page_size = page_size or self._page_size
+        kwargs.update({"rows": str(page_size), "deep_paging_id": "*"})
 
-        yield_done = False
-        items: list[Any] = []
-        lock = threading.Lock()
-        sf_t = threading.Thread(target=self._auto_fill, args=[items, lock, index, query], kwargs=kwargs)
-        # setDaemon is deprecated; set the daemon attribute instead
-        sf_t.daemon = True
+        # At most prefetch pages are fetched ahead of the consumer
+        pages: queue.Queue = queue.Queue(maxsize=max(1, prefetch or self._prefetch))
+        stop = threading.Event()
+        sf_t = threading.Thread(
+            target=self._auto_fill, args=[pages, stop, page_size, index, query], kwargs=kwargs, daemon=True
+        )
         sf_t.start()
-        while not yield_done:
-            try:
-                with lock:
-                    item = items.pop(0)
 
-                yield item
-            except IndexError:
-                if not sf_t.is_alive() and len(items) == 0:
-                    yield_done = True
-                time.sleep(0.01)
+        try:
+            while True:
+                page = pages.get()
+                if page is _DONE:
+                    return
+
+                if isinstance(page, _FetchError):
+                    raise page.error
 
-    def hit(self, query, filters=None, fl=None):
+                yield from page
+        finally:
+            # Stops the fetching thread when the consumer stops iterating early
+            stop.set()
+
+    def hit(self, query, filters=None, fl=None, page_size=None, prefetch=None):
         """Get all hits from a lucene query.
 
         Required:
         query   : lucene query (string)
 
         Optional:
-        filters : Additional lucene queries used to filter the data (list of strings)
-        fl      : List of fields to return (comma separated string of fields)
+        filters   : Additional lucene queries used to filter the data (list of strings)
+        fl        : List of fields to return (comma separated string of fields)
+        page_size : Number of hits fetched per request (default: 100)
+        prefetch  : Number of pages fetched ahead of the consumer (default: 2)
 
         Returns a generator that transparently and efficiently pages through results.
         """
-        return self._do_stream("hit", query, filters=filters, fl=fl)
+        return self._do_stream("hit", query, page_size=page_size, prefetch=prefetch, filters=filters, fl=fl)
+
+
+class AsyncStream(object):
+    "Module for streaming search results from an asynchronous connection"
+
+    def __init__(self, connection, do_search, page_size=100):
+        self._connection = connection
+        self._do_search = do_search
+        self._page_size = page_size
+
+    async def _do_stream(self, index, query, page_size=None, **kwargs):
+        if index not in SEARCHABLE:
+            raise ClientError("Index %s is not searchable" % index, 400)
+
+        for arg in list(kwargs.keys()):
+            if arg in INVALID_STREAM_SEARCH_PARAMS:
+                raise ClientError(
+                    "The following parameters cannot be used with stream search: %s",
+                    ", ".join(INVALID_STREAM_SEARCH_PARAMS),
+                )
+
+        page_size = page_size or self._page_size
+        kwargs.update({"rows": str(page_size), "deep_paging_id": "*"})
+
+        while True:
+            j = await self._do_search(index, query, **kwargs)
+
+            for item in j["items"]:
+                yield item
+
+            if len(j["items"]) < page_size or not j.get("next_deep_paging_id"):
+                return
+
+            kwargs["deep_paging_id"] = j["next_deep_paging_id"]
+
+    def hit(self, query, filters=None, fl=None, page_size=None):
+        """Get all hits from a lucene query.
+
+        Required:
+        query   : lucene query (string)
+
+        Optional:
+        filters   : Additional lucene queries used to filter the data (list of strings)
+        fl        : List of fields to return (comma separated string of fields)
+        page_size : Number of hits fetched per request (default: 100)
+
+        Returns an async generator that pages through results.
+        """
+        return self._do_stream("hit", query, page_size=page_size, filters=filters, fl=fl)
@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING
 
 from howler_client.module.v2.case import Case
 from howler_client.module.v2.ingest import Ingest
-from howler_client.module.v2.search import SearchV2
+from howler_client.module.v2.search import AsyncSearchV2, SearchV2
 
 if sys.version_info >= (3, 11):
     from typing import Self
@@ -28,3 +28,12 @@ class V2(object):
         self.case = Case(connection)
         self.ingest = Ingest(connection)
         self.search = SearchV2(connection)
+
+
+class AsyncV2(V2):
+    """Access v2 API endpoints, for use with an asynchronous connection."""
+
+    def __init__(self: Self, connection: "Connection"):
+        super().__init__(connection)
+
+        self.search = AsyncSearchV2(connection)
@@ -108,6 +108,18 @@ class SearchV2(object):
         Returns:
             Number of matching documents.
         """
+        body = self._count_body(query, filters, timeout, use_archive)
+
+        return self._connection.post(api_path_v2("search", "count", index), json=body)["count"]
+
+    def _count_body(
+        self: Self,
+        query: str,
+        filters: Optional[list[str]],
+        timeout: Optional[int],
+        use_archive: bool,
+    ) -> dict[str, Any]:
+        "Build the body of a count request"
         body: dict[str, Any] = {"query": query}
 
         if filters:
@@ -117,7 +129,7 @@ class SearchV2(object):
         if use_archive:
             body["use_archive"] = True
 
-        return self._connection.post(api_path_v2("search", "count", index), json=body)["count"]
+        return body
 
     def facet(
         self: Self,
@@ -151,3 +163,34 @@ class SearchV2(object):
             body["filters"] = filters
 
         return self._connection.post(api_path_v2("search", "facet", indexes), json=body)
+
+
+class AsyncSearchV2(SearchV2):
+    """Search operations via the v2 API, for use with an asynchronous connection.
+
+    Every method returns an awaitable.
+    """
+
+    async def count(  # type: ignore[override]
+        self: Self,
+        index: str,
+        query: str,
+        filters: Optional[list[str]] = None,
+        timeout: Optional[int] = None,
+        use_archive: bool = False,
+    ) -> int:
+        """Count documents matching a query.
+
+        Args:
+            index: Single index name (e.g. ``"hit"``).
+            query: Lucene query string.
+            filters: Additional filter queries.
+            timeout: Maximum execution time in milliseconds.
+            use_archive: Include archived data.
+
+        Returns:
+            Number of matching documents.
+        """
+        body = self._count_body(query, filters, timeout, use_archive)
+
+        return (await self._connection.post(api_path_v2("search", "count", index), json=body))["count"]
@@ -0,0 +1,205 @@
+"""Unit tests for the asynchronous client and its connection."""
+
+import asyncio
+import gzip
+import json
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from howler_client import get_async_client  # noqa: E402
+from howler_client.common.utils import ClientError  # noqa: E402
+
+
+def _make_client(handler, retries=3):
+    client = get_async_client("http://howler.test", apikey=("admin", "devkey:admin"), retries=retries, http2=False)
+    headers = client._connection.session.headers
+    client._connection.session = httpx.AsyncClient(transport=httpx.MockTransport(handler), headers=headers)
+    return client
+
+
+def _api_response(data, status_code=200, **kwargs):
+    return httpx.Response(
+        status_code,
+        json={
+            "api_response": data,
+            "api_error_message": "" if status_code < 400 else "Bad request",
+            "api_server_version": "test",
+            "api_warning": [],
+        },
+        **kwargs,
+    )
+
+
+class TestAsyncConnection:
+    def test_returns_api_response(self):
+        def handler(request):
+            assert request.headers["Authorization"].startswith("Basic ")
+            return _api_response({"howler": {"id": "h1"}})
+
+        async def run():
+            async with _make_client(handler) as client:
+                return await client.hit("h1")
+
+        assert asyncio.run(run()) == {"howler": {"id": "h1"}}
+
+    def test_retries_rate_limited_requests(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) < 3:
+                return httpx.Response(429, headers={"Retry-After": "0"})
+            return _api_response(["v1"])
+
+        async def run():
+            async with _make_client(handler) as client:
+                return await client.user.whoami()
+
+        assert asyncio.run(run()) == ["v1"]
+        assert len(calls) == 3
+
+    def test_raises_client_error(self):
+        def handler(request):
+            return _api_response([{"error": "missing field"}], status_code=400)
+
+        async def run():
+            async with _make_client(handler) as client:
+                await client.v2.case("c1")
+
+        with pytest.raises(ClientError) as err:
+            asyncio.run(run())
+
+        assert err.value.status_code == 400
+        assert "missing field" in str(err.value)
+
+    def test_max_retries(self):
+        def handler(request):
+            return httpx.Response(503, headers={"Retry-After": "0"})
+
+        async def run():
+            async with _make_client(handler, retries=1) as client:
+                await client.hit("h1")
+
+        with pytest.raises(ClientError, match="Max retry reached"):
+            asyncio.run(run())
+
+
+class TestAsyncClient:
+    def test_delete_sends_body(self):
+        bodies = []
+
+        def handler(request):
+            assert request.method == "DELETE"
+            bodies.append(json.loads(request.content))
+            return _api_response({"success": True})
+
+        async def run():
+            async with _make_client(handler) as client:
+                return await client.v2.ingest.delete("hit", ["id-1"])
+
+        assert asyncio.run(run()) == {"success": True}
+        assert bodies == [["id-1"]]
+
+    def test_gather_bounds_concurrency(self):
+        running = 0
+        peak = 0
+
+        async def call(value):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return value
+
+        async def run():
+            async with _make_client(lambda request: _api_response(None)) as client:
+                return await client.gather(*(call(i) for i in range(10)), limit=3)
+
+        assert asyncio.run(run()) == list(range(10))
+        assert peak == 3
+
+    def test_create_hits(self):
+        def handler(request):
+            assert request.url.params["skip_existing"] == "True"
+            assert request.headers["Content-Encoding"] == "gzip"
+            hits = json.loads(gzip.decompress(request.content))
+            return _api_response({"valid": hits, "invalid": [], "warnings": [], "skipped": []})
+
+        async def run():
+            async with _make_client(handler) as client:
+                return await client.hit.create(
+                    {"howler": {"analytic": "A", "detection": "B", "score": 0}}, skip_existing=True, compress=True
+                )
+
+        result = asyncio.run(run())
+        assert len(result["valid"]) == 1
+        assert "howler.hash" in result["valid"][0]
+
+    def test_create_hits_looks_up_existing_hashes(self):
+        def handler(request):
+            if request.method == "GET":
+                assert request.url.path == "/api/v1/search/facet/hit/howler.hash"
+                return _api_response({"existing": 1})
+
+            assert "skip_existing" not in request.url.params
+            assert "Content-Encoding" not in request.headers
+            hits = json.loads(request.content)
+            return _api_response({"valid": hits, "invalid": [], "warnings": []})
+
+        async def run():
+            async with _make_client(handler) as client:
+                return await client.hit.create(
+                    [
+                        {"howler": {"analytic": "A", "score": 0, "hash": "existing"}},
+                        {"howler": {"analytic": "A", "score": 0, "hash": "new"}},
+                    ]
+                )
+
+        result = asyncio.run(run())
+        assert [hit["howler.hash"] for hit in result["valid"]] == ["new"]
+
+    def test_stream_pages_through_results(self):
+        pages = [
+            {"items": [{"id": i} for i in range(100)], "next_deep_paging_id": "next"},
+            {"items": [{"id": 100}]},
+        ]
+
+        def handler(request):
+            return _api_response(pages.pop(0))
+
+        async def run():
+            async with _make_client(handler) as client:
+                return [item async for item in client.search.stream.hit("howler.id:*")]
+
+        assert len(asyncio.run(run())) == 101
+
+    def test_v2_search_count(self):
+        def handler(request):
+            assert request.url.path == "/api/v2/search/count/hit"
+            assert json.loads(request.content) == {"query": "howler.id:*", "filters": ["howler.status:open"]}
+            return _api_response({"count": 42})
+
+        async def run():
+            async with _make_client(handler) as client:
+                return await client.v2.search.count("hit", "howler.id:*", filters=["howler.status:open"])
+
+        assert asyncio.run(run()) == 42
+
+    def test_create_from_map(self, caplog):
+        def handler(request):
+            assert request.url.path == "/api/v1/tools/tool/hits"
+            assert json.loads(request.content)["map"] == {"id": ["howler.id"]}
+            return _api_response([{"id": "h1", "error": None, "warn": ["extra field"]}])
+
+        async def run():
+            async with _make_client(handler) as client:
+                return await client.hit.create_from_map("tool", {"id": ["howler.id"]}, [{"id": "h1"}])
+
+        with pytest.warns(DeprecationWarning):
+            result = asyncio.run(run())
+
+        assert result == [{"id": "h1", "error": None, "warn": ["extra field"]}]
+        assert "extra field" in caplog.text
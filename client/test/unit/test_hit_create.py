@@ -0,0 +1,91 @@
+"""Unit tests for creating hits with the v1 hit client module."""
+
+import gzip
+import json
+from unittest.mock import MagicMock
+
+from howler_client.module.hit import Hit
+
+
+def _make_hit_module() -> tuple[Hit, MagicMock]:
+    conn = MagicMock()
+
+    def post(path, data, headers):
+        hits = json.loads(gzip.decompress(data) if headers.get("Content-Encoding") == "gzip" else data)
+        return {"valid": hits[1:], "invalid": [], "warnings": [], "skipped": [hits[0]["howler.hash"]]}
+
+    conn.post.side_effect = post
+    search = MagicMock()
+    search.facet.hit.return_value = {}
+    return Hit(conn, search), conn
+
+
+def _hits(count):
+    return [{"howler": {"analytic": "Test", "score": 0, "hash": f"hash-{i:04}"}} for i in range(count)]
+
+
+class TestHitCreate:
+    def test_existing_hashes_looked_up_by_default(self):
+        hit, conn = _make_hit_module()
+        hit._search.facet.hit.return_value = {"hash-0001": 1}
+
+        hit.create(_hits(3))
+
+        hit._search.facet.hit.assert_called_once_with(
+            "howler.hash", query="howler.hash:(hash-0000 OR hash-0001 OR hash-0002)", rows=3
+        )
+        conn.post.assert_called_once()
+        assert "skip_existing" not in conn.post.call_args[0][0]
+        assert "Content-Encoding" not in conn.post.call_args[1]["headers"]
+        assert [h["howler.hash"] for h in json.loads(conn.post.call_args[1]["data"])] == ["hash-0000", "hash-0002"]
+
+    def test_hash_lookups_chunked(self):
+        hit, conn = _make_hit_module()
+
+        hit.create(_hits(250))
+
+        assert [call.kwargs["rows"] for call in hit._search.facet.hit.call_args_list] == [100, 100, 50]
+
+    def test_all_hits_existing(self):
+        hit, conn = _make_hit_module()
+        hit._search.facet.hit.return_value = {"hash-0000": 1, "hash-0001": 1}
+
+        assert hit.create(_hits(2)) is None
+        conn.post.assert_not_called()
+
+    def test_single_compressed_request_skipping_existing(self):
+        hit, conn = _make_hit_module()
+
+        result = hit.create(_hits(3), skip_existing=True, compress=True)
+
+        conn.post.assert_called_once()
+        path = conn.post.call_args[0][0]
+        assert "skip_existing=True" in path
+        assert conn.post.call_args[1]["headers"]["Content-Encoding"] == "gzip"
+        assert result["skipped"] == ["hash-0000"]
+        assert [h["howler.hash"] for h in result["valid"]] == ["hash-0001", "hash-0002"]
+
+    def test_no_facet_round_trip_when_server_skips_existing(self):
+        hit, conn = _make_hit_module()
+
+        hit.create(_hits(3), skip_existing=True)
+
+        assert not hit._search.facet.hit.called
+
+    def test_large_inputs_split_into_bounded_chunks(self):
+        hit, conn = _make_hit_module()
+
+        hit.create(_hits(100), max_chunk_bytes=1024, concurrency=3)
+
+        bodies = [call[1]["data"] for call in conn.post.call_args_list]
+        assert len(bodies) > 1
+        assert all(len(body) <= 1024 for body in bodies)
+        assert sorted(h["howler.hash"] for body in bodies for h in json.loads(body)) == [
+            f"hash-{i:04}" for i in range(100)
+        ]
+
+    def test_empty_input(self):
+        hit, conn = _make_hit_module()
+
+        assert hit.create([]) is None
+        conn.post.assert_not_called()
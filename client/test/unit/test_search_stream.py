@@ -0,0 +1,81 @@
+"""Unit tests for the search stream module."""
+
+import threading
+
+import pytest
+
+from howler_client.common.utils import ClientError
+from howler_client.module.search.stream import Stream
+
+
+def _make_do_search(total, page_size):
+    calls = []
+
+    def do_search(index, query, **kwargs):
+        calls.append(dict(kwargs))
+        start = 0 if kwargs["deep_paging_id"] == "*" else int(kwargs["deep_paging_id"])
+        items = [{"id": i} for i in range(start, min(start + page_size, total))]
+        result = {"items": items}
+        if start + page_size < total:
+            result["next_deep_paging_id"] = str(start + page_size)
+        return result
+
+    return do_search, calls
+
+
+class TestStream:
+    def test_streams_every_page_in_order(self):
+        do_search, calls = _make_do_search(total=250, page_size=100)
+
+        result = list(Stream(None, do_search).hit("howler.id:*"))
+
+        assert [item["id"] for item in result] == list(range(250))
+        assert [call["deep_paging_id"] for call in calls] == ["*", "100", "200"]
+
+    def test_configurable_page_size(self):
+        do_search, calls = _make_do_search(total=25, page_size=10)
+
+        result = list(Stream(None, do_search).hit("howler.id:*", page_size=10, prefetch=1))
+
+        assert len(result) == 25
+        assert all(call["rows"] == "10" for call in calls)
+
+    def test_exact_multiple_of_page_size_stops_without_cursor(self):
+        do_search, calls = _make_do_search(total=200, page_size=100)
+
+        assert len(list(Stream(None, do_search).hit("howler.id:*"))) == 200
+        assert len(calls) == 2
+
+    def test_fetch_errors_are_raised_in_consumer(self):
+        def do_search(index, query, **kwargs):
+            if kwargs["deep_paging_id"] == "*":
+                return {"items": [{"id": i} for i in range(100)], "next_deep_paging_id": "next"}
+            raise ClientError("Search failed", 500)
+
+        stream = Stream(None, do_search).hit("howler.id:*")
+
+        with pytest.raises(ClientError, match="Search failed"):
+            for _ in stream:
+                pass
+
+    def test_prefetch_is_bounded(self):
+        fetched = threading.Semaphore(0)
+        do_search, calls = _make_do_search(total=10_000, page_size=10)
+
+        def counting_search(index, query, **kwargs):
+            fetched.release()
+            return do_search(index, query, **kwargs)
+
+        stream = Stream(None, counting_search).hit("howler.id:*", page_size=10, prefetch=2)
+        assert next(stream)["id"] == 0
+
+        # One page is being consumed, two are queued and one more is waiting to be queued
+        for _ in range(4):
+            assert fetched.acquire(timeout=5)
+        assert not fetched.acquire(timeout=0.2)
+
+        stream.close()
+
+    def test_invalid_params(self):
+        with pytest.raises(ClientError):
+            list(Stream(None, lambda *args, **kwargs: None)._do_stream("hit", "howler.id:*", rows=10))
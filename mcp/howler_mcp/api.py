@@ -94,7 +94,9 @@ class HowlerApiClient:
             if method in {"GET", "OPTIONS"} and body is not None:
                 outcome = "body_error"
                 raise ValueError("Request body is not allowed for GET or OPTIONS")
-            exchanged_token = await self.auth_provider.get_howler_token(user_access_token.token)
+            exchanged_token = await self.auth_provider.get_howler_token(
+                user_access_token.token, expires_at=user_access_token.expires_at
+            )
             headers = {"Authorization": f"Bearer {exchanged_token}"}
             url = f"{self.base_url}/{route.lstrip('/')}"
             response = await self._client.request(
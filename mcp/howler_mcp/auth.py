@@ -1,4 +1,6 @@
+import hashlib
 import logging
+import time
 from typing import Any
 
 import jwt
@@ -14,6 +16,9 @@ from jwt.exceptions import (
 )
 from mcp.server.auth.provider import AccessToken, TokenVerifier
 
+from .cache import TTLCache
+from .config import CACHE
+
 logger = logging.getLogger(__name__)
 
 
@@ -188,18 +193,57 @@ class AuthProvider:
     The MCP client token verified by ``KeycloakTokenVerifier`` is already
     fully qualified for the downstream Howler API, so no additional token
     exchange is required.
+
+    Exchanged tokens are cached per user, keyed by a hash of the upstream
+    token, until shortly before the upstream token expires.
     """
 
-    async def get_howler_token(self, user_token: str) -> str:
+    def __init__(
+        self,
+        expiry_margin: float = CACHE.TOKEN_EXPIRY_MARGIN,
+        default_ttl: float = CACHE.TOKEN_TTL,
+        max_entries: int = CACHE.MAX_ENTRIES,
+    ) -> None:
+        """Initialise the provider.
+
+        Args:
+            expiry_margin: Seconds before the upstream token expires at which
+                its exchanged token stops being reused.
+            default_ttl: Seconds an exchanged token is reused when the expiry
+                of the upstream token is unknown.
+            max_entries: Maximum number of exchanged tokens kept.
+        """
+        self.expiry_margin = expiry_margin
+        self._tokens: TTLCache[str] = TTLCache(default_ttl, max_entries=max_entries)
+
+    async def get_howler_token(self, user_token: str, expires_at: int | None = None) -> str:
         """Return the Howler-compatible bearer token for a given user token.
 
         Args:
             user_token: The raw JWT bearer token from the MCP client session.
+            expires_at: Expiry of the user token, as a UNIX timestamp, if known.
 
         Returns:
             str: Token to use as the ``Authorization`` header value when
             calling the Howler API.
         """
+        ttl = None if expires_at is None else expires_at - time.time() - self.expiry_margin
+
+        return await self._tokens.get_or_load(
+            hashlib.sha256(user_token.encode()).hexdigest(),
+            lambda: self._exchange_token(user_token),
+            ttl=ttl,
+        )
+
+    async def _exchange_token(self, user_token: str) -> str:
+        """Exchange a user token for a Howler-compatible bearer token.
+
+        Args:
+            user_token: The raw JWT bearer token from the MCP client session.
+
+        Returns:
+            str: The Howler-compatible bearer token.
+        """
         # Token Pass-through: The token verified by KeycloakTokenVerifier
         # is already fully qualified for the downstream backend API.
         return user_token
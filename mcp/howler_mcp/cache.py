@@ -0,0 +1,85 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class TTLCache(Generic[T]):
+    """In-memory cache of values produced by coroutines, each expiring after a time to live.
+
+    Concurrent lookups of a missing or expired key share a single load, so an
+    expiring entry does not send a burst of identical requests to the backend.
+    Failed loads are not cached.
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 1024) -> None:
+        """Initialise the cache.
+
+        Args:
+            ttl: Default number of seconds a loaded value is kept.
+            max_entries: Maximum number of values kept. Expired values, then
+                the oldest ones, are evicted once it is reached.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: dict[Hashable, tuple[float, T]] = {}
+        self._loading: dict[Hashable, asyncio.Future[T]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of values currently kept, including expired ones."""
+        return len(self._entries)
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[T]], ttl: float | None = None) -> T:
+        """Return the cached value for ``key``, loading it when missing or expired.
+
+        Args:
+            key: Cache key.
+            loader: Coroutine function producing the value.
+            ttl: Seconds to keep this value instead of the default. Values
+                with a time to live of zero or less are returned but not kept.
+
+        Returns:
+            T: The cached or freshly loaded value.
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        pending = self._loading.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._load(key, loader, self.ttl if ttl is None else ttl))
+            self._loading[key] = pending
+
+        # A caller giving up must not cancel the load shared with other callers
+        return await asyncio.shield(pending)
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """Drop one cached value, or every value when no key is given."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[T]], ttl: float) -> T:
+        try:
+            value = await loader()
+            if ttl > 0:
+                self._store(key, value, ttl)
+            return value
+        finally:
+            self._loading.pop(key, None)
+
+    def _store(self, key: Hashable, value: T, ttl: float) -> None:
+        now = time.monotonic()
+        self._entries.pop(key, None)
+
+        if len(self._entries) >= self.max_entries:
+            for expired_key in [k for k, (expires_at, _) in self._entries.items() if expires_at <= now]:
+                del self._entries[expired_key]
+
+        while len(self._entries) >= self.max_entries:
+            del self._entries[next(iter(self._entries))]
+
+        self._entries[key] = (now + ttl, value)
@@ -114,3 +114,16 @@ class MCPSettings:
     )
     SCOPE = os.environ.get("MCP_SCOPE", "openid offline_access")
     AUDIENCE = os.environ.get("MCP_AUDIENCE", "howler")
+
+
+class CACHE:
+    # Exchanged Howler tokens are dropped this many seconds before the upstream token expires
+    TOKEN_EXPIRY_MARGIN = float(os.environ.get("MCP_TOKEN_EXPIRY_MARGIN", "30"))
+    # Lifetime of exchanged tokens whose upstream token has no known expiry
+    TOKEN_TTL = float(os.environ.get("MCP_TOKEN_CACHE_TTL", "300"))
+    FIELDS_TTL = float(os.environ.get("MCP_FIELDS_CACHE_TTL", "600"))
+    FIELD_VALUES_TTL = float(os.environ.get("MCP_FIELD_VALUES_CACHE_TTL", "120"))
+    MAX_ENTRIES = int(os.environ.get("MCP_CACHE_MAX_ENTRIES", "1024"))
+    # Field values are only counted over hits created within this window (Elasticsearch date math, e.g. 30d).
+    # Leave empty to count over every hit.
+    FIELD_VALUES_WINDOW = os.environ.get("MCP_FIELD_VALUES_WINDOW", "30d")
@@ -1,3 +1,4 @@
+import hashlib
 import re
 from logging import getLogger
 from typing import Any
@@ -8,7 +9,8 @@ from mcp.server.auth.provider import AccessToken
 from pydantic import BaseModel, Field
 
 from howler_mcp.api import HowlerApiClient
-from howler_mcp.config import HOWLER_UI, ICONIFY
+from howler_mcp.cache import TTLCache
+from howler_mcp.config import CACHE, HOWLER_UI, ICONIFY
 
 # Safety limits to avoid oversized backend requests.
 MAXIMUM_TICKET: int = 200
@@ -60,7 +62,9 @@ def register_tools(mcp, api_client: HowlerApiClient):
         api_client: Shared API client used by tools to call the Howler backend.
     """
     # Cache searchable fields for this process to reduce mapping calls.
-    cached_hit_fields: set[str] | None = None
+    hit_fields_cache: TTLCache[dict[str, Any]] = TTLCache(CACHE.FIELDS_TTL, max_entries=1)
+    # Field values depend on what each user can see, so they are cached per user.
+    field_values_cache: TTLCache[dict[str, int]] = TTLCache(CACHE.FIELD_VALUES_TTL, max_entries=CACHE.MAX_ENTRIES)
 
     def _contains_escape_characters(value: str) -> bool:
         """Return True when value contains control chars or path separators."""
@@ -132,6 +136,10 @@ def register_tools(mcp, api_client: HowlerApiClient):
 
         return access_token
 
+    async def _hit_field_names() -> set[str]:
+        """Return the names of the searchable hit fields."""
+        return set((await get_hit_fields()).keys())
+
     async def _validate_query_fields(query: str) -> str:
         """Normalize and validate field names referenced in a Lucene query.
 
@@ -145,8 +153,6 @@ def register_tools(mcp, api_client: HowlerApiClient):
             ValueError: If the query is empty after normalization or contains
                 unsupported field names.
         """
-        nonlocal cached_hit_fields
-
         # Normalize first so empty/whitespace-only queries are rejected early.
         normalized = re.sub(r"[\r\n\t]+", " ", query).strip()
         if not normalized:
@@ -157,12 +163,11 @@ def register_tools(mcp, api_client: HowlerApiClient):
         regex = r"\b([a-zA-Z_]\w*(?:\.[a-zA-Z_]\w*)+)\s*:"
         referenced_fields: list[str] = re.findall(regex, normalized)
 
-        # Cache field metadata for the current process lifetime to avoid
-        # re-fetching index mapping for every query validation.
-        if cached_hit_fields is None:
-            cached_hit_fields = set((await get_hit_fields()).keys())
+        # Field metadata is cached to avoid re-fetching the index mapping for
+        # every query validation.
+        hit_fields = await _hit_field_names()
 
-        invalid_fields = sorted({field_name for field_name in referenced_fields if field_name not in cached_hit_fields})
+        invalid_fields = sorted({field_name for field_name in referenced_fields if field_name not in hit_fields})
 
         if invalid_fields:
             raise ValueError(
@@ -305,7 +310,8 @@ def register_tools(mcp, api_client: HowlerApiClient):
         Use this tool when you know a field name but are unsure which values it
         accepts. For example, call it with ``howler.escalation`` or
         ``howler.assessment`` before building a Lucene query that filters on
-        those fields.
+        those fields. Counts only cover recently created hits (the last 30
+        days by default) and may be up to a couple of minutes old.
 
         Args:
             field: Exact field name to inspect, such as ``howler.escalation``
@@ -319,35 +325,38 @@ def register_tools(mcp, api_client: HowlerApiClient):
         Raises:
             ValueError: If no access token is available.
         """
-        nonlocal cached_hit_fields
-
         access_token: AccessToken = _proper_access_token()
 
         normalized_field = field.strip()
         if not normalized_field:
             raise ValueError("field parameter is required")
 
-        if cached_hit_fields is None:
-            cached_hit_fields = set((await get_hit_fields()).keys())
-
-        if normalized_field not in cached_hit_fields:
+        if normalized_field not in await _hit_field_names():
             raise ValueError(
                 f"The field: {normalized_field} is not a valid option. Use get_hit_fields to see available fields."
             )
 
-        field_values = await api_client.call(
-            user_access_token=access_token,
-            # The facet endpoint lives under /search/facet/<index>/<field>.
-            # Passing the field directly in the path avoids a separate body.
-            path=f"/search/facet/hit/{normalized_field}",
-            method="GET",
-            # A broad query is required — the facet endpoint needs at least one
-            # matching document to return any distinct values. Using howler.id:*
-            # matches every hit so we always get the full value distribution.
-            params={"query": r"howler.id:*"},
+        # A broad query is required — the facet endpoint needs at least one
+        # matching document to return any distinct values. Counting is bounded
+        # to recent hits, rounded to the hour so Elasticsearch can reuse its
+        # cached filter between calls.
+        params: dict[str, Any] = {"query": r"howler.id:*"}
+        if CACHE.FIELD_VALUES_WINDOW:
+            params["filters"] = f"event.created:[now-{CACHE.FIELD_VALUES_WINDOW}/h TO *]"
+
+        field_values = await field_values_cache.get_or_load(
+            (hashlib.sha256(access_token.token.encode()).hexdigest(), normalized_field),
+            lambda: api_client.call(
+                user_access_token=access_token,
+                # The facet endpoint lives under /search/facet/<index>/<field>.
+                # Passing the field directly in the path avoids a separate body.
+                path=f"/search/facet/hit/{normalized_field}",
+                method="GET",
+                params=params,
+            ),
         )
 
-        return field_values
+        return dict(field_values)
 
     @mcp.tool(name="get_hit_fields")
     async def get_hit_fields() -> dict[str, Any]:
@@ -367,6 +376,10 @@ def register_tools(mcp, api_client: HowlerApiClient):
         """
         access_token: AccessToken = _proper_access_token()
 
+        return dict(await hit_fields_cache.get_or_load("hit", lambda: _load_hit_fields(access_token)))
+
+    async def _load_hit_fields(access_token: AccessToken) -> dict[str, Any]:
+        """Fetch the searchable hit fields, keeping the metadata required for query authoring."""
         all_values: dict[str, Any] = await api_client.call(
             user_access_token=access_token,
             # /search/fields/<index> returns the Elasticsearch field mapping
@@ -529,15 +542,9 @@ def register_tools(mcp, api_client: HowlerApiClient):
         Raises:
             ValueError: If the request cannot be authenticated.
         """
-        nonlocal cached_hit_fields
-
-        # Load and cache the searchable field names once for this process.
-        if cached_hit_fields is None:
-            cached_hit_fields = set((await get_hit_fields()).keys())
-
         label_set_options: list[str] = []
 
-        for field in cached_hit_fields:
+        for field in await _hit_field_names():
             # Only keep hit label fields such as howler.labels.generic.
             if not field.startswith("howler.labels."):
                 continue
@@ -1,10 +1,11 @@
+import time
 from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
 from jwt.exceptions import InvalidTokenError, PyJWKClientError
 
-from howler_mcp.auth import JSONWebTokenVerifier
+from howler_mcp.auth import AuthProvider, JSONWebTokenVerifier
 
 
 @pytest.fixture()
@@ -190,3 +191,26 @@ async def test_verify_token_returns_none_on_unexpected_error(verifier):
         token = await verifier.verify_token("raw-token")
 
     assert token is None
+
+
+@pytest.mark.asyncio
+async def test_auth_provider_caches_exchanged_tokens_per_user():
+    provider = AuthProvider(expiry_margin=30)
+
+    with patch.object(provider, "_exchange_token", side_effect=lambda token: f"howler-{token}") as exchange:
+        assert await provider.get_howler_token("alice-token", expires_at=int(time.time()) + 300) == "howler-alice-token"
+        assert await provider.get_howler_token("alice-token", expires_at=int(time.time()) + 300) == "howler-alice-token"
+        assert await provider.get_howler_token("bob-token") == "howler-bob-token"
+
+    assert [call.args[0] for call in exchange.call_args_list] == ["alice-token", "bob-token"]
+
+
+@pytest.mark.asyncio
+async def test_auth_provider_does_not_reuse_tokens_close_to_expiry():
+    provider = AuthProvider(expiry_margin=30)
+
+    with patch.object(provider, "_exchange_token", side_effect=lambda token: token) as exchange:
+        for _ in range(2):
+            await provider.get_howler_token("alice-token", expires_at=int(time.time()) + 10)
+
+    assert exchange.call_count == 2
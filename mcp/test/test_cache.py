@@ -0,0 +1,83 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from howler_mcp.cache import TTLCache
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_one_load():
+    cache: TTLCache[str] = TTLCache(ttl=60)
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "value"
+
+    results = await asyncio.gather(*(cache.get_or_load("key", loader) for _ in range(10)))
+
+    assert results == ["value"] * 10
+    assert calls == 1
+    assert await cache.get_or_load("key", loader) == "value"
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_values_expire():
+    cache: TTLCache[int] = TTLCache(ttl=60)
+    loader = AsyncMock(side_effect=[1, 2])
+
+    with patch("howler_mcp.cache.time.monotonic", return_value=1000.0):
+        assert await cache.get_or_load("key", loader) == 1
+
+    with patch("howler_mcp.cache.time.monotonic", return_value=1061.0):
+        assert await cache.get_or_load("key", loader) == 2
+
+
+@pytest.mark.asyncio
+async def test_per_value_ttl_overrides_default():
+    cache: TTLCache[int] = TTLCache(ttl=60)
+    loader = AsyncMock(side_effect=[1, 2, 3])
+
+    assert await cache.get_or_load("expired", loader, ttl=0) == 1
+    assert await cache.get_or_load("expired", loader, ttl=0) == 2
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_loads_are_not_cached():
+    cache: TTLCache[str] = TTLCache(ttl=60)
+    loader = AsyncMock(side_effect=[ValueError("backend down"), "value"])
+
+    with pytest.raises(ValueError, match="backend down"):
+        await cache.get_or_load("key", loader)
+
+    assert await cache.get_or_load("key", loader) == "value"
+
+
+@pytest.mark.asyncio
+async def test_oldest_values_are_evicted():
+    cache: TTLCache[str] = TTLCache(ttl=60, max_entries=2)
+
+    for key in ["a", "b", "c"]:
+        await cache.get_or_load(key, AsyncMock(return_value=key))
+
+    loader = AsyncMock(return_value="reloaded")
+    assert await cache.get_or_load("a", loader) == "reloaded"
+    assert await cache.get_or_load("c", loader) == "c"
+
+
+@pytest.mark.asyncio
+async def test_invalidate():
+    cache: TTLCache[str] = TTLCache(ttl=60)
+    await cache.get_or_load("a", AsyncMock(return_value="a"))
+    await cache.get_or_load("b", AsyncMock(return_value="b"))
+
+    cache.invalidate("a")
+    assert len(cache) == 1
+
+    cache.invalidate()
+    assert len(cache) == 0
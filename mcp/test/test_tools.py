@@ -372,7 +372,7 @@ async def test_get_field_values_calls_facet_endpoint(tools_and_api):
     facet_call = mock_api.call.call_args_list[-1].kwargs
     assert facet_call["path"] == "/search/facet/hit/howler.escalation"
     assert facet_call["method"] == "GET"
-    assert facet_call["params"] == {"query": "howler.id:*"}
+    assert facet_call["params"] == {"query": "howler.id:*", "filters": "event.created:[now-30d/h TO *]"}
 
 
 @pytest.mark.asyncio
@@ -1222,3 +1222,28 @@ async def test_update_dossier_rejects_empty_query(tools_and_api):
         await tools["update_dossier"](dossier_id="d-1", data_to_update={"query": "\n\t"})
 
     mock_api.call.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_field_metadata_and_values_are_cached(tools_and_api):
+    tools, mock_api = tools_and_api
+    mock_api.call.side_effect = [
+        {"howler.escalation": {"type": "keyword", "description": "Escalation value", "list": False}},
+        {"alert": 120},
+        {"alert": 7},
+    ]
+
+    with patch(GET_ACCESS_TOKEN_PATH, return_value=FAKE_TOKEN):
+        assert await tools["get_field_values"](field="howler.escalation") == {"alert": 120}
+        assert await tools["get_field_values"](field="howler.escalation") == {"alert": 120}
+        assert "howler.escalation" in await tools["get_hit_fields"]()
+
+    other_user = AccessToken(token="other-bearer", client_id="test-client", scopes=[])
+    with patch(GET_ACCESS_TOKEN_PATH, return_value=other_user):
+        assert await tools["get_field_values"](field="howler.escalation") == {"alert": 7}
+
+    assert [call.kwargs["path"] for call in mock_api.call.call_args_list] == [
+        "/search/fields/hit",
+        "/search/facet/hit/howler.escalation",
+        "/search/facet/hit/howler.escalation",
+    ]